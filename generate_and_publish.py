@@ -1,22 +1,48 @@
 from __future__ import annotations
 
 import argparse
+import array
+import asyncio
+import contextvars
+import functools
+import hashlib
+import heapq
 import importlib.util
+import inspect
+import io
+import itertools
 import json
+import math
+import mmap
 import os
+import random
 import re
+import shutil
+import struct
+import threading
 import time
-from dataclasses import dataclass
+import uuid
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import asynccontextmanager, closing, contextmanager, nullcontext
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator
 import http.client
-from urllib import error, request
+from urllib.parse import urlsplit
 
 HAS_PYPDF2 = importlib.util.find_spec("PyPDF2") is not None
 
 if HAS_PYPDF2:
-    from PyPDF2 import PdfReader
+    from PyPDF2 import PdfReader, __version__ as PYPDF2_VERSION
+
+HAS_SCIPY = importlib.util.find_spec("numpy") is not None and importlib.util.find_spec("scipy") is not None
+
+if HAS_SCIPY:
+    import numpy as np
+    from scipy import sparse
 
 
 # ============================================================
@@ -46,6 +72,119 @@ parser.add_argument(
     action="store_true",
     help="Allow drafting even if the legal memo contains low-confidence issues. Not recommended for production.",
 )
+parser.add_argument(
+    "--cache-mode",
+    choices=["off", "read", "write", "refresh"],
+    default="off",
+    help=(
+        "Local cache of Responses API outputs under .cache/responses. 'read' serves cached outputs without "
+        "storing new ones, 'write' serves cached outputs and stores misses, 'refresh' ignores cached outputs "
+        "and overwrites them, 'off' disables the cache."
+    ),
+)
+parser.add_argument(
+    "--stream-draft",
+    action="store_true",
+    help=(
+        "Stream the draft stage as server-sent events instead of polling a background response. Completed "
+        "blocks are checked as they arrive and a draft without a CTA section is cancelled early."
+    ),
+)
+parser.add_argument(
+    "--prebatch-classifier",
+    type=int,
+    nargs="?",
+    const=int(os.environ.get("BLOG_CLASSIFIER_PREBATCH_TOPICS", "12")),
+    default=None,
+    metavar="N",
+    help=(
+        "Classify the next N unused topics (default 12, or BLOG_CLASSIFIER_PREBATCH_TOPICS) through the OpenAI "
+        "Batch API instead of generating a draft. The first call submits a batch; later calls poll it once and "
+        "store finished results in .cache/classifier, which scheduled runs use instead of a live classifier call."
+    ),
+)
+parser.add_argument(
+    "--batch",
+    type=int,
+    default=None,
+    help="Generate drafts for the next N unused topics in one process, loading knowledge once.",
+)
+parser.add_argument(
+    "--topics",
+    default=None,
+    help="Generate drafts for these comma-separated topics.json indexes in one process (e.g. 4,9,12).",
+)
+parser.add_argument(
+    "--batch-concurrency",
+    type=int,
+    default=int(os.environ.get("BLOG_BATCH_CONCURRENCY", "2")),
+    help="Topics run through the pipeline at once in --batch/--topics mode.",
+)
+parser.add_argument(
+    "--prefetch",
+    type=int,
+    default=None,
+    metavar="K",
+    help=(
+        "Instead of generating a draft, run the classifier, retrieval, legal memo and reader journey for the next K "
+        "unused topics and keep them under .cache/prefetch, so later runs only draft, repair and email."
+    ),
+)
+parser.add_argument(
+    "--draft-candidates",
+    type=int,
+    default=int(os.environ.get("BLOG_DRAFT_CANDIDATES", "1")),
+    help=(
+        "Request this many draft candidates concurrently, one per article structure variant, and keep the first "
+        "that passes every validator; the rest are cancelled. Repair runs only if no candidate passes. Takes "
+        "precedence over --stream-draft."
+    ),
+)
+parser.add_argument(
+    "--repair-mode",
+    choices=["targeted", "full"],
+    default=os.environ.get("BLOG_REPAIR_MODE", "targeted"),
+    help=(
+        "'targeted' sends only the blocks that validation flagged, with their neighbours, and applies the "
+        "block-level patch operations returned; errors that cannot be tied to blocks fall back to a full repair. "
+        "'full' always resends the whole draft with the classifier and legal memo."
+    ),
+)
+parser.add_argument(
+    "--retrieval-backend",
+    choices=["bm25", "tfidf"],
+    default=os.environ.get("BLOG_RETRIEVAL_BACKEND", "bm25"),
+    help=(
+        "How knowledge sections are ranked. 'bm25' scores an inverted index in Python; 'tfidf' keeps a sparse "
+        "TF-IDF matrix and scores batches of queries with one sparse matrix product (requires numpy and scipy)."
+    ),
+)
+parser.add_argument(
+    "--build-knowledge-index",
+    action="store_true",
+    help=(
+        "Instead of generating a draft, compile every file under knowledge/ into one corpus file "
+        "(.cache/knowledge/corpus.bin) that generation runs memory-map, reading chunk text only when it is used."
+    ),
+)
+parser.add_argument(
+    "--trace",
+    action="store_true",
+    default=os.environ.get("BLOG_TRACE", "").strip().lower() in {"1", "true", "yes", "on"},
+    help=(
+        "Record pipeline step spans and write them as a Chrome trace-event file (RUN_BASE_trace.json) next to the "
+        "run artifacts, for chrome://tracing or ui.perfetto.dev. Also enabled by BLOG_TRACE=1."
+    ),
+)
+parser.add_argument(
+    "--resume",
+    default=None,
+    metavar="RUN_BASE",
+    help=(
+        "Resume a failed run from its stage checkpoints under .cache/checkpoints/RUN_BASE. Completed stages are "
+        "reloaded and the pipeline continues from the first missing one."
+    ),
+)
 args = parser.parse_args()
 
 
@@ -66,6 +205,8 @@ SENDGRID_API_KEY = os.environ.get("SENDGRID_API_KEY")
 EMAIL_FROM = os.environ.get("EMAIL_FROM", "info@richmondchambers.com")
 EMAIL_TO = os.environ.get("EMAIL_TO", "paul.richmond@richmondchambers.com")
 REPLY_TO = os.environ.get("EMAIL_REPLY_TO", EMAIL_TO)
+OPENAI_BASE_URL = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
+SENDGRID_BASE_URL = os.environ.get("SENDGRID_BASE_URL", "https://api.sendgrid.com/v3").rstrip("/")
 
 CTA_HEADING = "Contact Our Immigration Lawyers In Switzerland"
 CTA_NAME = "Richmond Chambers Switzerland"
@@ -87,8 +228,17 @@ KNOWLEDGE_DIR = SCRIPT_DIR / "knowledge"
 LEGAL_AUTHORITIES_DIR = KNOWLEDGE_DIR / "legal_authorities"
 INTERNAL_NOTES_DIR = KNOWLEDGE_DIR / "internal_legal_notes"
 WEBSITE_EDITORIAL_DIR = KNOWLEDGE_DIR / "website_editorial"
-OUTPUT_DIR = SCRIPT_DIR / "generated_blog_runs"
+OUTPUT_DIR = Path(os.environ.get("BLOG_OUTPUT_DIR") or SCRIPT_DIR / "generated_blog_runs")
 AUTHORITY_MAP_PATH = SCRIPT_DIR / "authority_pack_map.json"
+CACHE_DIR = Path(os.environ.get("BLOG_CACHE_DIR") or SCRIPT_DIR / ".cache")
+POLL_LATENCY_PATH = CACHE_DIR / "poll_latency.json"
+RESPONSES_CACHE_DIR = CACHE_DIR / "responses"
+CLASSIFIER_CACHE_DIR = CACHE_DIR / "classifier"
+CLASSIFIER_BATCH_STATE_PATH = CACHE_DIR / "classifier_batch.json"
+CHECKPOINT_DIR = CACHE_DIR / "checkpoints"
+PREFETCH_DIR = CACHE_DIR / "prefetch"
+KNOWLEDGE_CACHE_DIR = CACHE_DIR / "knowledge"
+KNOWLEDGE_CORPUS_PATH = KNOWLEDGE_CACHE_DIR / "corpus.bin"
 
 SUPPORTED_KNOWLEDGE_EXTENSIONS = {".md", ".txt", ".json", ".pdf"}
 
@@ -626,6 +776,55 @@ Repair scope:
 - Return strict JSON only using DRAFT_SCHEMA.
 """.strip()
 
+TARGETED_REPAIR_INSTRUCTIONS = f"""
+You are repairing selected blocks of an existing Swiss immigration blog draft that failed validation.
+
+Repair-only scope:
+- You receive the article outline, the blocks to repair (needs_repair: true) and their neighbouring blocks for context. Blocks are separated by blank lines in the article and are numbered from 0.
+- Return patch operations against the original block indexes:
+  - "replace": replace block `index` with the blocks in `blocks` (one or more).
+  - "insert_after": insert the blocks in `blocks` after block `index` (-1 inserts at the start).
+  - "delete": delete block `index` (`blocks` must be empty).
+- Change only what the validation errors require. Do not touch blocks that are not marked needs_repair unless a fix cannot be made otherwise.
+- Preserve the legal substance of the text you edit. Do not add new legal propositions, facts, authority, procedures, nationality lists, canton-specific practice, fees or document requirements.
+- Headings are whole blocks in **bold**. Keep the CTA heading exactly: {CTA_HEADING}
+- Keep the CTA as the final substantive section before the italicised disclaimer.
+- Set blog_title only when a validation error concerns the title; otherwise return null. A revised title must be client-facing, preserve the article's legal scope, and stay under 90 characters.
+- Use UK English.
+- Return strict JSON only.
+""".strip()
+
+TITLE_INSTRUCTIONS = """
+You are rewriting only the title of a Swiss immigration law article whose title failed validation.
+
+Requirements:
+- Propose distinct candidate titles for the same article; do not change its legal scope.
+- Each title must be client-facing with a practical angle: a question, decision point, risk, consequence, contrast or client problem.
+- Avoid flat, label-like titles (requirements, rules, overview, guide, process) and colon subtitles that only append a generic label.
+- Do not end with a flat "by [factor]" construction.
+- Keep each title under 75 characters where possible and never over 90.
+- Do not make titles clickbait, melodramatic, legally overbroad or narrower than the article.
+- Use UK English.
+- Return strict JSON only.
+""".strip()
+
+LEGAL_MEMO_REPAIR_INSTRUCTIONS = """
+You are correcting individual issues of an internal legal analysis note for a Swiss immigration law article.
+
+Only the issues that failed validation are provided, each with its index and the validation errors it triggered.
+
+Rules:
+- Return one entry per provided issue, keeping its index.
+- Fix the validation errors without changing the legal scope of the issue.
+- Every issue needs at least one support item quoting or closely paraphrasing the provided legal sources, with source_type and source_name taken from those sources.
+- Raise confidence only where the provided sources support the proposition; otherwise narrow the issue to what they do support and move the remainder into cautious_public_formulation.
+- If the sources cannot support the issue at all, return null for it; the memo is then regenerated in full.
+- `authority_type` must never be `unclear`; choose the closest supported category.
+- Follow the source hierarchy: legal_authority, then internal_legal_note; website_editorial is never legal authority.
+
+Return strict JSON only.
+""".strip()
+
 SEO_INSTRUCTIONS = """
 You are generating SEO metadata for a Swiss immigration law article.
 Return strict JSON only.
@@ -779,6 +978,88 @@ READER_JOURNEY_SCHEMA = {
     },
 }
 
+LEGAL_MEMO_ISSUE_SCHEMA = {
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "issue": {"type": "string"},
+        "rule": {"type": "string"},
+        "legal_basis": {"type": "string"},
+        "authority_type": {
+            "type": "string",
+            "enum": [
+                "statute",
+                "ordinance",
+                "official_guidance",
+                "case_law",
+                "cantonal_practice",
+                "internal_note",
+                "editorial_context",
+                "mixed",
+            ],
+        },
+        "entitlement_or_discretion": {
+            "type": "string",
+            "enum": [
+                "entitlement",
+                "eligibility_only",
+                "facilitated_access",
+                "discretionary",
+                "unclear",
+            ],
+        },
+        "reader_category": {"type": "string"},
+        "exceptions": {"type": "array", "items": {"type": "string"}},
+        "procedure_points": {"type": "array", "items": {"type": "string"}},
+        "cantonal_practice_points": {"type": "array", "items": {"type": "string"}},
+        "reader_distinctions": {"type": "array", "items": {"type": "string"}},
+        "evidence_needed": {"type": "array", "items": {"type": "string"}},
+        "common_mistakes": {"type": "array", "items": {"type": "string"}},
+        "client_decision_points": {"type": "array", "items": {"type": "string"}},
+        "practical_implications": {"type": "array", "items": {"type": "string"}},
+        "source_reference_to_use_in_article": {"type": "string"},
+        "safe_public_formulation": {"type": "string"},
+        "cautious_public_formulation": {"type": "string"},
+        "translation_or_source_caution": {"type": "string"},
+        "support": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {
+                    "source_type": {"type": "string"},
+                    "source_name": {"type": "string"},
+                    "excerpt": {"type": "string"},
+                },
+                "required": ["source_type", "source_name", "excerpt"],
+            },
+        },
+        "confidence": {"type": "string", "enum": ["low", "medium", "high"]},
+    },
+    "required": [
+        "issue",
+        "rule",
+        "legal_basis",
+        "authority_type",
+        "entitlement_or_discretion",
+        "reader_category",
+        "exceptions",
+        "procedure_points",
+        "cantonal_practice_points",
+        "reader_distinctions",
+        "evidence_needed",
+        "common_mistakes",
+        "client_decision_points",
+        "practical_implications",
+        "source_reference_to_use_in_article",
+        "safe_public_formulation",
+        "cautious_public_formulation",
+        "translation_or_source_caution",
+        "support",
+        "confidence",
+    ],
+}
+
 LEGAL_MEMO_SCHEMA = {
     "name": "legal_memo",
     "schema": {
@@ -786,93 +1067,36 @@ LEGAL_MEMO_SCHEMA = {
         "additionalProperties": False,
         "properties": {
             "article_positioning": {"type": "string"},
+            "issues": {
+                "type": "array",
+                "items": LEGAL_MEMO_ISSUE_SCHEMA,
+            },
+            "open_questions": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["article_positioning", "issues", "open_questions"],
+    },
+}
+
+LEGAL_MEMO_REPAIR_SCHEMA = {
+    "name": "legal_memo_repair",
+    "schema": {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
             "issues": {
                 "type": "array",
                 "items": {
                     "type": "object",
                     "additionalProperties": False,
                     "properties": {
-                        "issue": {"type": "string"},
-                        "rule": {"type": "string"},
-                        "legal_basis": {"type": "string"},
-                        "authority_type": {
-                            "type": "string",
-                            "enum": [
-                                "statute",
-                                "ordinance",
-                                "official_guidance",
-                                "case_law",
-                                "cantonal_practice",
-                                "internal_note",
-                                "editorial_context",
-                                "mixed",
-                            ],
-                        },
-                        "entitlement_or_discretion": {
-                            "type": "string",
-                            "enum": [
-                                "entitlement",
-                                "eligibility_only",
-                                "facilitated_access",
-                                "discretionary",
-                                "unclear",
-                            ],
-                        },
-                        "reader_category": {"type": "string"},
-                        "exceptions": {"type": "array", "items": {"type": "string"}},
-                        "procedure_points": {"type": "array", "items": {"type": "string"}},
-                        "cantonal_practice_points": {"type": "array", "items": {"type": "string"}},
-                        "reader_distinctions": {"type": "array", "items": {"type": "string"}},
-                        "evidence_needed": {"type": "array", "items": {"type": "string"}},
-                        "common_mistakes": {"type": "array", "items": {"type": "string"}},
-                        "client_decision_points": {"type": "array", "items": {"type": "string"}},
-                        "practical_implications": {"type": "array", "items": {"type": "string"}},
-                        "source_reference_to_use_in_article": {"type": "string"},
-                        "safe_public_formulation": {"type": "string"},
-                        "cautious_public_formulation": {"type": "string"},
-                        "translation_or_source_caution": {"type": "string"},
-                        "support": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "additionalProperties": False,
-                                "properties": {
-                                    "source_type": {"type": "string"},
-                                    "source_name": {"type": "string"},
-                                    "excerpt": {"type": "string"},
-                                },
-                                "required": ["source_type", "source_name", "excerpt"],
-                            },
-                        },
-                        "confidence": {"type": "string", "enum": ["low", "medium", "high"]},
+                        "index": {"type": "integer"},
+                        "issue": {"anyOf": [LEGAL_MEMO_ISSUE_SCHEMA, {"type": "null"}]},
                     },
-                    "required": [
-                        "issue",
-                        "rule",
-                        "legal_basis",
-                        "authority_type",
-                        "entitlement_or_discretion",
-                        "reader_category",
-                        "exceptions",
-                        "procedure_points",
-                        "cantonal_practice_points",
-                        "reader_distinctions",
-                        "evidence_needed",
-                        "common_mistakes",
-                        "client_decision_points",
-                        "practical_implications",
-                        "source_reference_to_use_in_article",
-                        "safe_public_formulation",
-                        "cautious_public_formulation",
-                        "translation_or_source_caution",
-                        "support",
-                        "confidence",
-                    ],
+                    "required": ["index", "issue"],
                 },
             },
-            "open_questions": {"type": "array", "items": {"type": "string"}},
         },
-        "required": ["article_positioning", "issues", "open_questions"],
+        "required": ["issues"],
     },
 }
 
@@ -889,6 +1113,50 @@ DRAFT_SCHEMA = {
     },
 }
 
+DRAFT_PATCH_SCHEMA = {
+    "name": "blog_draft_patch",
+    "schema": {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "blog_title": {"type": ["string", "null"]},
+            "operations": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "additionalProperties": False,
+                    "properties": {
+                        "op": {"type": "string", "enum": ["replace", "insert_after", "delete"]},
+                        "index": {"type": "integer"},
+                        "blocks": {"type": "array", "items": {"type": "string"}},
+                    },
+                    "required": ["op", "index", "blocks"],
+                },
+            },
+        },
+        "required": ["blog_title", "operations"],
+    },
+}
+
+TITLE_CANDIDATE_COUNT = 5
+
+TITLE_CANDIDATES_SCHEMA = {
+    "name": "blog_title_candidates",
+    "schema": {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "titles": {
+                "type": "array",
+                "items": {"type": "string"},
+                "minItems": TITLE_CANDIDATE_COUNT,
+                "maxItems": TITLE_CANDIDATE_COUNT,
+            },
+        },
+        "required": ["titles"],
+    },
+}
+
 SEO_SCHEMA = {
     "name": "blog_seo",
     "schema": {
@@ -923,181 +1191,1732 @@ SEO_SCHEMA = {
 
 @dataclass
 class KnowledgeChunk:
+    """One section of a knowledge file; source_name is the file, section its heading path or page range."""
+
     source_name: str
     source_kind: str
     text: str
+    section: str = ""
+    section_index: int = 0
+
+    def size(self) -> int:
+        return len(self.text)
 
 
 # ============================================================
-# HTTP and OpenAI helpers
+# HTTP transport
 # ============================================================
 
-def post_json(url: str, payload: dict, headers: dict[str, str]) -> tuple[int, dict[str, Any]]:
-    data = json.dumps(payload).encode("utf-8")
-    max_attempts = int(os.getenv("OPENAI_HTTP_MAX_ATTEMPTS", "3"))
-    timeout_seconds = float(os.getenv("OPENAI_HTTP_TIMEOUT_SECONDS", "600"))
+RETRYABLE_HTTP_STATUSES = {408, 409, 425, 429, 500, 502, 503, 504}
+
+# Errors raised when a kept-alive connection was closed by the server while
+# idle.  A request that fails this way on a reused connection is resent once
+# on a fresh connection before it counts as a network failure, but only if it
+# was never fully written or its method is idempotent: a POST the server may
+# have received is left to the retry policy and its Idempotency-Key.
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+IDEMPOTENT_HTTP_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
 
-    for attempt in range(1, max_attempts + 1):
-        req = request.Request(url, data=data, headers=headers, method="POST")
-        try:
-            with request.urlopen(req, timeout=timeout_seconds) as response:
-                raw = response.read()
-                body = raw.decode("utf-8", errors="replace").strip()
-                if not body:
-                    return response.status, {}
-                return response.status, json.loads(body)
-        except error.HTTPError as exc:
-            body = exc.read().decode("utf-8", errors="replace")
-            if exc.code in {408, 409, 425, 429, 500, 502, 503, 504} and attempt < max_attempts:
-                time.sleep(min(2 ** (attempt - 1), 30))
-                continue
-            raise RuntimeError(f"HTTP {exc.code} from {url}: {body}") from exc
-        except (error.URLError, TimeoutError, http.client.RemoteDisconnected) as exc:
-            if attempt < max_attempts:
-                time.sleep(min(2 ** (attempt - 1), 30))
-                continue
-            reason = getattr(exc, "reason", str(exc))
-            raise RuntimeError(f"Network error calling {url}: {reason}") from exc
 
-    raise RuntimeError(f"Failed to call {url} after {max_attempts} attempts")
+@dataclass
+class HttpResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
 
 
-def get_json(url: str, headers: dict[str, str]) -> tuple[int, dict[str, Any]]:
-    max_attempts = int(os.getenv("OPENAI_HTTP_MAX_ATTEMPTS", "3"))
-    timeout_seconds = float(os.getenv("OPENAI_HTTP_TIMEOUT_SECONDS", "600"))
+@dataclass
+class HttpTransportStats:
+    requests: int = 0
+    connections_opened: int = 0
+    reused_requests: int = 0
+    reconnects: int = 0
+
+
+class HttpConnectionPool:
+    """Persistent HTTP(S) connections per host, shared by every stage and background poll."""
+
+    def __init__(self, max_idle_per_host: int = 8) -> None:
+        self.max_idle_per_host = max_idle_per_host
+        self.stats = HttpTransportStats()
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _open(self, key: tuple[str, str, int], timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        with self._lock:
+            self.stats.connections_opened += 1
+        return connection_class(host, port, timeout=timeout)
+
+    def _acquire(self, key: tuple[str, str, int], timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            connection = idle.pop() if idle else None
+        if connection is None:
+            return self._open(key, timeout), False
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection, True
+
+    def _release(self, key: tuple[str, str, int], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _exchange(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[tuple[str, str, int], http.client.HTTPConnection, http.client.HTTPResponse]:
+        parsed = urlsplit(url)
+        scheme = parsed.scheme.lower()
+        if scheme not in {"http", "https"} or not parsed.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+        key = (scheme, parsed.hostname, parsed.port or (443 if scheme == "https" else 80))
+        target = parsed.path or "/"
+        if parsed.query:
+            target = f"{target}?{parsed.query}"
+
+        connection, reused = self._acquire(key, timeout)
+        while True:
+            written = False
+            try:
+                connection.request(method, target, body=body, headers=headers)
+                written = True
+                response = connection.getresponse()
+            except STALE_CONNECTION_ERRORS:
+                connection.close()
+                if not reused or (written and method not in IDEMPOTENT_HTTP_METHODS):
+                    raise
+                with self._lock:
+                    self.stats.reconnects += 1
+                connection, reused = self._open(key, timeout), False
+                continue
+            except BaseException:
+                connection.close()
+                raise
+            break
 
-    for attempt in range(1, max_attempts + 1):
-        req = request.Request(url, headers=headers, method="GET")
+        with self._lock:
+            self.stats.requests += 1
+            if reused:
+                self.stats.reused_requests += 1
+        return key, connection, response
+
+    def _finish(
+        self,
+        key: tuple[str, str, int],
+        connection: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+    ) -> None:
+        if response.will_close or not response.isclosed():
+            connection.close()
+        else:
+            self._release(key, connection)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> HttpResponse:
+        key, connection, response = self._exchange(method, url, body=body, headers=headers, timeout=timeout)
         try:
-            with request.urlopen(req, timeout=timeout_seconds) as response:
-                raw = response.read()
-                body = raw.decode("utf-8", errors="replace").strip()
-                if not body:
-                    return response.status, {}
-                return response.status, json.loads(body)
-        except error.HTTPError as exc:
-            body = exc.read().decode("utf-8", errors="replace")
-            if exc.code in {408, 409, 425, 429, 500, 502, 503, 504} and attempt < max_attempts:
-                time.sleep(min(2 ** (attempt - 1), 30))
-                continue
-            raise RuntimeError(f"HTTP {exc.code} from {url}: {body}") from exc
-        except (error.URLError, TimeoutError, http.client.RemoteDisconnected) as exc:
-            if attempt < max_attempts:
-                time.sleep(min(2 ** (attempt - 1), 30))
-                continue
-            reason = getattr(exc, "reason", str(exc))
-            raise RuntimeError(f"Network error calling {url}: {reason}") from exc
+            raw = response.read()
+        except BaseException:
+            connection.close()
+            raise
+        self._finish(key, connection, response)
+
+        return HttpResponse(
+            status=response.status,
+            headers={name.lower(): value for name, value in response.getheaders()},
+            body=raw,
+        )
 
-    raise RuntimeError(f"Failed to call {url} after {max_attempts} attempts")
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> Iterator[http.client.HTTPResponse]:
+        """
+        Yield the unread response for incremental consumption.
+
+        The connection goes back to the pool only if the body was read to the
+        end; leaving the block early (for example to cancel a stream) closes it.
+        """
+        key, connection, response = self._exchange(method, url, body=body, headers=headers, timeout=timeout)
+        try:
+            yield response
+        except BaseException:
+            connection.close()
+            raise
+        self._finish(key, connection, response)
 
+    def close(self) -> None:
+        with self._lock:
+            connections = [connection for idle in self._idle.values() for connection in idle]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
 
-def call_responses_api(
-    api_key: str,
-    *,
-    instructions: str,
-    input_text: str,
-    schema: dict[str, Any],
-    model: str,
-    background: bool = False,
-) -> dict[str, Any]:
-    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
 
-    payload = {
-        "model": model,
-        "input": input_text,
-        "instructions": instructions,
-        "text": {
-            "format": {
-                "type": "json_schema",
-                "name": schema["name"],
-                "schema": schema["schema"],
-                "strict": True,
-            }
-        },
-    }
-    if background:
-        payload["background"] = True
+HTTP_POOL = HttpConnectionPool()
 
-    _, response = post_json("https://api.openai.com/v1/responses", payload=payload, headers=headers)
-    if background:
-        response_id = response.get("id")
-        if not isinstance(response_id, str) or not response_id:
-            raise RuntimeError(f"Background response missing id: {response}")
-        while response.get("status") in {"queued", "in_progress"}:
-            time.sleep(2)
-            _, response = get_json(f"https://api.openai.com/v1/responses/{response_id}", headers=headers)
-        if response.get("status") == "failed":
-            raise RuntimeError(f"Background response failed: {response}")
 
-    output_text = response.get("output_text")
-    if isinstance(output_text, str) and output_text.strip():
-        return json.loads(output_text)
+def http_transport_stats() -> dict[str, int]:
+    return asdict(HTTP_POOL.stats)
 
-    for item in response.get("output", []):
-        for content in item.get("content", []):
-            text = content.get("text")
-            if isinstance(text, str) and text.strip():
-                return json.loads(text)
 
-    raise RuntimeError(f"Unexpected Responses API payload: {response}")
+def parse_retry_hint(headers: dict[str, str]) -> float | None:
+    """Return a server-requested wait in seconds from retry-after-ms / Retry-After, if any."""
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
 
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                return None
+            return max(0.0, retry_at.timestamp() - time.time())
+    return None
+
+
+RATE_LIMIT_RESET_HEADERS = ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+
+
+def parse_rate_limit_reset(headers: dict[str, str]) -> float | None:
+    """Return the longest x-ratelimit-reset-* wait in seconds (values such as '1s', '6m0s' or '20ms'), if any."""
+    waits: list[float] = []
+    for name in RATE_LIMIT_RESET_HEADERS:
+        value = headers.get(name, "").strip()
+        parts = re.findall(r"(\d+(?:\.\d+)?)(ms|h|m|s)", value)
+        if not parts:
+            continue
+        unit_seconds = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+        waits.append(sum(float(amount) * unit_seconds[unit] for amount, unit in parts))
+    return max(waits) if waits else None
 
-# ============================================================
-# Knowledge loading
-# ============================================================
 
-def load_authority_pack_map(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        raise RuntimeError(f"Authority pack map not found: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+class CircuitOpenError(RuntimeError):
+    pass
 
 
-def resolve_authority_pack_paths(topic_entry: dict[str, Any], authority_map: dict[str, Any]) -> list[Path]:
-    pillar = (topic_entry.get("pillar") or "").strip()
-    subtopic = (topic_entry.get("subtopic") or "").strip()
-    article_type = (topic_entry.get("article_type") or "").strip()
-    legal_complexity = (topic_entry.get("legal_complexity") or "").strip()
+@dataclass
+class RetryStats:
+    attempts: int = 0
+    retries: int = 0
+    retry_sleep_seconds: float = 0.0
+    server_hints_honoured: int = 0
+    server_hints_clamped: int = 0
+    budget_exhausted: int = 0
+    circuit_opened: int = 0
+    fast_failures: int = 0
+
+
+class RetryPolicy:
+    """
+    Retry rules shared by every HTTP call in a run.
+
+    Backoff uses full jitter unless the server sent Retry-After or a
+    rate-limit reset header, in which case that wait is used, capped at
+    max_hint_delay.  The total time spent sleeping between retries is capped
+    by budget_seconds for the whole run.  After failure_threshold consecutive
+    failures against one host, its circuit opens: calls fail immediately for
+    cooldown_seconds, then a single trial call decides whether it closes
+    again, and other calls keep failing fast while the trial is in flight.
+    """
 
-    selected: list[str] = []
-    selected.extend(authority_map.get("pillar_defaults", {}).get(pillar, []))
-    selected.extend(authority_map.get("subtopic_overrides", {}).get(f"{pillar}:{subtopic}", []))
-    article_type_extras = (
-        authority_map
-        .get("article_type_extras", {})
-        .get(pillar, {})
-        .get(article_type, [])
-    )
-    selected.extend(article_type_extras)
+    def __init__(
+        self,
+        *,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        max_hint_delay: float,
+        budget_seconds: float,
+        failure_threshold: int,
+        cooldown_seconds: float,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_hint_delay = max_hint_delay
+        self.budget_seconds = budget_seconds
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.stats = RetryStats()
+        self.failures_by_reason: dict[str, int] = {}
+        self._consecutive_failures: dict[str, int] = {}
+        self._open_until: dict[str, float] = {}
+        # Hosts whose half-open trial call is in flight.
+        self._probing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def before_request(self, url: str) -> None:
+        host = urlsplit(url).netloc
+        with self._lock:
+            self.stats.attempts += 1
+            open_until = self._open_until.get(host)
+            if open_until is None:
+                return
+            if host in self._probing or time.monotonic() < open_until:
+                self.stats.fast_failures += 1
+                raise CircuitOpenError(
+                    f"Circuit open for {host} after {self._consecutive_failures[host]} consecutive failures; "
+                    f"not calling {url}"
+                )
+            # Half-open: this call is the trial; the circuit stays open for everyone else until it ends.
+            self._probing.add(host)
+
+    def record_success(self, url: str) -> None:
+        """Record that the host answered (any non-retryable response); closes its circuit."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            self._consecutive_failures.pop(host, None)
+            self._open_until.pop(host, None)
+            self._probing.discard(host)
+
+    def record_failure(self, url: str, reason: str) -> None:
+        host = urlsplit(url).netloc
+        with self._lock:
+            self.failures_by_reason[reason] = self.failures_by_reason.get(reason, 0) + 1
+            failures = self._consecutive_failures.get(host, 0) + 1
+            self._consecutive_failures[host] = failures
+            if host in self._probing:
+                self._probing.discard(host)
+                self._open_until[host] = time.monotonic() + self.cooldown_seconds
+                self.stats.circuit_opened += 1
+            elif failures >= self.failure_threshold and host not in self._open_until:
+                self._open_until[host] = time.monotonic() + self.cooldown_seconds
+                self.stats.circuit_opened += 1
+
+    def backoff(self, url: str, attempt: int, headers: dict[str, str] | None = None) -> bool:
+        """Sleep before the next attempt; return False when the budget or an open circuit forbids a retry."""
+        hint = None
+        if headers:
+            hint = parse_retry_hint(headers)
+            if hint is None:
+                hint = parse_rate_limit_reset(headers)
+        if hint is not None:
+            delay = min(hint, self.max_hint_delay)
+        else:
+            delay = random.uniform(0, min(self.base_delay * 2 ** (attempt - 1), self.max_delay))
+
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host in self._open_until:
+                return False
+            if self.stats.retry_sleep_seconds + delay > self.budget_seconds:
+                self.stats.budget_exhausted += 1
+                return False
+            self.stats.retries += 1
+            self.stats.retry_sleep_seconds += delay
+            if hint is not None:
+                self.stats.server_hints_honoured += 1
+                self.stats.server_hints_clamped += int(hint > self.max_hint_delay)
+        STAGE_TELEMETRY.count_retry(CURRENT_STAGE.get())
+        time.sleep(delay)
+        return True
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **asdict(self.stats),
+                "retry_sleep_seconds": round(self.stats.retry_sleep_seconds, 3),
+                "budget_seconds": self.budget_seconds,
+                "failures_by_reason": dict(sorted(self.failures_by_reason.items())),
+                "open_circuits": sorted(self._open_until),
+            }
 
-    legal_complexity_extras = (
-        authority_map
-        .get("legal_complexity_extras", {})
-        .get(pillar, {})
-        .get(legal_complexity, [])
-    )
-    selected.extend(legal_complexity_extras)
 
-    deduped: list[str] = []
-    seen = set()
-    for item in selected:
-        if item not in seen:
-            seen.add(item)
-            deduped.append(item)
+RETRY_POLICY = RetryPolicy(
+    max_attempts=int(os.environ.get("OPENAI_HTTP_MAX_ATTEMPTS", "3")),
+    base_delay=1.0,
+    max_delay=30.0,
+    max_hint_delay=float(os.environ.get("OPENAI_RETRY_MAX_HINT_SECONDS", "60")),
+    budget_seconds=float(os.environ.get("OPENAI_RETRY_BUDGET_SECONDS", "600")),
+    failure_threshold=int(os.environ.get("OPENAI_CIRCUIT_BREAKER_THRESHOLD", "5")),
+    cooldown_seconds=float(os.environ.get("OPENAI_CIRCUIT_BREAKER_COOLDOWN_SECONDS", "60")),
+)
 
-    return [LEGAL_AUTHORITIES_DIR / rel_path for rel_path in deduped]
 
+# ============================================================
+# Stage telemetry
+# ============================================================
 
-def read_pdf_text(path: Path) -> str:
-    if not HAS_PYPDF2:
-        raise RuntimeError(f"Cannot read PDF because PyPDF2 is not installed: {path}")
+TELEMETRY_LEDGER_PATH = CACHE_DIR / "stage_telemetry.jsonl"
 
+# USD per million tokens as [input, cached input, output] for each model, e.g.
+# OPENAI_MODEL_PRICES='{"gpt-5.5": [1.25, 0.125, 10.0]}'.  Prices change and
+# are not shipped with the script; a model without a price gets no cost.
+MODEL_TOKEN_PRICES: dict[str, list[float]] = json.loads(os.environ.get("OPENAI_MODEL_PRICES") or "{}")
+
+# Pipeline stage of the Responses API call running in the current task or
+# worker thread, so that retries deep in the HTTP layer can be attributed.
+CURRENT_STAGE: contextvars.ContextVar[str | None] = contextvars.ContextVar("CURRENT_STAGE", default=None)
+
+
+@dataclass
+class StageTelemetry:
+    calls: int = 0
+    cache_hits: int = 0
+    request_bytes: int = 0
+    input_tokens: int = 0
+    cached_tokens: int = 0
+    output_tokens: int = 0
+    reasoning_tokens: int = 0
+    wall_seconds: float = 0.0
+    queue_seconds: float = 0.0
+    generation_seconds: float = 0.0
+    polls: int = 0
+    retries: int = 0
+
+
+class StageTelemetryRecorder:
+    """
+    Per-stage request size, token usage, cost, timing, polls and retries for one run.
+
+    report() goes into the run artifacts; append_ledger() adds one row per
+    stage to a JSONL ledger that accumulates across runs.  cost_usd is None
+    unless prices ([input, cached input, output] per million tokens) are given.
+    """
+
+    def __init__(self, prices: list[float] | None = None) -> None:
+        self.stats: dict[str, StageTelemetry] = {}
+        self.prices = prices
+        self._lock = threading.Lock()
+
+    def cost_usd(self, stats: StageTelemetry) -> float | None:
+        if not self.prices:
+            return None
+        input_price, cached_price, output_price = self.prices
+        # Cached tokens are part of input_tokens, and reasoning tokens part of output_tokens.
+        uncached_tokens = stats.input_tokens - stats.cached_tokens
+        cost = uncached_tokens * input_price + stats.cached_tokens * cached_price + stats.output_tokens * output_price
+        return round(cost / 1_000_000, 6)
+
+    def record(
+        self,
+        stage: str,
+        *,
+        request_bytes: int,
+        usage: dict[str, Any] | None,
+        wall_seconds: float,
+        queue_seconds: float = 0.0,
+        generation_seconds: float = 0.0,
+        polls: int = 0,
+        cache_hit: bool = False,
+    ) -> None:
+        usage = usage or {}
+        input_details = usage.get("input_tokens_details") or {}
+        output_details = usage.get("output_tokens_details") or {}
+        with self._lock:
+            stats = self.stats.setdefault(stage, StageTelemetry())
+            stats.calls += 1
+            stats.cache_hits += int(cache_hit)
+            stats.request_bytes += request_bytes
+            stats.input_tokens += int(usage.get("input_tokens") or 0)
+            stats.cached_tokens += int(input_details.get("cached_tokens") or 0)
+            stats.output_tokens += int(usage.get("output_tokens") or 0)
+            stats.reasoning_tokens += int(output_details.get("reasoning_tokens") or 0)
+            stats.wall_seconds += wall_seconds
+            stats.queue_seconds += queue_seconds
+            stats.generation_seconds += generation_seconds
+            stats.polls += polls
+
+    def count_retry(self, stage: str | None) -> None:
+        if stage is None:
+            return
+        with self._lock:
+            self.stats.setdefault(stage, StageTelemetry()).retries += 1
+
+    def report(self) -> dict[str, dict[str, float | int]]:
+        with self._lock:
+            return {
+                stage: {
+                    **asdict(stats),
+                    "wall_seconds": round(stats.wall_seconds, 3),
+                    "queue_seconds": round(stats.queue_seconds, 3),
+                    "generation_seconds": round(stats.generation_seconds, 3),
+                    "cached_ratio": round(stats.cached_tokens / stats.input_tokens, 3) if stats.input_tokens else 0.0,
+                    "cost_usd": self.cost_usd(stats),
+                }
+                for stage, stats in sorted(self.stats.items())
+            }
+
+    def append_ledger(self, path: Path, *, run_base: str, model: str, topic: str, status: str) -> None:
+        recorded_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        rows = [
+            {
+                "recorded_at": recorded_at,
+                "run_base": run_base,
+                "model": model,
+                "topic": topic,
+                "status": status,
+                "stage": stage,
+                **stats,
+            }
+            for stage, stats in self.report().items()
+        ]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+STAGE_TELEMETRY = StageTelemetryRecorder(MODEL_TOKEN_PRICES.get(OPENAI_MODEL))
+
+
+# ============================================================
+# Run trace
+# ============================================================
+
+class RunTrace:
+    """
+    Spans of the pipeline steps of one process, exported in the Chrome trace-event format.
+
+    Synchronous steps are complete ("X") events on the thread that ran them;
+    Responses API calls are async ("b"/"e") events, one track per call, so
+    concurrent calls on one event loop do not overlap on a thread track.
+    When tracing is disabled, span() returns a shared no-op context manager
+    and nothing is recorded.
+    """
+
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self.origin = time.monotonic()
+        self.events: list[dict[str, Any]] = []
+        self.threads: dict[int, str] = {}
+        self._async_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def span(self, name: str, category: str = "pipeline", **fields: Any) -> Any:
+        if not self.enabled:
+            return NO_TRACE_SPAN
+        return self._span(name, category, fields)
+
+    @contextmanager
+    def _span(self, name: str, category: str, fields: dict[str, Any]) -> Iterator[None]:
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(name, category, start, time.monotonic(), **fields)
+
+    def add(self, name: str, category: str, start: float, end: float, **fields: Any) -> None:
+        """Record a complete span on the current thread from time.monotonic() readings."""
+        if not self.enabled:
+            return
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self._micros(start),
+            "dur": round((end - start) * 1_000_000, 1),
+            "pid": os.getpid(),
+            "tid": thread.ident,
+            "args": fields,
+        }
+        with self._lock:
+            self.threads[thread.ident or 0] = thread.name
+            self.events.append(event)
+
+    def add_async(self, name: str, category: str, async_id: int, start: float, end: float, **fields: Any) -> None:
+        """Record a span on the async track async_id; spans sharing an id nest by time."""
+        if not self.enabled:
+            return
+        common = {"name": name, "cat": category, "id": async_id, "pid": os.getpid(), "tid": threading.get_ident()}
+        with self._lock:
+            self.events.append({**common, "ph": "b", "ts": self._micros(start), "args": fields})
+            self.events.append({**common, "ph": "e", "ts": self._micros(end)})
+
+    def next_async_id(self) -> int:
+        return next(self._async_ids)
+
+    def _micros(self, moment: float) -> float:
+        return round((moment - self.origin) * 1_000_000, 1)
+
+    def write(self, path: Path) -> Path | None:
+        if not self.enabled:
+            return None
+        pid = os.getpid()
+        with self._lock:
+            metadata = [
+                {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "generate_and_publish"}}
+            ] + [
+                {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                for tid, name in sorted(self.threads.items())
+            ]
+            events = metadata + sorted(self.events, key=lambda event: event["ts"])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        return path
+
+
+NO_TRACE_SPAN = nullcontext()
+TRACE = RunTrace(args.trace)
+
+
+def traced(name: str | None = None, category: str = "pipeline") -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Record every call of the decorated function as a span; a single flag check when tracing is off."""
+
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*func_args: Any, **func_kwargs: Any) -> Any:
+            if not TRACE.enabled:
+                return func(*func_args, **func_kwargs)
+            with TRACE.span(span_name, category):
+                return func(*func_args, **func_kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+# ============================================================
+# Background polling
+# ============================================================
+
+POLL_MIN_INTERVAL_SECONDS = float(os.environ.get("OPENAI_POLL_MIN_INTERVAL_SECONDS", "1"))
+POLL_MAX_INTERVAL_SECONDS = float(os.environ.get("OPENAI_POLL_MAX_INTERVAL_SECONDS", "15"))
+POLL_LATENCY_MAX_SAMPLES = 50
+POLL_LATENCY_MIN_SAMPLES = 3
+# Polls spent sweeping the learned completion window before backing off.
+POLL_WINDOW_STEPS = 6
+
+
+def latency_quantile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+@dataclass
+class StagePollStats:
+    calls: int = 0
+    polls: int = 0
+    pickup_lag_seconds: float = 0.0
+    wait_seconds: float = 0.0
+
+
+class AdaptivePollScheduler:
+    """
+    Learns how long each stage's background responses take and schedules polls around it.
+
+    The first poll is delayed until a low quantile of the stage's recorded
+    completion times; later polls sweep the expected completion window in
+    small steps and then back off with jitter.  Stages without enough history
+    start from the fixed BACKGROUND_POLL_INTERVAL_SECONDS cadence.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.stats: dict[str, StagePollStats] = {}
+        self._samples: dict[str, list[float]] | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, list[float]]:
+        if self._samples is None:
+            try:
+                with self.path.open("r", encoding="utf-8") as f:
+                    loaded = json.load(f)
+            except (OSError, ValueError):
+                loaded = {}
+            self._samples = {
+                stage: [float(value) for value in values][-POLL_LATENCY_MAX_SAMPLES:]
+                for stage, values in loaded.items()
+                if isinstance(values, list)
+            }
+        return self._samples
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(self._samples, f, indent=2)
+        tmp_path.replace(self.path)
+
+    def _window(self, stage: str) -> tuple[float, float] | None:
+        with self._lock:
+            samples = list(self._load().get(stage, []))
+        if len(samples) < POLL_LATENCY_MIN_SAMPLES:
+            return None
+        return latency_quantile(samples, 0.2), latency_quantile(samples, 0.8)
+
+    def first_delay(self, stage: str) -> float:
+        window = self._window(stage)
+        if window is None:
+            return BACKGROUND_POLL_INTERVAL_SECONDS
+        return max(POLL_MIN_INTERVAL_SECONDS, window[0])
+
+    def next_delay(self, stage: str, polls_so_far: int, retry_hint: float | None = None) -> float:
+        window = self._window(stage)
+        if window is None:
+            step = BACKGROUND_POLL_INTERVAL_SECONDS
+        else:
+            step = (window[1] - window[0]) / POLL_WINDOW_STEPS
+        step = min(max(step, POLL_MIN_INTERVAL_SECONDS), POLL_MAX_INTERVAL_SECONDS)
+
+        overrun = max(0, polls_so_far - POLL_WINDOW_STEPS)
+        delay = min(step * (1.5 ** overrun), POLL_MAX_INTERVAL_SECONDS)
+        if overrun:
+            delay = random.uniform(max(POLL_MIN_INTERVAL_SECONDS, delay / 2), delay)
+        if retry_hint is not None:
+            delay = max(delay, retry_hint)
+        return delay
+
+    def record(
+        self,
+        stage: str,
+        *,
+        latency_seconds: float,
+        polls: int,
+        pickup_lag_seconds: float,
+        wait_seconds: float,
+    ) -> None:
+        with self._lock:
+            stats = self.stats.setdefault(stage, StagePollStats())
+            stats.calls += 1
+            stats.polls += polls
+            stats.pickup_lag_seconds += pickup_lag_seconds
+            stats.wait_seconds += wait_seconds
+
+            samples = self._load().setdefault(stage, [])
+            samples.append(round(latency_seconds, 3))
+            del samples[:-POLL_LATENCY_MAX_SAMPLES]
+            try:
+                self._save()
+            except OSError:
+                pass
+
+    def report(self) -> dict[str, dict[str, float | int]]:
+        with self._lock:
+            return {
+                stage: {
+                    "calls": stats.calls,
+                    "polls": stats.polls,
+                    "mean_polls_per_call": round(stats.polls / stats.calls, 2),
+                    "pickup_lag_seconds": round(stats.pickup_lag_seconds, 3),
+                    "mean_pickup_lag_seconds": round(stats.pickup_lag_seconds / stats.calls, 3),
+                    "wait_seconds": round(stats.wait_seconds, 3),
+                }
+                for stage, stats in sorted(self.stats.items())
+                if stats.calls
+            }
+
+
+POLL_SCHEDULER = AdaptivePollScheduler(POLL_LATENCY_PATH)
+
+
+def background_completion_estimate(
+    response: dict[str, Any],
+    *,
+    submitted_at: float,
+    last_pending_poll_at: float,
+    picked_up_at: float,
+) -> tuple[float, float]:
+    """
+    Return (latency, pickup lag) in seconds for a completed background response.
+
+    Uses the server's created_at/completed_at timestamps when present;
+    otherwise assumes completion half-way between the last pending poll and
+    the poll that saw it finished.  Call it immediately after pickup.
+    """
+    created_at = response.get("created_at")
+    completed_at = response.get("completed_at")
+    if isinstance(created_at, (int, float)) and isinstance(completed_at, (int, float)) and completed_at >= created_at:
+        return float(completed_at - created_at), max(0.0, time.time() - completed_at)
+
+    completed_estimate = (last_pending_poll_at + picked_up_at) / 2
+    return completed_estimate - submitted_at, picked_up_at - completed_estimate
+
+
+# ============================================================
+# Responses cache
+# ============================================================
+
+RESPONSES_CACHE_MAX_BYTES = int(os.environ.get("RESPONSES_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+RESPONSES_CACHE_TTL_SECONDS = float(os.environ.get("RESPONSES_CACHE_TTL_SECONDS", str(14 * 24 * 3600)))
+
+
+def responses_cache_key(payload: dict[str, Any]) -> str:
+    text_format = payload["text"]["format"]
+    basis = {
+        "model": payload["model"],
+        "instructions": payload["instructions"],
+        "input": payload["input"],
+        "schema_name": text_format["name"],
+        "schema": text_format["schema"],
+        "background": bool(payload.get("background")),
+    }
+    encoded = json.dumps(basis, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class ResponsesCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    expired: int = 0
+    evictions: int = 0
+    rejected: int = 0
+    write_errors: int = 0
+
+
+class ResponsesCache:
+    """
+    Content-addressed store of parsed Responses API outputs.
+
+    Entries live at <directory>/<key[:2]>/<key>.json.  A hit refreshes the
+    file's modification time, which doubles as the LRU clock when the
+    directory grows past max_bytes.  Entries older than ttl_seconds are
+    discarded on read.  A store that fails (full or read-only disk) is
+    counted and logged but never fails the call whose output it holds.
+    """
+
+    def __init__(self, directory: Path, *, mode: str, max_bytes: int, ttl_seconds: float) -> None:
+        self.directory = directory
+        self.mode = mode
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stats = ResponsesCacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def reads_enabled(self) -> bool:
+        return self.mode in {"read", "write"}
+
+    @property
+    def writes_enabled(self) -> bool:
+        return self.mode in {"write", "refresh"}
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.stats.misses += 1
+            return None
+
+        if time.time() - float(entry.get("stored_at", 0)) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.stats.expired += 1
+                self.stats.misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.stats.hits += 1
+        return entry.get("output")
+
+    def discard(self, key: str) -> None:
+        """Drop an entry whose output failed validation, so it is requested again."""
+        self._path(key).unlink(missing_ok=True)
+        with self._lock:
+            self.stats.rejected += 1
+
+    def put(self, key: str, output: dict[str, Any], *, stage: str) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump({"stage": stage, "stored_at": time.time(), "output": output}, f, ensure_ascii=False)
+            tmp_path.replace(path)
+        except OSError as exc:
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            with self._lock:
+                self.stats.write_errors += 1
+            print(f"Could not write {stage} output to the response cache {self.directory}: {exc}")
+            return
+        with self._lock:
+            self.stats.stores += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self.stats.evictions += 1
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            return {"mode": self.mode, **asdict(self.stats)}
+
+
+RESPONSES_CACHE = ResponsesCache(
+    RESPONSES_CACHE_DIR,
+    mode=args.cache_mode,
+    max_bytes=RESPONSES_CACHE_MAX_BYTES,
+    ttl_seconds=RESPONSES_CACHE_TTL_SECONDS,
+)
+
+# Classifier outputs produced ahead of time by --prebatch-classifier.  Always
+# read and written, independently of --cache-mode.  They never expire: the key
+# already covers the topic, model, prompt and schema, and a topic may wait
+# weeks before it is used.
+CLASSIFIER_CACHE = ResponsesCache(
+    CLASSIFIER_CACHE_DIR,
+    mode="write",
+    max_bytes=RESPONSES_CACHE_MAX_BYTES,
+    ttl_seconds=math.inf,
+)
+
+
+# ============================================================
+# HTTP and OpenAI helpers
+# ============================================================
+
+def with_idempotency_key(method: str, headers: dict[str, str]) -> dict[str, str]:
+    """Add an Idempotency-Key to a non-idempotent request, shared by all its attempts."""
+    if method in IDEMPOTENT_HTTP_METHODS or any(name.lower() == "idempotency-key" for name in headers):
+        return headers
+    return {**headers, "Idempotency-Key": uuid.uuid4().hex}
+
+
+def request_bytes(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    data: bytes | None = None,
+) -> HttpResponse:
+    """
+    Send a request through the connection pool and retry policy; return the successful response.
+
+    Every attempt of one POST carries the same Idempotency-Key, so a retry of
+    a request the server already received is not processed twice.
+    """
+    max_attempts = RETRY_POLICY.max_attempts
+    timeout_seconds = float(os.getenv("OPENAI_HTTP_TIMEOUT_SECONDS", "600"))
+    headers = with_idempotency_key(method, headers)
+
+    for attempt in range(1, max_attempts + 1):
+        RETRY_POLICY.before_request(url)
+        try:
+            response = HTTP_POOL.request(method, url, body=data, headers=headers, timeout=timeout_seconds)
+        except (OSError, http.client.HTTPException) as exc:
+            RETRY_POLICY.record_failure(url, "network")
+            if attempt < max_attempts and RETRY_POLICY.backoff(url, attempt):
+                continue
+            raise RuntimeError(f"Network error calling {url}: {exc}") from exc
+
+        if response.status >= 400:
+            if response.status in RETRYABLE_HTTP_STATUSES:
+                RETRY_POLICY.record_failure(url, str(response.status))
+                if attempt < max_attempts and RETRY_POLICY.backoff(url, attempt, response.headers):
+                    continue
+            else:
+                RETRY_POLICY.record_success(url)
+            body = response.body.decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"HTTP {response.status} from {url}: {body}")
+
+        RETRY_POLICY.record_success(url)
+        return response
+
+    raise RuntimeError(f"Failed to call {url} after {max_attempts} attempts")
+
+
+def request_json(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    payload: dict | None = None,
+) -> tuple[int, dict[str, Any], dict[str, str]]:
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    response = request_bytes(method, url, headers, data)
+    body = response.body.decode("utf-8", errors="replace").strip()
+    if not body:
+        return response.status, {}, response.headers
+    return response.status, json.loads(body), response.headers
+
+
+def post_json(url: str, payload: dict, headers: dict[str, str]) -> tuple[int, dict[str, Any]]:
+    status, body, _ = request_json("POST", url, headers, payload)
+    return status, body
+
+
+def get_json(url: str, headers: dict[str, str]) -> tuple[int, dict[str, Any]]:
+    status, body, _ = request_json("GET", url, headers)
+    return status, body
+
+
+def iter_sse_events(response: http.client.HTTPResponse) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield (event type, data) pairs from a text/event-stream body until it ends."""
+    event_type = ""
+    data_lines: list[str] = []
+    while True:
+        raw_line = response.readline()
+        if not raw_line:
+            return
+        line = raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
+        if line:
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if field == "event":
+                event_type = value
+            elif field == "data":
+                data_lines.append(value)
+            continue
+
+        if data_lines:
+            data_text = "\n".join(data_lines)
+            if data_text == "[DONE]":
+                return
+            data = json.loads(data_text)
+            yield event_type or data.get("type", ""), data
+        event_type = ""
+        data_lines = []
+
+
+def stream_json_events(
+    url: str,
+    payload: dict,
+    headers: dict[str, str],
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    POST payload and yield its server-sent events.
+
+    Failures before the first event are retried like request_json; once
+    events have been yielded the caller has consumed partial output, so a
+    broken stream is raised instead.  Closing the generator early closes the
+    underlying connection, which cancels the response server-side.
+    """
+    data = json.dumps(payload).encode("utf-8")
+    max_attempts = RETRY_POLICY.max_attempts
+    timeout_seconds = float(os.getenv("OPENAI_HTTP_TIMEOUT_SECONDS", "600"))
+    stream_headers = {**with_idempotency_key("POST", headers), "Accept": "text/event-stream"}
+
+    for attempt in range(1, max_attempts + 1):
+        RETRY_POLICY.before_request(url)
+        started = False
+        try:
+            with HTTP_POOL.stream("POST", url, body=data, headers=stream_headers, timeout=timeout_seconds) as response:
+                if response.status >= 400:
+                    body = response.read().decode("utf-8", errors="replace").strip()
+                    response_headers = {name.lower(): value for name, value in response.getheaders()}
+                    if response.status in RETRYABLE_HTTP_STATUSES:
+                        RETRY_POLICY.record_failure(url, str(response.status))
+                        if attempt < max_attempts and RETRY_POLICY.backoff(url, attempt, response_headers):
+                            continue
+                    else:
+                        RETRY_POLICY.record_success(url)
+                    raise RuntimeError(f"HTTP {response.status} from {url}: {body}")
+
+                RETRY_POLICY.record_success(url)
+                for event in iter_sse_events(response):
+                    started = True
+                    yield event
+                return
+        except (OSError, http.client.HTTPException) as exc:
+            RETRY_POLICY.record_failure(url, "network")
+            if not started and attempt < max_attempts and RETRY_POLICY.backoff(url, attempt):
+                continue
+            raise RuntimeError(f"Network error streaming {url}: {exc}") from exc
+
+    raise RuntimeError(f"Failed to stream {url} after {max_attempts} attempts")
+
+
+OPENAI_RESPONSES_URL = f"{OPENAI_BASE_URL}/responses"
+OPENAI_MAX_CONCURRENT_REQUESTS = int(os.environ.get("OPENAI_MAX_CONCURRENT_REQUESTS", "4"))
+BACKGROUND_POLL_INTERVAL_SECONDS = 2
+
+class ResponsesSlots:
+    """
+    A process-wide limit on in-flight Responses API requests, granted in FIFO order.
+
+    Every call_responses_api runs its own event loop (batch topics and draft
+    candidates included), so a per-loop asyncio.Semaphore would not bound
+    the total.  A waiter parks on a future of its own loop, and release()
+    hands the slot straight to the oldest waiter through that loop, so no
+    one polls and late arrivals cannot overtake.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.available = limit
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = deque()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self.available > 0 and not self._waiters:
+                self.available -= 1
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            # The slot was handed over as the task was cancelled; pass it on.
+            # A grant still pending on the loop passes it on itself (_grant).
+            if waiter[1].done() and not waiter[1].cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                loop, future = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(self._grant, future)
+                except RuntimeError:
+                    continue  # the waiter's loop has closed
+                return
+            self.available += 1
+
+    def _grant(self, future: asyncio.Future[None]) -> None:
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+
+RESPONSES_SLOTS = ResponsesSlots(max(1, OPENAI_MAX_CONCURRENT_REQUESTS))
+
+
+@asynccontextmanager
+async def responses_slot() -> AsyncIterator[Callable[[], None]]:
+    """
+    Hold one of the OPENAI_MAX_CONCURRENT_REQUESTS process-wide slots for a Responses API call.
+
+    Yields a function that gives the slot back early (once the request is
+    queued upstream); otherwise it is given back on leaving the block.  A
+    task cancelled while waiting never holds one.
+    """
+    await RESPONSES_SLOTS.acquire()
+    held = True
+
+    def release() -> None:
+        nonlocal held
+        if held:
+            held = False
+            RESPONSES_SLOTS.release()
+
+    try:
+        yield release
+    finally:
+        release()
+
+
+def build_responses_payload(
+    *,
+    instructions: str,
+    input_text: str,
+    schema: dict[str, Any],
+    model: str,
+    background: bool = False,
+    stream: bool = False,
+    prompt_cache_key: str | None = None,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "model": model,
+        "input": input_text,
+        "instructions": instructions,
+        "text": {
+            "format": {
+                "type": "json_schema",
+                "name": schema["name"],
+                "schema": schema["schema"],
+                "strict": True,
+            }
+        },
+    }
+    if background:
+        payload["background"] = True
+    if stream:
+        payload["stream"] = True
+    if prompt_cache_key:
+        payload["prompt_cache_key"] = prompt_cache_key
+    return payload
+
+
+def stage_prompt_cache_key(stage: str, instructions: str, schema: dict[str, Any]) -> str:
+    """Stable prompt_cache_key for a stage; it changes only when the stage's static prompt does."""
+    basis = json.dumps([instructions, schema], sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return f"swiss-blog-{stage}-{hashlib.sha256(basis).hexdigest()[:12]}"
+
+
+def parse_responses_output(response: dict[str, Any]) -> dict[str, Any]:
+    output_text = response.get("output_text")
+    if isinstance(output_text, str) and output_text.strip():
+        return json.loads(output_text)
+
+    for item in response.get("output", []):
+        for content in item.get("content", []):
+            text = content.get("text")
+            if isinstance(text, str) and text.strip():
+                return json.loads(text)
+
+    raise RuntimeError(f"Unexpected Responses API payload: {response}")
+
+
+@dataclass
+class StageStreamStats:
+    calls: int = 0
+    cancelled: int = 0
+    time_to_first_token_seconds: float = 0.0
+    generation_seconds: float = 0.0
+    output_tokens: int = 0
+
+
+class StreamStatsRecorder:
+    """Time-to-first-token and throughput of streamed Responses API calls, per stage."""
+
+    def __init__(self) -> None:
+        self.stats: dict[str, StageStreamStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        stage: str,
+        *,
+        time_to_first_token: float | None,
+        generation_seconds: float,
+        output_tokens: int,
+        cancelled: bool,
+    ) -> None:
+        with self._lock:
+            stats = self.stats.setdefault(stage, StageStreamStats())
+            stats.calls += 1
+            stats.cancelled += int(cancelled)
+            stats.time_to_first_token_seconds += time_to_first_token or 0.0
+            stats.generation_seconds += generation_seconds
+            stats.output_tokens += output_tokens
+
+    def report(self) -> dict[str, dict[str, float | int]]:
+        with self._lock:
+            return {
+                stage: {
+                    "calls": stats.calls,
+                    "cancelled": stats.cancelled,
+                    "mean_time_to_first_token_seconds": round(stats.time_to_first_token_seconds / stats.calls, 3),
+                    "generation_seconds": round(stats.generation_seconds, 3),
+                    "output_tokens": stats.output_tokens,
+                    "output_tokens_per_second": (
+                        round(stats.output_tokens / stats.generation_seconds, 1) if stats.generation_seconds else None
+                    ),
+                }
+                for stage, stats in sorted(self.stats.items())
+                if stats.calls
+            }
+
+
+STREAM_STATS = StreamStatsRecorder()
+
+
+def consume_responses_stream(
+    payload: dict[str, Any],
+    headers: dict[str, str],
+    *,
+    stage: str,
+    on_text_delta: Callable[[str], None] | None = None,
+    handle: ResponseHandle | None = None,
+) -> tuple[dict[str, Any], float, float]:
+    """
+    Run a streamed Responses API call to completion.
+
+    Returns the final response object, the time to first token and the
+    generation time after it, in seconds.
+
+    Output text deltas are passed to on_text_delta as they arrive; an
+    exception raised there cancels the stream and propagates to the caller.
+    The response id is recorded in handle once the stream announces it, and
+    the stream is closed at the next event after handle is abandoned.
+    """
+    submitted_at = time.monotonic()
+    first_token_at: float | None = None
+    text_parts: list[str] = []
+    response: dict[str, Any] | None = None
+    cancelled = True
+    try:
+        with closing(stream_json_events(OPENAI_RESPONSES_URL, payload, headers)) as events:
+            for event_type, data in events:
+                if handle is not None:
+                    if handle.abandoned:
+                        raise RuntimeError("Streamed response abandoned by a cancelled call.")
+                    if event_type == "response.created":
+                        handle.record((data.get("response") or {}).get("id"))
+                if event_type == "response.output_text.delta":
+                    delta = data.get("delta") or ""
+                    if first_token_at is None:
+                        first_token_at = time.monotonic()
+                    text_parts.append(delta)
+                    if on_text_delta is not None:
+                        on_text_delta(delta)
+                elif event_type == "response.completed":
+                    response = data.get("response") or {}
+                elif event_type in {"response.failed", "response.incomplete", "error"}:
+                    raise RuntimeError(f"Streamed response {event_type}: {data}")
+        cancelled = False
+    finally:
+        finished_at = time.monotonic()
+        time_to_first_token = None if first_token_at is None else first_token_at - submitted_at
+        generation_seconds = 0.0 if first_token_at is None else finished_at - first_token_at
+        usage = (response or {}).get("usage") or {}
+        STREAM_STATS.record(
+            stage,
+            time_to_first_token=time_to_first_token,
+            generation_seconds=generation_seconds,
+            output_tokens=int(usage.get("output_tokens") or 0),
+            cancelled=cancelled,
+        )
+
+    if response is None:
+        raise RuntimeError("Streamed response ended without a response.completed event.")
+    if not response.get("output_text") and not response.get("output"):
+        response["output_text"] = "".join(text_parts)
+    return response, time_to_first_token or 0.0, generation_seconds
+
+
+class ResponseHandle:
+    """
+    The server-side id of one Responses API call, shared with the worker thread running it.
+
+    The id is recorded as soon as the POST returns or the stream announces
+    it.  abandon() is called when the awaiting task is cancelled: it stops a
+    stream at its next event and cancels the response, at once if the id is
+    known or, while the POST is still in flight, as soon as it arrives.
+    """
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        self.headers = headers
+        self.response_id: str | None = None
+        self.abandoned = False
+        self._lock = threading.Lock()
+
+    def record(self, response_id: Any) -> None:
+        if not isinstance(response_id, str) or not response_id:
+            return
+        with self._lock:
+            self.response_id = response_id
+            abandoned = self.abandoned
+        if abandoned:
+            cancel_background_response(response_id, self.headers)
+
+    def abandon(self) -> None:
+        with self._lock:
+            self.abandoned = True
+            response_id = self.response_id
+        if response_id is not None:
+            cancel_background_response(response_id, self.headers)
+
+
+def submit_response(payload: dict[str, Any], headers: dict[str, str], handle: ResponseHandle) -> dict[str, Any]:
+    """POST a Responses API request and record the id of a background response in handle."""
+    _, response = post_json(OPENAI_RESPONSES_URL, payload, headers)
+    if payload.get("background"):
+        handle.record(response.get("id"))
+    return response
+
+
+def cancel_background_response(response_id: str, headers: dict[str, str]) -> None:
+    """Ask the API to stop a background response whose result is no longer wanted; best effort, no retries."""
+    try:
+        HTTP_POOL.request(
+            "POST",
+            f"{OPENAI_RESPONSES_URL}/{response_id}/cancel",
+            body=b"{}",
+            headers=headers,
+            timeout=30,
+        )
+    except (OSError, http.client.HTTPException):
+        pass
+
+
+async def async_call_responses_api(
+    api_key: str,
+    *,
+    instructions: str,
+    input_text: str,
+    schema: dict[str, Any],
+    model: str,
+    background: bool = False,
+    stage: str | None = None,
+    stream: bool = False,
+    on_text_delta: Callable[[str], None] | None = None,
+    cache: bool = True,
+    validate: Callable[[dict[str, Any]], list[str]] | None = None,
+) -> dict[str, Any]:
+    """
+    Asyncio counterpart of call_responses_api.
+
+    Each HTTP exchange runs post_json/get_json (and therefore the shared
+    connection pool and its retry policy) in a worker thread, while waits
+    between background polls yield to the event loop.  Many calls can be
+    gathered on one loop; responses_slot() bounds how many are being
+    submitted or streamed across the whole process, and a background
+    response gives its slot back once it is queued upstream.  `stage` names the pipeline step for poll
+    scheduling and reporting and defaults to the schema name.  With
+    `stream`, the call is made as a server-sent event stream instead of a
+    background response, and output text deltas are passed to
+    `on_text_delta` as they arrive (see consume_responses_stream).
+
+    Retries and fallbacks pass cache=False: they resend an input whose
+    earlier output was rejected, so a cached answer would only repeat it.
+    With `validate`, an output is cached only if it returns no errors, and a
+    cached output that fails it is discarded and requested again.
+    """
+    called_at = time.monotonic()
+    stage = stage or schema["name"]
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    payload = build_responses_payload(
+        instructions=instructions,
+        input_text=input_text,
+        schema=schema,
+        model=model,
+        background=background and not stream,
+        stream=stream,
+        prompt_cache_key=stage_prompt_cache_key(stage, instructions, schema),
+    )
+
+    payload_bytes = len(json.dumps(payload).encode("utf-8"))
+    cache_key = responses_cache_key(payload)
+    if cache and RESPONSES_CACHE.reads_enabled:
+        cached = RESPONSES_CACHE.get(cache_key)
+        if cached is not None and validate is not None and validate(cached):
+            RESPONSES_CACHE.discard(cache_key)
+            cached = None
+        if cached is not None:
+            STAGE_TELEMETRY.record(stage, request_bytes=0, usage=None, wall_seconds=0.0, cache_hit=True)
+            TRACE.add_async(
+                f"responses:{stage}", "responses", TRACE.next_async_id(), called_at, time.monotonic(), cache_hit=True
+            )
+            return cached
+
+    stage_token = CURRENT_STAGE.set(stage)
+    try:
+        async with responses_slot() as release_slot:
+            started_at = time.monotonic()
+            queue_seconds = 0.0
+            polls = 0
+            handle = ResponseHandle(headers)
+            # A cancelled call (a losing draft candidate) stops its response
+            # server-side whether it is still posting, streaming or polling.
+            try:
+                if stream:
+                    response, queue_seconds, generation_seconds = await asyncio.to_thread(
+                        consume_responses_stream,
+                        payload,
+                        headers,
+                        stage=stage,
+                        on_text_delta=on_text_delta,
+                        handle=handle,
+                    )
+                else:
+                    response = await asyncio.to_thread(submit_response, payload, headers, handle)
+                    generation_seconds = time.monotonic() - started_at
+                posted_at = time.monotonic()
+                if payload.get("background"):
+                    # The request is queued upstream; polling does not count against the limit.
+                    release_slot()
+                    response_id = response.get("id")
+                    if not isinstance(response_id, str) or not response_id:
+                        raise RuntimeError(f"Background response missing id: {response}")
+
+                    submitted_at = last_pending_poll_at = time.monotonic()
+                    last_queued_at = submitted_at if response.get("status") == "queued" else None
+                    first_running_at: float | None = None
+                    delay = POLL_SCHEDULER.first_delay(stage)
+                    while response.get("status") in {"queued", "in_progress"}:
+                        await asyncio.sleep(delay)
+                        _, response, response_headers = await asyncio.to_thread(
+                            request_json, "GET", f"{OPENAI_RESPONSES_URL}/{response_id}", headers
+                        )
+                        polls += 1
+                        if response.get("status") == "queued":
+                            last_queued_at = time.monotonic()
+                        elif first_running_at is None:
+                            first_running_at = time.monotonic()
+                        if response.get("status") in {"queued", "in_progress"}:
+                            last_pending_poll_at = time.monotonic()
+                            delay = POLL_SCHEDULER.next_delay(stage, polls, parse_retry_hint(response_headers))
+            except asyncio.CancelledError:
+                await asyncio.to_thread(handle.abandon)
+                raise
+            if payload.get("background"):
+                if response.get("status") == "failed":
+                    raise RuntimeError(f"Background response failed: {response}")
+
+                picked_up_at = time.monotonic()
+                latency, pickup_lag = background_completion_estimate(
+                    response,
+                    submitted_at=submitted_at,
+                    last_pending_poll_at=last_pending_poll_at,
+                    picked_up_at=picked_up_at,
+                )
+                POLL_SCHEDULER.record(
+                    stage,
+                    latency_seconds=latency,
+                    polls=polls,
+                    pickup_lag_seconds=pickup_lag,
+                    wait_seconds=picked_up_at - submitted_at,
+                )
+                # Queueing is taken to end half-way between the last poll that
+                # saw "queued" and the first that did not.
+                if last_queued_at is not None and first_running_at is not None:
+                    queue_seconds = (last_queued_at + first_running_at) / 2 - submitted_at
+                generation_seconds = max(0.0, latency - queue_seconds)
+
+            finished_at = time.monotonic()
+            STAGE_TELEMETRY.record(
+                stage,
+                request_bytes=payload_bytes,
+                usage=response.get("usage"),
+                wall_seconds=finished_at - started_at,
+                queue_seconds=queue_seconds,
+                generation_seconds=generation_seconds,
+                polls=polls,
+            )
+            if TRACE.enabled:
+                trace_id = TRACE.next_async_id()
+                TRACE.add_async(
+                    f"responses:{stage}", "responses", trace_id, called_at, finished_at, polls=polls, stream=stream
+                )
+                TRACE.add_async("wait_for_slot", "responses", trace_id, called_at, started_at)
+                TRACE.add_async("stream" if stream else "submit", "responses", trace_id, started_at, posted_at)
+                if payload.get("background"):
+                    queued_until = posted_at + queue_seconds
+                    TRACE.add_async("queue", "responses", trace_id, posted_at, queued_until)
+                    TRACE.add_async("poll", "responses", trace_id, queued_until, finished_at)
+    finally:
+        CURRENT_STAGE.reset(stage_token)
+
+    output = parse_responses_output(response)
+    if cache and RESPONSES_CACHE.writes_enabled and (validate is None or not validate(output)):
+        RESPONSES_CACHE.put(cache_key, output, stage=stage)
+    return output
+
+
+def call_responses_api(
+    api_key: str,
+    *,
+    instructions: str,
+    input_text: str,
+    schema: dict[str, Any],
+    model: str,
+    background: bool = False,
+    stage: str | None = None,
+    stream: bool = False,
+    on_text_delta: Callable[[str], None] | None = None,
+    cache: bool = True,
+    validate: Callable[[dict[str, Any]], list[str]] | None = None,
+) -> dict[str, Any]:
+    return asyncio.run(
+        async_call_responses_api(
+            api_key,
+            instructions=instructions,
+            input_text=input_text,
+            schema=schema,
+            model=model,
+            background=background,
+            stage=stage,
+            stream=stream,
+            on_text_delta=on_text_delta,
+            cache=cache,
+            validate=validate,
+        )
+    )
+
+
+async def async_call_responses_api_many(api_key: str, calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drive several Responses API calls concurrently; each item holds async_call_responses_api kwargs."""
+    return list(await asyncio.gather(*(async_call_responses_api(api_key, **call) for call in calls)))
+
+
+def call_responses_api_many(api_key: str, calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return asyncio.run(async_call_responses_api_many(api_key, calls))
+
+
+# ============================================================
+# Knowledge loading
+# ============================================================
+
+@traced(category="load")
+def load_authority_pack_map(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        raise RuntimeError(f"Authority pack map not found: {path}")
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@traced(category="load")
+def resolve_authority_pack_paths(topic_entry: dict[str, Any], authority_map: dict[str, Any]) -> list[Path]:
+    pillar = (topic_entry.get("pillar") or "").strip()
+    subtopic = (topic_entry.get("subtopic") or "").strip()
+    article_type = (topic_entry.get("article_type") or "").strip()
+    legal_complexity = (topic_entry.get("legal_complexity") or "").strip()
+
+    selected: list[str] = []
+    selected.extend(authority_map.get("pillar_defaults", {}).get(pillar, []))
+    selected.extend(authority_map.get("subtopic_overrides", {}).get(f"{pillar}:{subtopic}", []))
+    article_type_extras = (
+        authority_map
+        .get("article_type_extras", {})
+        .get(pillar, {})
+        .get(article_type, [])
+    )
+    selected.extend(article_type_extras)
+
+    legal_complexity_extras = (
+        authority_map
+        .get("legal_complexity_extras", {})
+        .get(pillar, {})
+        .get(legal_complexity, [])
+    )
+    selected.extend(legal_complexity_extras)
+
+    deduped: list[str] = []
+    seen = set()
+    for item in selected:
+        if item not in seen:
+            seen.add(item)
+            deduped.append(item)
+
+    return [LEGAL_AUTHORITIES_DIR / rel_path for rel_path in deduped]
+
+
+# Bump when extract_pdf_pages changes what it returns for the same PDF.
+PDF_EXTRACTOR_VERSION = 1
+
+
+@dataclass
+class PdfTextCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    pages_parsed: int = 0
+    parse_seconds: float = 0.0
+
+
+class PdfTextCache:
+    """
+    Per-page text extracted from knowledge PDFs, stored under <directory>/<key[:2]>/<key>.json.
+
+    The key combines the SHA-256 of the PDF bytes with the PyPDF2 and
+    extractor versions, so an unchanged PDF is parsed once and a changed
+    PDF or extractor is parsed again.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.stats = PdfTextCacheStats()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(content: bytes) -> str:
+        extractor = f"pypdf2-{PYPDF2_VERSION}-v{PDF_EXTRACTOR_VERSION}"
+        return hashlib.sha256(f"{hashlib.sha256(content).hexdigest()}:{extractor}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> list[tuple[int, str]] | None:
+        try:
+            with self._path(key).open("r", encoding="utf-8") as f:
+                pages = [(int(page_num), text) for page_num, text in json.load(f)["pages"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            with self._lock:
+                self.stats.misses += 1
+            return None
+        with self._lock:
+            self.stats.hits += 1
+        return pages
+
+    def put(self, key: str, path: Path, pages: list[tuple[int, str]], *, parse_seconds: float) -> None:
+        cache_path = self._path(key)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump({"source": path.name, "pages": pages}, f, ensure_ascii=False)
+        tmp_path.replace(cache_path)
+        with self._lock:
+            self.stats.stores += 1
+            self.stats.pages_parsed += len(pages)
+            self.stats.parse_seconds += parse_seconds
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            return {**asdict(self.stats), "parse_seconds": round(self.stats.parse_seconds, 3)}
+
+
+PDF_TEXT_CACHE = PdfTextCache(KNOWLEDGE_CACHE_DIR)
+
+
+def extract_pdf_pages(path: Path, content: bytes) -> list[tuple[int, str]]:
+    """Whitespace-normalised text of each non-empty page, with its 1-based page number."""
     try:
-        reader = PdfReader(str(path))
+        reader = PdfReader(io.BytesIO(content))
     except Exception as exc:
         raise RuntimeError(f"Could not open PDF file: {path}") from exc
 
-    pages: list[str] = []
+    pages: list[tuple[int, str]] = []
     for page_num, page in enumerate(reader.pages, start=1):
         try:
             text = page.extract_text() or ""
@@ -1105,9 +2924,25 @@ def read_pdf_text(path: Path) -> str:
             text = ""
         text = re.sub(r"\s+", " ", text).strip()
         if text:
-            pages.append(f"[page {page_num}] {text}")
+            pages.append((page_num, text))
+
+    return pages
+
 
-    return "\n".join(pages)
+def read_pdf_text(path: Path) -> str:
+    if not HAS_PYPDF2:
+        raise RuntimeError(f"Cannot read PDF because PyPDF2 is not installed: {path}")
+
+    content = path.read_bytes()
+    key = PDF_TEXT_CACHE.key(content)
+    pages = PDF_TEXT_CACHE.get(key)
+    if pages is None:
+        with TRACE.span("read_pdf_text", "load", path=path.name):
+            started_at = time.perf_counter()
+            pages = extract_pdf_pages(path, content)
+        PDF_TEXT_CACHE.put(key, path, pages, parse_seconds=time.perf_counter() - started_at)
+
+    return "\n".join(f"[page {page_num}] {text}" for page_num, text in pages)
 
 
 def read_text_file(path: Path) -> str:
@@ -1129,59 +2964,664 @@ def read_knowledge_file(path: Path) -> str:
     raise RuntimeError(f"Unsupported knowledge file type: {path}")
 
 
+KNOWLEDGE_SECTION_MAX_CHARS = 3000
+MARKDOWN_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+PDF_PAGE_PATTERN = re.compile(r"^\[page (\d+)\] ")
+
+
+def split_bounded(text: str, max_chars: int) -> list[str]:
+    """Split text into parts of at most max_chars, at paragraph breaks where possible, else at whitespace."""
+    parts: list[str] = []
+    current = ""
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        while len(paragraph) > max_chars:
+            room = max_chars - len(current) - 2 if current else max_chars
+            if room < max_chars // 10:
+                parts.append(current)
+                current, room = "", max_chars
+            cut = paragraph.rfind(" ", 0, room)
+            cut = cut if cut > 0 else room
+            parts.append(f"{current}\n\n{paragraph[:cut].strip()}" if current else paragraph[:cut].strip())
+            current = ""
+            paragraph = paragraph[cut:].strip()
+        if current and len(current) + 2 + len(paragraph) > max_chars:
+            parts.append(current)
+            current = ""
+        current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current:
+        parts.append(current)
+    return parts
+
+
+def markdown_sections(text: str) -> list[tuple[str, str]]:
+    """(heading path, text) of each markdown section with content; fenced code blocks are not scanned for headings."""
+    sections: list[tuple[str, str]] = []
+    headings: list[tuple[int, str]] = []
+    lines: list[str] = []
+    in_fence = False
+
+    def flush() -> None:
+        body = "\n".join(lines).strip()
+        has_content = any(line.strip() for line in lines[1:]) if headings and lines else bool(body)
+        if body and has_content:
+            sections.append((" > ".join(title for _, title in headings), body))
+
+    for line in text.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else MARKDOWN_HEADING_PATTERN.match(line)
+        if match:
+            flush()
+            level = len(match.group(1))
+            headings = [(lvl, title) for lvl, title in headings if lvl < level] + [(level, match.group(2).strip())]
+            lines = [line]
+        else:
+            lines.append(line)
+    flush()
+    return sections
+
+
+def pdf_page_sections(text: str, max_chars: int) -> list[tuple[str, str]]:
+    """Consecutive `[page n]` pages from read_pdf_text grouped into sections of at most max_chars."""
+    sections: list[tuple[str, str]] = []
+    pages: list[tuple[int, str]] = []
+
+    def flush() -> None:
+        if pages:
+            first, last = pages[0][0], pages[-1][0]
+            title = f"page {first}" if first == last else f"pages {first}-{last}"
+            sections.append((title, "\n".join(line for _, line in pages)))
+            pages.clear()
+
+    for line in text.splitlines():
+        match = PDF_PAGE_PATTERN.match(line)
+        page_num = int(match.group(1)) if match else (pages[-1][0] if pages else 1)
+        if pages and sum(len(page) + 1 for _, page in pages) + len(line) > max_chars:
+            flush()
+        pages.append((page_num, line))
+    flush()
+    return sections
+
+
+def split_knowledge_sections(path: Path, text: str) -> list[tuple[str, str]]:
+    """
+    Bounded (section, text) pieces of a knowledge file.
+
+    Markdown is split by heading hierarchy and PDFs by their `[page n]`
+    markers; any piece longer than KNOWLEDGE_SECTION_MAX_CHARS is split
+    again at paragraph breaks into numbered parts.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".md":
+        sections = markdown_sections(text)
+    elif suffix == ".pdf":
+        sections = pdf_page_sections(text, KNOWLEDGE_SECTION_MAX_CHARS)
+    else:
+        sections = [("", text)]
+
+    bounded: list[tuple[str, str]] = []
+    for title, body in sections:
+        parts = split_bounded(body, KNOWLEDGE_SECTION_MAX_CHARS) if len(body) > KNOWLEDGE_SECTION_MAX_CHARS else [body]
+        if len(parts) == 1:
+            bounded.append((title, parts[0]))
+            continue
+        for number, part in enumerate(parts, start=1):
+            bounded.append((f"{title} (part {number})" if title else f"part {number}", part))
+    return bounded
+
+
+def knowledge_file_chunks(path: Path, source_kind: str) -> list[KnowledgeChunk]:
+    text = read_knowledge_file(path)
+    if not text:
+        return []
+    source_name = str(path.relative_to(SCRIPT_DIR))
+    return [
+        KnowledgeChunk(source_name, source_kind, section_text, section, section_index)
+        for section_index, (section, section_text) in enumerate(split_knowledge_sections(path, text))
+    ]
+
+
+@traced(category="load")
 def load_selected_legal_authority_chunks(authority_paths: list[Path]) -> list[KnowledgeChunk]:
     chunks: list[KnowledgeChunk] = []
 
-    for authority_path in authority_paths:
-        if not authority_path.exists():
-            raise RuntimeError(f"Mapped legal authority pack not found: {authority_path}")
+    for authority_path in authority_paths:
+        if not authority_path.exists():
+            raise RuntimeError(f"Mapped legal authority pack not found: {authority_path}")
+
+        chunks.extend(knowledge_file_chunks(authority_path, "legal_authority"))
+
+    return chunks
+
+
+def knowledge_folder_files(folder: Path) -> list[Path]:
+    if not folder.is_dir():
+        return []
+    return [
+        path
+        for path in sorted(folder.rglob("*"))
+        if path.is_file() and path.suffix.lower() in SUPPORTED_KNOWLEDGE_EXTENSIONS
+    ]
+
+
+@traced(category="load")
+def load_chunks_from_folder(folder: Path, source_kind: str) -> list[KnowledgeChunk]:
+    chunks: list[KnowledgeChunk] = []
+    for path in knowledge_folder_files(folder):
+        chunks.extend(knowledge_file_chunks(path, source_kind))
+
+    return chunks
+
+
+KNOWLEDGE_CORPUS_MAGIC = b"BLOGKC3\n"
+KNOWLEDGE_CORPUS_FOLDERS = [
+    (LEGAL_AUTHORITIES_DIR, "legal_authority"),
+    (INTERNAL_NOTES_DIR, "internal_legal_note"),
+    (WEBSITE_EDITORIAL_DIR, "website_editorial"),
+]
+
+
+def knowledge_file_stamp(path: Path) -> list[int]:
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def knowledge_corpus_settings() -> str:
+    """
+    Digest of everything besides the source files that shapes a corpus build.
+
+    Covers the section bound, the source of the chunking and tokenizing
+    functions, the token pattern and stopwords, and the PDF extractor, so a
+    corpus built by different code is not mistaken for a current one.
+    """
+    functions = [
+        split_bounded,
+        markdown_sections,
+        pdf_page_sections,
+        split_knowledge_sections,
+        knowledge_file_chunks,
+        extract_pdf_pages,
+        tokenize_text,
+    ]
+    settings = {
+        "section_max_chars": KNOWLEDGE_SECTION_MAX_CHARS,
+        "functions": [inspect.getsource(function) for function in functions],
+        "token_pattern": TOKEN_PATTERN.pattern,
+        "stopwords": sorted(STOPWORDS),
+        "pdf_extractor": [PYPDF2_VERSION if HAS_PYPDF2 else None, PDF_EXTRACTOR_VERSION],
+    }
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@traced(category="load")
+def build_knowledge_corpus(path: Path = KNOWLEDGE_CORPUS_PATH) -> dict[str, Any]:
+    """
+    Compile every knowledge file into one corpus file for KnowledgeCorpus.
+
+    Layout: magic, little-endian uint64 header length, JSON header, then the
+    UTF-8 text of each section chunk, then the BM25 index: one uint32 token
+    count per chunk and, per term, uint32 (chunk, term frequency) pairs.
+    The header holds the chunk table, the term vocabulary with posting
+    offsets, the size and mtime of every source file and the digest of the
+    chunking and tokenizing settings, so a stale corpus is detected without
+    reading the files.
+    """
+    started_at = time.perf_counter()
+    files: dict[str, list[int]] = {}
+    table: list[list[Any]] = []
+    blob = bytearray()
+    lengths = array.array("I")
+    postings: dict[str, array.array] = {}
+    for folder, source_kind in KNOWLEDGE_CORPUS_FOLDERS:
+        for file_path in knowledge_folder_files(folder):
+            source_name = str(file_path.relative_to(SCRIPT_DIR))
+            files[source_name] = knowledge_file_stamp(file_path)
+            for chunk in knowledge_file_chunks(file_path, source_kind):
+                encoded = chunk.text.encode("utf-8")
+                terms = Counter(tokenize_text(chunk.text))
+                for term, frequency in terms.items():
+                    postings.setdefault(term, array.array("I")).extend((len(table), frequency))
+                lengths.append(sum(terms.values()))
+                table.append([source_name, source_kind, chunk.section, chunk.section_index, chunk.size(), len(blob), len(encoded)])
+                blob += encoded
+
+    vocabulary: dict[str, list[int]] = {}
+    lengths_offset = len(blob)
+    blob += lengths.tobytes()
+    for term in sorted(postings):
+        vocabulary[term] = [len(blob), len(postings[term]) // 2]
+        blob += postings[term].tobytes()
+
+    header = json.dumps(
+        {
+            "files": files,
+            "settings": knowledge_corpus_settings(),
+            "chunks": table,
+            "lengths_offset": lengths_offset,
+            "vocabulary": vocabulary,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp_path.open("wb") as f:
+        f.write(KNOWLEDGE_CORPUS_MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        f.write(blob)
+    tmp_path.replace(path)
+    return {
+        "corpus": str(path),
+        "files": len(files),
+        "chunks": len(table),
+        "terms": len(vocabulary),
+        "bytes": path.stat().st_size,
+        "seconds": round(time.perf_counter() - started_at, 3),
+    }
+
+
+class CorpusChunk(KnowledgeChunk):
+    """A knowledge chunk whose text stays in the memory-mapped corpus until it is read."""
+
+    def __init__(
+        self,
+        corpus: KnowledgeCorpus,
+        source_name: str,
+        source_kind: str,
+        section: str,
+        section_index: int,
+        chars: int,
+        text_span: tuple[int, int],
+    ) -> None:
+        self.source_name = source_name
+        self.source_kind = source_kind
+        self.section = section
+        self.section_index = section_index
+        self._chars = chars
+        self.corpus = corpus
+        self._text_span = text_span
+
+    @property
+    def text(self) -> str:
+        return self.corpus.read(*self._text_span).decode("utf-8")
+
+    def size(self) -> int:
+        return self._chars
+
+
+class KnowledgeCorpus:
+    """
+    Memory-mapped corpus written by --build-knowledge-index.
+
+    Only the header (file stamps, chunk table and term vocabulary) is parsed
+    on open; chunk text is sliced from the mapping only when a chunk is
+    formatted, and retrieval reads the postings of the query terms, so
+    resident memory does not grow with the size of knowledge/.
+    """
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[: len(KNOWLEDGE_CORPUS_MAGIC)] != KNOWLEDGE_CORPUS_MAGIC:
+            raise ValueError(f"Not a knowledge corpus file: {path}")
+        (header_length,) = struct.unpack_from("<Q", self._mmap, len(KNOWLEDGE_CORPUS_MAGIC))
+        header_start = len(KNOWLEDGE_CORPUS_MAGIC) + 8
+        header = json.loads(self._mmap[header_start : header_start + header_length].decode("utf-8"))
+        self._blob_start = header_start + header_length
+        self.files: dict[str, list[int]] = header["files"]
+        self.settings: str | None = header.get("settings")
+        self.chunks = [
+            CorpusChunk(self, name, kind, section, index, chars, (text_start, text_length))
+            for name, kind, section, index, chars, text_start, text_length in header["chunks"]
+        ]
+        self._vocabulary: dict[str, list[int]] = header["vocabulary"]
+        lengths = array.array("I")
+        lengths.frombytes(self.read(header["lengths_offset"], 4 * len(self.chunks)))
+        self.bm25 = Bm25Index(self.chunks, list(lengths), self.postings)
+        self._by_file: dict[str, list[KnowledgeChunk]] = {}
+        self._by_kind: dict[str, list[KnowledgeChunk]] = {}
+        for chunk in self.chunks:
+            self._by_file.setdefault(chunk.source_name, []).append(chunk)
+            self._by_kind.setdefault(chunk.source_kind, []).append(chunk)
+
+    @classmethod
+    def open_if_current(cls, path: Path) -> KnowledgeCorpus | None:
+        """
+        The corpus at path, or None if it is missing or unreadable, any knowledge file changed since the
+        build, or it was built with other chunking or tokenizing settings.
+        """
+        try:
+            corpus = cls(path)
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+        if corpus.settings != knowledge_corpus_settings():
+            return None
+        current = {
+            str(file_path.relative_to(SCRIPT_DIR)): knowledge_file_stamp(file_path)
+            for folder, _ in KNOWLEDGE_CORPUS_FOLDERS
+            for file_path in knowledge_folder_files(folder)
+        }
+        return corpus if current == corpus.files else None
+
+    def read(self, start: int, length: int) -> bytes:
+        return self._mmap[self._blob_start + start : self._blob_start + start + length]
+
+    def terms(self) -> list[str]:
+        return list(self._vocabulary)
+
+    def postings(self, term: str) -> array.array:
+        pairs = array.array("I")
+        if term in self._vocabulary:
+            offset, count = self._vocabulary[term]
+            pairs.frombytes(self.read(offset, 8 * count))
+        return pairs
+
+    def file_chunks(self, source_name: str) -> list[KnowledgeChunk]:
+        return self._by_file.get(source_name, [])
+
+    def kind_chunks(self, source_kind: str) -> list[KnowledgeChunk]:
+        return self._by_kind.get(source_kind, [])
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9/+-]+")
+BM25_K1 = 1.2
+BM25_B = 0.75
+STOPWORDS = frozenset(
+    "the and for with that this from are was were can does what when where how who why which into your you our "
+    "not but has have had will may its their they them than then also there been being more most such any all "
+    "out about over under after before should would could".split()
+)
+
+
+def tokenize_text(text: str) -> list[str]:
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if len(token) >= 3 and token not in STOPWORDS]
+
+
+def tokenize_queries(queries: Iterable[str]) -> list[str]:
+    tokens: list[str] = []
+    for query in queries:
+        tokens.extend(tokenize_text(query))
+    return tokens
+
+
+SOURCE_KIND_BOOSTS = {"legal_authority": 15, "internal_legal_note": 7}
+
+
+def chunk_postings(chunks: list[KnowledgeChunk]) -> tuple[list[int], dict[str, array.array]]:
+    """Token count of each chunk and, per term, flat uint32 (chunk position, term frequency) pairs."""
+    postings: dict[str, array.array] = {}
+    lengths: list[int] = []
+    for position, chunk in enumerate(chunks):
+        terms = Counter(tokenize_text(chunk.text))
+        for term, frequency in terms.items():
+            postings.setdefault(term, array.array("I")).extend((position, frequency))
+        lengths.append(sum(terms.values()))
+    return lengths, postings
+
+
+class Bm25Index:
+    """
+    Inverted index with BM25 scoring over a fixed list of chunks.
+
+    postings(term) returns a flat uint32 array of (chunk position, term
+    frequency) pairs; the in-memory index built by from_chunks keeps them in
+    a dict, and a KnowledgeCorpus reads them from its memory-mapped file.
+    Arrays rather than tuples keep large indexes out of garbage collection.
+    """
+
+    def __init__(
+        self,
+        chunks: list[KnowledgeChunk],
+        lengths: list[int],
+        postings: Callable[[str], array.array],
+    ) -> None:
+        self.chunks = chunks
+        self.lengths = lengths
+        self.average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+        self.postings = postings
+        self.positions = {id(chunk): position for position, chunk in enumerate(chunks)}
+
+    @classmethod
+    def from_chunks(cls, chunks: list[KnowledgeChunk]) -> Bm25Index:
+        lengths, postings = chunk_postings(chunks)
+        return cls(chunks, lengths, lambda term: postings.get(term, array.array("I")))
+
+    def covers(self, chunks: list[KnowledgeChunk]) -> bool:
+        return all(id(chunk) in self.positions for chunk in chunks)
+
+    def scores(self, query_terms: list[str], candidates: set[int] | None = None) -> dict[int, float]:
+        """BM25 score by position of the (candidate) chunks matching at least one term; repeated terms weigh more."""
+        scores: dict[int, float] = {}
+        total = len(self.chunks)
+        for term, query_frequency in Counter(query_terms).items():
+            postings = self.postings(term)
+            if not postings:
+                continue
+            document_frequency = len(postings) // 2
+            idf = math.log(1 + (total - document_frequency + 0.5) / (document_frequency + 0.5))
+            pairs = iter(postings)
+            for position, frequency in zip(pairs, pairs):
+                if candidates is not None and position not in candidates:
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths[position] / self.average_length)
+                scores[position] = scores.get(position, 0.0) + (
+                    query_frequency * idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+                )
+        return scores
+
+
+class TfidfIndex:
+    """
+    Sparse TF-IDF matrix over a fixed list of chunks, for --retrieval-backend tfidf.
+
+    Weights are (1 + log tf) * idf with every chunk row L2-normalised, so a
+    batch of query sets is scored against every chunk with one sparse matrix
+    product and ranked by cosine similarity.  The matrix is stored
+    terms x chunks, the orientation that product needs.
+    """
 
-        text = read_knowledge_file(authority_path)
-        if text:
-            chunks.append(
-                KnowledgeChunk(
-                    str(authority_path.relative_to(SCRIPT_DIR)),
-                    "legal_authority",
-                    text,
-                )
-            )
+    def __init__(
+        self,
+        chunks: list[KnowledgeChunk],
+        terms: Iterable[str],
+        postings: Callable[[str], array.array],
+    ) -> None:
+        self.chunks = chunks
+        self.positions = {id(chunk): position for position, chunk in enumerate(chunks)}
+        self.vocabulary: dict[str, int] = {}
+        columns: list[np.ndarray] = []
+        for term in terms:
+            pairs = np.frombuffer(postings(term), dtype=np.uint32).reshape(-1, 2)
+            if len(pairs):
+                self.vocabulary[term] = len(columns)
+                columns.append(pairs)
+
+        document_frequency = np.array([len(pairs) for pairs in columns], dtype=np.float64)
+        self.idf = np.log((1 + len(chunks)) / (1 + document_frequency)) + 1
+        rows = np.concatenate([pairs[:, 0] for pairs in columns]) if columns else np.zeros(0, dtype=np.uint32)
+        frequencies = np.concatenate([pairs[:, 1] for pairs in columns]) if columns else np.zeros(0, dtype=np.uint32)
+        term_columns = np.repeat(np.arange(len(columns)), [len(pairs) for pairs in columns])
+        weights = (1 + np.log(frequencies)) * self.idf[term_columns]
+        matrix = sparse.csr_matrix(
+            (weights, (rows, term_columns)), shape=(len(chunks), len(columns)), dtype=np.float64
+        )
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        self.matrix = (sparse.diags(1 / norms) @ matrix).T.tocsr().astype(np.float32)
+        self.boosts = np.array([SOURCE_KIND_BOOSTS.get(chunk.source_kind, 0) for chunk in chunks], dtype=np.float32)
+        self.source_kinds = np.array([chunk.source_kind for chunk in chunks])
+
+    @classmethod
+    def from_chunks(cls, chunks: list[KnowledgeChunk]) -> TfidfIndex:
+        _, postings = chunk_postings(chunks)
+        return cls(chunks, postings, postings.__getitem__)
+
+    @classmethod
+    def from_corpus(cls, corpus: KnowledgeCorpus) -> TfidfIndex:
+        return cls(corpus.chunks, corpus.terms(), corpus.postings)
+
+    def covers(self, chunks: list[KnowledgeChunk]) -> bool:
+        return all(id(chunk) in self.positions for chunk in chunks)
+
+    def query_matrix(self, query_term_sets: list[list[str]]) -> sparse.csr_matrix:
+        rows: list[int] = []
+        columns: list[int] = []
+        weights: list[float] = []
+        for row, query_terms in enumerate(query_term_sets):
+            for term, frequency in Counter(query_terms).items():
+                column = self.vocabulary.get(term)
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+                    weights.append((1 + math.log(frequency)) * self.idf[column])
+        matrix = sparse.csr_matrix(
+            (weights, (rows, columns)), shape=(len(query_term_sets), len(self.vocabulary)), dtype=np.float32
+        )
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return (sparse.diags(1 / norms) @ matrix).tocsr()
+
+    def top_k(
+        self,
+        query_term_sets: list[list[str]],
+        limit: int,
+        *,
+        candidates: set[int] | None = None,
+        allowed_source_kinds: set[str] | None = None,
+    ) -> list[list[int]]:
+        """Positions of the best `limit` (candidate) chunks for each query set, best first, boosts included."""
+        eligible = np.ones(len(self.chunks), dtype=bool)
+        if candidates is not None:
+            eligible[:] = False
+            eligible[list(candidates)] = True
+        if allowed_source_kinds:
+            eligible &= np.isin(self.source_kinds, list(allowed_source_kinds))
+
+        scores = (self.query_matrix(query_term_sets) @ self.matrix).tocsr()
+        results: list[list[int]] = []
+        for row in range(scores.shape[0]):
+            start, end = scores.indptr[row], scores.indptr[row + 1]
+            positions = scores.indices[start:end]
+            keep = eligible[positions] & (scores.data[start:end] > 0)
+            positions = positions[keep]
+            values = scores.data[start:end][keep] + self.boosts[positions]
+            if len(positions) > limit:
+                best = np.argpartition(-values, limit - 1)[:limit]
+                positions, values = positions[best], values[best]
+            results.append(positions[np.lexsort((positions, -values))].tolist())
+        return results
+
+
+_RETRIEVAL_INDEXES: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+_RETRIEVAL_INDEXES_LOCK = threading.Lock()
+RETRIEVAL_CACHED_INDEXES = 16
+
+
+def cached_retrieval_index(key: tuple[Any, ...], build: Callable[[], Any]) -> Any:
+    """
+    The index cached under key, built on first use.
 
-    return chunks
+    The last RETRIEVAL_CACHED_INDEXES indexes are kept; a cached index holds
+    its chunks, so the chunk ids in a key cannot be reused while it is cached.
+    """
+    with _RETRIEVAL_INDEXES_LOCK:
+        index = _RETRIEVAL_INDEXES.get(key)
+        if index is not None:
+            _RETRIEVAL_INDEXES.move_to_end(key)
+            return index
+    index = build()
+    with _RETRIEVAL_INDEXES_LOCK:
+        _RETRIEVAL_INDEXES[key] = index
+        while len(_RETRIEVAL_INDEXES) > RETRIEVAL_CACHED_INDEXES:
+            _RETRIEVAL_INDEXES.popitem(last=False)
+    return index
+
+
+def bm25_index_for(chunks: list[KnowledgeChunk]) -> Bm25Index:
+    """
+    The index to score chunks against: the corpus index when they all come from one KnowledgeCorpus.
 
+    Otherwise an in-memory index over exactly these chunks, built once and cached.
+    """
+    first = chunks[0] if chunks else None
+    if isinstance(first, CorpusChunk) and first.corpus.bm25.covers(chunks):
+        return first.corpus.bm25
+    return cached_retrieval_index(("bm25", *map(id, chunks)), lambda: Bm25Index.from_chunks(chunks))
 
-def load_chunks_from_folder(folder: Path, source_kind: str) -> list[KnowledgeChunk]:
-    chunks: list[KnowledgeChunk] = []
-    if not folder.is_dir():
-        return chunks
 
-    for path in sorted(folder.rglob("*")):
-        if not path.is_file():
-            continue
+def tfidf_index_for(chunks: list[KnowledgeChunk]) -> TfidfIndex:
+    """
+    The TF-IDF matrix to score chunks against, built once and cached.
 
-        if path.suffix.lower() not in SUPPORTED_KNOWLEDGE_EXTENSIONS:
+    Chunks that all come from one KnowledgeCorpus share a matrix over the
+    whole corpus, built from its postings without re-tokenizing any text.
+    """
+    if not HAS_SCIPY:
+        raise RuntimeError("The tfidf retrieval backend needs numpy and scipy: pip install numpy scipy")
+    corpus = chunks[0].corpus if chunks and isinstance(chunks[0], CorpusChunk) else None
+    if corpus is not None and all(getattr(chunk, "corpus", None) is corpus for chunk in chunks):
+        return cached_retrieval_index(("tfidf-corpus", id(corpus)), lambda: TfidfIndex.from_corpus(corpus))
+    return cached_retrieval_index(("tfidf", *map(id, chunks)), lambda: TfidfIndex.from_chunks(chunks))
+
+
+def bm25_top_k(
+    index: Bm25Index,
+    query_terms: list[str],
+    limit: int,
+    *,
+    candidates: set[int] | None = None,
+    allowed_source_kinds: set[str] | None = None,
+) -> list[int]:
+    scored: list[tuple[float, int]] = []
+    for position, score in index.scores(query_terms, candidates).items():
+        source_kind = index.chunks[position].source_kind
+        if allowed_source_kinds and source_kind not in allowed_source_kinds:
             continue
+        scored.append((score + SOURCE_KIND_BOOSTS.get(source_kind, 0), position))
+    return [position for _, position in heapq.nsmallest(limit, scored, key=lambda item: (-item[0], item[1]))]
 
-        text = read_knowledge_file(path)
-        if text:
-            chunks.append(
-                KnowledgeChunk(
-                    str(path.relative_to(SCRIPT_DIR)),
-                    source_kind,
-                    text,
-                )
-            )
 
-    return chunks
+@traced(category="retrieval")
+def retrieve_batch(
+    chunks: list[KnowledgeChunk],
+    query_sets: list[Iterable[str]],
+    *,
+    limit: int = 6,
+    allowed_source_kinds: set[str] | None = None,
+    backend: str | None = None,
+) -> list[list[KnowledgeChunk]]:
+    """
+    simple_retrieve for several query sets at once, one ranked list per set.
 
+    The backend defaults to --retrieval-backend.  With 'tfidf' every set is
+    scored in one sparse matrix product; 'bm25' scores the sets in turn.
+    """
+    query_term_sets = [tokenize_queries(queries) for queries in query_sets]
+    if not chunks:
+        return [[] for _ in query_term_sets]
 
-def tokenize_queries(queries: Iterable[str]) -> list[str]:
-    tokens: list[str] = []
-    for query in queries:
-        for token in re.findall(r"[A-Za-z0-9/+-]+", query):
-            token = token.lower().strip()
-            if len(token) >= 3:
-                tokens.append(token)
-    return tokens
+    if (backend or args.retrieval_backend) == "tfidf":
+        index = tfidf_index_for(chunks)
+    else:
+        index = bm25_index_for(chunks)
+    candidates = None if len(index.chunks) == len(chunks) else {index.positions[id(chunk)] for chunk in chunks}
+
+    if isinstance(index, TfidfIndex):
+        ranked = index.top_k(
+            query_term_sets, limit, candidates=candidates, allowed_source_kinds=allowed_source_kinds
+        )
+    else:
+        ranked = [
+            bm25_top_k(index, query_terms, limit, candidates=candidates, allowed_source_kinds=allowed_source_kinds)
+            if query_terms
+            else []
+            for query_terms in query_term_sets
+        ]
+    return [[index.chunks[position] for position in positions] for positions in ranked]
 
 
 def simple_retrieve(
@@ -1191,36 +3631,52 @@ def simple_retrieve(
     limit: int = 6,
     allowed_source_kinds: set[str] | None = None,
 ) -> list[KnowledgeChunk]:
-    query_terms = tokenize_queries(queries)
-    scored: list[tuple[int, KnowledgeChunk]] = []
+    return retrieve_batch(chunks, [queries], limit=limit, allowed_source_kinds=allowed_source_kinds)[0]
 
-    for chunk in chunks:
-        if allowed_source_kinds and chunk.source_kind not in allowed_source_kinds:
-            continue
 
-        haystack = chunk.text.lower()
-        score = sum(haystack.count(term) for term in query_terms)
+def pack_sections(
+    ranked: list[KnowledgeChunk],
+    budget_chars: int,
+    *,
+    cover_sources: bool = False,
+) -> list[KnowledgeChunk]:
+    """
+    Take ranked section chunks greedily until budget_chars is spent.
 
-        if score == 0:
+    With cover_sources, the best section of every source comes before any
+    second section.  The result keeps sources in order of their best
+    section and each source's sections in document order.
+    """
+    order = ranked
+    if cover_sources:
+        best: dict[str, KnowledgeChunk] = {}
+        for chunk in ranked:
+            best.setdefault(chunk.source_name, chunk)
+        leaders = {id(chunk) for chunk in best.values()}
+        order = list(best.values()) + [chunk for chunk in ranked if id(chunk) not in leaders]
+
+    packed: list[KnowledgeChunk] = []
+    used = 0
+    for chunk in order:
+        if used + chunk.size() > budget_chars:
             continue
+        packed.append(chunk)
+        used += chunk.size()
 
-        if chunk.source_kind == "legal_authority":
-            score += 15
-        elif chunk.source_kind == "internal_legal_note":
-            score += 7
-
-        scored.append((score, chunk))
-
-    scored.sort(key=lambda item: item[0], reverse=True)
-    return [chunk for _, chunk in scored[:limit]]
+    source_rank = {}
+    for chunk in ranked:
+        source_rank.setdefault(chunk.source_name, len(source_rank))
+    return sorted(packed, key=lambda chunk: (source_rank[chunk.source_name], chunk.section_index))
 
 
 def format_sources_for_prompt(chunks: list[KnowledgeChunk], max_chars_per_source: int = 6000) -> str:
     parts: list[str] = []
     for chunk in chunks:
+        section = f"SECTION: {chunk.section}\n" if chunk.section else ""
         parts.append(
             f"SOURCE_KIND: {chunk.source_kind}\n"
             f"SOURCE_NAME: {chunk.source_name}\n"
+            f"{section}"
             f"CONTENT:\n{chunk.text[:max_chars_per_source]}"
         )
     return "\n\n---\n\n".join(parts)
@@ -1230,6 +3686,7 @@ def format_sources_for_prompt(chunks: list[KnowledgeChunk], max_chars_per_source
 # Topic helpers
 # ============================================================
 
+@traced(category="load")
 def load_topics(path: Path) -> list[dict[str, Any]]:
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
@@ -1327,16 +3784,135 @@ def select_article_structure_variant(
 # Prompt builders
 # ============================================================
 
+# Every stage input starts with a byte-stable static context (fixed
+# constraints and source-use notes that never vary between topics), followed
+# by the per-topic payload.  Together with the constant stage instructions
+# this gives each stage a long identical prompt prefix that the API's prompt
+# cache can reuse across topics and runs.
+
+EDITORIAL_CONTEXT_NOTE = (
+    "Use website_editorial_context only for content positioning, continuity, overlap awareness and tone. "
+    "Do not treat website editorial as legal authority."
+)
+
+DRAFT_EDITORIAL_CONSTRAINTS = {
+    "cta_heading": CTA_HEADING,
+    "cta_name": CTA_NAME,
+    "cta_phone": CTA_PHONE,
+    "hard_word_limit": MAX_BLOG_WORDS,
+    "target_word_range": TARGET_BLOG_WORDS,
+    "citation_style": "Use short in-text legal references only, using LEI / AIG and OASA / VZAE.",
+    "official_source_language_style": (
+        "Use clear English by default. If a non-English official term is useful for precision, "
+        "provide both French and German where both are relevant. For SEM directives/instructions, "
+        "use 'SEM Directives' or first use 'SEM Directives on the Foreign Nationals and Integration Act "
+        "(Directives LEI / AIG; Weisungen AIG)'. Do not use only the French or only the German term."
+    ),
+    "subheading_style": (
+        "Use bold sub-headings with a blank line above and below each one. "
+        "Sub-headings should be SEO-aware but natural: include relevant keywords only where they "
+        "fit cleanly, avoid stuffing, and do not force exact-match keyword phrases into every heading."
+    ),
+    "opening_style": "The first paragraph must be fully bold, followed immediately by a second introductory paragraph without legal citations.",
+    "title_style_guidance": (
+        "Generate a polished, public-facing blog title, not an internal topic label. "
+        "The title should be clear, specific, restrained and legally accurate, and should "
+        "ideally surface a practical question, decision point, contrast, risk, consequence, "
+        "client problem, misconception or timing issue where appropriate."
+    ),
+    "do_not_include_quick_answer": True,
+    "prefer_prose_over_bullets": True,
+    "avoid_multiple_bullet_sections": True,
+    "fixed_practical_headings_required": False,
+    "avoid_default_headings": [
+        "What This Means in Practice",
+        "What To Do Next",
+    ],
+    "practical_section_guidance": (
+        "Include a practical next-step or strategy section, but vary the heading according to the "
+        "article_structure_variant and topic. The section should open from the applicant's perspective: "
+        "what the applicant should identify, check, reconstruct, preserve, gather, compare or decide. "
+        "Then explain how Richmond Chambers Switzerland, our Swiss immigration lawyers, our Swiss "
+        "immigration team or our immigration lawyers in Switzerland can add value by reviewing the "
+        "legal basis, evidence, timing, procedural posture and strategic options."
+    ),
+    "reader_value_requirement": (
+        "Every post must be concretely useful to readers. Include at least two practical reader-helpful "
+        "elements in the article body, such as best-practice tips, practical case examples/patterns, "
+        "pitfall-avoidance guidance, decision checks, timing strategy or evidence-preparation advice."
+    ),
+    "document_evidence_caveat_required": (
+        "Whenever documents or evidence are suggested, say that they are examples only. "
+        "Use varied wording across posts. Depending on context, explain that Richmond Chambers "
+        "Switzerland provides clients with a tailored checklist of all required and recommended "
+        "supporting documents based on the circumstances of their case, and carefully reviews "
+        "supporting documents to ensure that they satisfy the strict requirements set by the "
+        "migration authorities in terms of content, format, translation, certification, date "
+        "and submission. Do not repeat this point in the CTA if it has already been made in "
+        "the body."
+    ),
+    "terminology_preferences": {
+        "avoid": ["ordinary C"],
+        "prefer": [
+            "an ordinary C-permit",
+            "the ordinary C-permit route",
+            "the ordinary route to a C permit",
+        ],
+    },
+    "cta_style": (
+        "Use a personal, lawyer-led formulation. For example: 'At Richmond Chambers Switzerland, "
+        "our specialist Swiss immigration lawyers would be pleased to review...' or 'Our Swiss "
+        "immigration team can advise on...'. Avoid repeating document checklist wording if it "
+        "already appears in the article body. Vary the CTA value proposition across posts."
+    ),
+    "what_to_do_next_style": (
+        "Do not create a lawyer-only next-step section. Open from the applicant's perspective, then "
+        "explain how our Swiss immigration lawyers can help. Vary the section heading and wording."
+    ),
+    "avoid_person_wording": (
+        "Avoid repeated references to 'the person'. Prefer 'the applicant', 'an applicant', "
+        "'the sponsor', 'the employer', 'the family member' or another precise category."
+    ),
+    "disclaimer_position": (
+        "The disclaimer must appear at the very end of the blog content, after the CTA, and must be italicised."
+    ),
+    "avoid_ai_source_language": (
+        "Do not write 'the supplied guidance', 'the supplied materials', 'the legal materials supplied', "
+        "'the source material', or any phrase suggesting that the article was produced from internal inputs."
+    ),
+    "authorial_variation_required": (
+        "Vary the structure, heading sequence, paragraph rhythm and practical framing so that posts do "
+        "not all read as if they were written from the same template. The article should read as if "
+        "written by an individual human author."
+    ),
+    "website_context_use": "Use for continuity and overlap avoidance only. Do not use as legal authority.",
+}
+
+REPAIR_GUARDRAILS = (
+    "Repair only. Do not add unsupported law, new facts, invented procedures, nationality lists, "
+    "canton-specific practice, fees or document requirements."
+)
+
+FLOW_REPAIR_GUARDRAILS = (
+    "Repair reader flow only. Do not add unsupported legal propositions, new facts, "
+    "invented procedures, nationality lists, canton-specific practice, fees or document requirements."
+)
+
+
+def build_stage_input(static_context: dict[str, Any], payload: dict[str, Any]) -> str:
+    """Serialise a stage input with its static context ahead of the per-topic payload."""
+    return json.dumps({**static_context, **payload}, ensure_ascii=False, indent=2)
+
+
 def build_classifier_input(topic_entry: dict[str, Any]) -> str:
-    return json.dumps(
+    return build_stage_input(
+        {},
         {
             "topic": topic_entry.get("topic", ""),
             "angle": topic_entry.get("angle", ""),
             "audience": topic_entry.get("audience", "general_global"),
             "topic_metadata": derive_topic_metadata(topic_entry),
         },
-        ensure_ascii=False,
-        indent=2,
     )
 
 
@@ -1346,7 +3922,8 @@ def build_legal_input(
     legal_sources_text: str,
     website_context_text: str,
 ) -> str:
-    return json.dumps(
+    return build_stage_input(
+        {"source_use_note": EDITORIAL_CONTEXT_NOTE},
         {
             "topic": topic_entry.get("topic", ""),
             "angle": topic_entry.get("angle", ""),
@@ -1355,14 +3932,33 @@ def build_legal_input(
             "topic_metadata": derive_topic_metadata(topic_entry),
             "classifier": classifier,
             "legal_sources": legal_sources_text,
-            "website_editorial_context": (
-                "Use only for content positioning, overlap awareness and tone. "
-                "Do not treat website editorial as legal authority.\n\n"
-                f"{website_context_text[:8000]}"
-            ),
+            "website_editorial_context": website_context_text[:8000],
+        },
+    )
+
+
+def build_legal_memo_repair_input(
+    topic_entry: dict[str, Any],
+    classifier: dict[str, Any],
+    memo: dict[str, Any],
+    failing: dict[int, list[str]],
+    legal_sources_text: str,
+) -> str:
+    issues = memo.get("issues", [])
+    return build_stage_input(
+        {},
+        {
+            "topic": topic_entry.get("topic", ""),
+            "angle": topic_entry.get("angle", ""),
+            "audience": topic_entry.get("audience", "general_global"),
+            "key_issues": classifier.get("key_issues", []),
+            "article_positioning": memo.get("article_positioning", ""),
+            "failing_issues": [
+                {"index": index, "issue": issues[index - 1], "validation_errors": errors}
+                for index, errors in sorted(failing.items())
+            ],
+            "legal_sources": legal_sources_text,
         },
-        ensure_ascii=False,
-        indent=2,
     )
 
 
@@ -1372,7 +3968,8 @@ def build_reader_journey_input(
     memo: dict[str, Any],
     website_context: str,
 ) -> str:
-    return json.dumps(
+    return build_stage_input(
+        {"source_use_note": EDITORIAL_CONTEXT_NOTE},
         {
             "topic": topic_entry.get("topic", ""),
             "angle": topic_entry.get("angle", ""),
@@ -1381,14 +3978,8 @@ def build_reader_journey_input(
             "topic_metadata": derive_topic_metadata(topic_entry),
             "classifier": classifier,
             "legal_memo": memo,
-            "website_editorial_context": (
-                "Use only for continuity, overlap awareness and tone. "
-                "Do not treat website editorial as legal authority.\n\n"
-                f"{website_context[:8000]}"
-            ),
+            "website_editorial_context": website_context[:8000],
         },
-        ensure_ascii=False,
-        indent=2,
     )
 
 
@@ -1398,10 +3989,12 @@ def build_draft_input(
     memo: dict[str, Any],
     reader_journey: dict[str, Any],
     website_context: str,
+    structure_variant: dict[str, Any] | None = None,
 ) -> str:
-    structure_variant = select_article_structure_variant(topic_entry, classifier)
+    structure_variant = structure_variant or select_article_structure_variant(topic_entry, classifier)
 
-    return json.dumps(
+    return build_stage_input(
+        {"editorial_constraints": DRAFT_EDITORIAL_CONSTRAINTS},
         {
             "topic": topic_entry.get("topic", ""),
             "angle": topic_entry.get("angle", ""),
@@ -1412,114 +4005,23 @@ def build_draft_input(
             "reader_journey_plan": reader_journey,
             "classifier": classifier,
             "legal_memo": memo,
-            "editorial_constraints": {
-                "cta_heading": CTA_HEADING,
-                "cta_name": CTA_NAME,
-                "cta_phone": CTA_PHONE,
-                "hard_word_limit": MAX_BLOG_WORDS,
-                "target_word_range": TARGET_BLOG_WORDS,
-                "citation_style": "Use short in-text legal references only, using LEI / AIG and OASA / VZAE.",
-                "official_source_language_style": (
-                    "Use clear English by default. If a non-English official term is useful for precision, "
-                    "provide both French and German where both are relevant. For SEM directives/instructions, "
-                    "use 'SEM Directives' or first use 'SEM Directives on the Foreign Nationals and Integration Act "
-                    "(Directives LEI / AIG; Weisungen AIG)'. Do not use only the French or only the German term."
-                ),
-                "subheading_style": (
-                    "Use bold sub-headings with a blank line above and below each one. "
-                    "Sub-headings should be SEO-aware but natural: include relevant keywords only where they "
-                    "fit cleanly, avoid stuffing, and do not force exact-match keyword phrases into every heading."
-                ),
-                "opening_style": "The first paragraph must be fully bold, followed immediately by a second introductory paragraph without legal citations.",
-                "title_style_guidance": (
-                    "Generate a polished, public-facing blog title, not an internal topic label. "
-                    "The title should be clear, specific, restrained and legally accurate, and should "
-                    "ideally surface a practical question, decision point, contrast, risk, consequence, "
-                    "client problem, misconception or timing issue where appropriate."
-                ),
-                "do_not_include_quick_answer": True,
-                "prefer_prose_over_bullets": True,
-                "avoid_multiple_bullet_sections": True,
-                "fixed_practical_headings_required": False,
-                "avoid_default_headings": [
-                    "What This Means in Practice",
-                    "What To Do Next",
-                ],
-                "practical_section_guidance": (
-                    "Include a practical next-step or strategy section, but vary the heading according to the "
-                    "article_structure_variant and topic. The section should open from the applicant's perspective: "
-                    "what the applicant should identify, check, reconstruct, preserve, gather, compare or decide. "
-                    "Then explain how Richmond Chambers Switzerland, our Swiss immigration lawyers, our Swiss "
-                    "immigration team or our immigration lawyers in Switzerland can add value by reviewing the "
-                    "legal basis, evidence, timing, procedural posture and strategic options."
-                ),
-                "reader_value_requirement": (
-                    "Every post must be concretely useful to readers. Include at least two practical reader-helpful "
-                    "elements in the article body, such as best-practice tips, practical case examples/patterns, "
-                    "pitfall-avoidance guidance, decision checks, timing strategy or evidence-preparation advice."
-                ),
-                "document_evidence_caveat_required": (
-                    "Whenever documents or evidence are suggested, say that they are examples only. "
-                    "Use varied wording across posts. Depending on context, explain that Richmond Chambers "
-                    "Switzerland provides clients with a tailored checklist of all required and recommended "
-                    "supporting documents based on the circumstances of their case, and carefully reviews "
-                    "supporting documents to ensure that they satisfy the strict requirements set by the "
-                    "migration authorities in terms of content, format, translation, certification, date "
-                    "and submission. Do not repeat this point in the CTA if it has already been made in "
-                    "the body."
-                ),
-                "terminology_preferences": {
-                    "avoid": ["ordinary C"],
-                    "prefer": [
-                        "an ordinary C-permit",
-                        "the ordinary C-permit route",
-                        "the ordinary route to a C permit",
-                    ],
-                },
-                "cta_style": (
-                    "Use a personal, lawyer-led formulation. For example: 'At Richmond Chambers Switzerland, "
-                    "our specialist Swiss immigration lawyers would be pleased to review...' or 'Our Swiss "
-                    "immigration team can advise on...'. Avoid repeating document checklist wording if it "
-                    "already appears in the article body. Vary the CTA value proposition across posts."
-                ),
-                "what_to_do_next_style": (
-                    "Do not create a lawyer-only next-step section. Open from the applicant's perspective, then "
-                    "explain how our Swiss immigration lawyers can help. Vary the section heading and wording."
-                ),
-                "avoid_person_wording": (
-                    "Avoid repeated references to 'the person'. Prefer 'the applicant', 'an applicant', "
-                    "'the sponsor', 'the employer', 'the family member' or another precise category."
-                ),
-                "disclaimer_position": (
-                    "The disclaimer must appear at the very end of the blog content, after the CTA, and must be italicised."
-                ),
-                "avoid_ai_source_language": (
-                    "Do not write 'the supplied guidance', 'the supplied materials', 'the legal materials supplied', "
-                    "'the source material', or any phrase suggesting that the article was produced from internal inputs."
-                ),
+            "topic_editorial_constraints": {
                 "optional_heading_examples": structure_variant.get("optional_heading_examples", []),
                 "next_steps_style": structure_variant.get("next_steps_style", ""),
-                "authorial_variation_required": (
-                    "Vary the structure, heading sequence, paragraph rhythm and practical framing so that posts do "
-                    "not all read as if they were written from the same template. The article should read as if "
-                    "written by an individual human author."
-                ),
                 "structure_variety": {
                     "selected_variant": structure_variant["name"],
                     "description": structure_variant["description"],
                     "preferred_flow": structure_variant["preferred_flow"],
                 },
-                "website_context_use": "Use for continuity and overlap avoidance only. Do not use as legal authority.",
                 "website_context": website_context[:8000],
             },
         },
-        ensure_ascii=False,
-        indent=2,
     )
 
 
 def build_seo_input(topic_entry: dict[str, Any], draft: dict[str, Any]) -> str:
-    return json.dumps(
+    return build_stage_input(
+        {},
         {
             "topic": topic_entry.get("topic", ""),
             "angle": topic_entry.get("angle", ""),
@@ -1527,8 +4029,6 @@ def build_seo_input(topic_entry: dict[str, Any], draft: dict[str, Any]) -> str:
             "blog_title": draft["blog_title"],
             "blog_excerpt": draft["blog_content"][:3500],
         },
-        ensure_ascii=False,
-        indent=2,
     )
 
 
@@ -1539,7 +4039,8 @@ def build_repair_input(
     draft: dict[str, Any],
     validation_errors: list[str],
 ) -> str:
-    return json.dumps(
+    return build_stage_input(
+        {"repair_guardrails": REPAIR_GUARDRAILS},
         {
             "topic": topic_entry.get("topic", ""),
             "angle": topic_entry.get("angle", ""),
@@ -1548,13 +4049,7 @@ def build_repair_input(
             "legal_memo": memo,
             "draft_to_repair": draft,
             "validation_errors": validation_errors,
-            "repair_guardrails": (
-                "Repair only. Do not add unsupported law, new facts, invented procedures, nationality lists, "
-                "canton-specific practice, fees or document requirements."
-            ),
         },
-        ensure_ascii=False,
-        indent=2,
     )
 
 
@@ -1566,7 +4061,8 @@ def build_flow_repair_input(
     draft: dict[str, Any],
     flow_errors: list[str],
 ) -> str:
-    return json.dumps(
+    return build_stage_input(
+        {"repair_guardrails": FLOW_REPAIR_GUARDRAILS},
         {
             "topic": topic_entry.get("topic", ""),
             "angle": topic_entry.get("angle", ""),
@@ -1576,15 +4072,59 @@ def build_flow_repair_input(
             "reader_journey_plan": reader_journey,
             "draft_to_repair": draft,
             "flow_errors": flow_errors,
-            "repair_guardrails": (
-                "Repair reader flow only. Do not add unsupported legal propositions, new facts, "
-                "invented procedures, nationality lists, canton-specific practice, fees or document requirements."
-            ),
         },
-        ensure_ascii=False,
-        indent=2,
     )
 
+
+def build_title_input(
+    topic_entry: dict[str, Any],
+    draft: dict[str, Any],
+    title_errors: list[str],
+) -> str:
+    blocks = split_blocks(draft.get("blog_content", ""))
+    return build_stage_input(
+        {},
+        {
+            "topic": topic_entry.get("topic", ""),
+            "angle": topic_entry.get("angle", ""),
+            "audience": topic_entry.get("audience", "general_global"),
+            "current_title": draft.get("blog_title", ""),
+            "title_errors": title_errors,
+            "opening": blocks[:2],
+            "headings": [block for block in blocks if is_bold_heading(block)],
+            "candidate_count": TITLE_CANDIDATE_COUNT,
+        },
+    )
+
+
+def build_targeted_repair_input(
+    topic_entry: dict[str, Any],
+    draft: dict[str, Any],
+    located_errors: list[dict[str, Any]],
+    *,
+    guardrails: str,
+    context: dict[str, Any] | None = None,
+) -> str:
+    blocks = split_blocks(draft.get("blog_content", ""))
+    targets = {index for located in located_errors for index in located["blocks"]}
+    shown = sorted({j for i in targets for j in (i - 1, i, i + 1) if 0 <= j < len(blocks)})
+
+    return build_stage_input(
+        {"repair_guardrails": guardrails},
+        {
+            "topic": topic_entry.get("topic", ""),
+            "angle": topic_entry.get("angle", ""),
+            "audience": topic_entry.get("audience", "general_global"),
+            **(context or {}),
+            "blog_title": draft.get("blog_title", ""),
+            "block_count": len(blocks),
+            "outline": [{"index": i, "heading": block} for i, block in enumerate(blocks) if is_bold_heading(block)],
+            "blocks": [{"index": i, "needs_repair": i in targets, "text": blocks[i]} for i in shown],
+            "validation_errors": located_errors,
+        },
+    )
+
+
 # ============================================================
 # Persistence and email helpers
 # ============================================================
@@ -1601,6 +4141,11 @@ def write_run_artifact(filename: str, payload: dict[str, Any]) -> Path:
     return path
 
 
+def write_run_trace(run_base: str) -> Path | None:
+    """Write the run trace as OUTPUT_DIR/RUN_BASE_trace.json when --trace is on."""
+    return TRACE.write(OUTPUT_DIR / f"{run_base}_trace.json")
+
+
 def escape_html(text: str) -> str:
     return (
         text
@@ -1611,6 +4156,7 @@ def escape_html(text: str) -> str:
     )
 
 
+@traced(category="email")
 def send_email_via_sendgrid(subject: str, body: str, *, is_html: bool = False) -> bool:
     if not SENDGRID_API_KEY:
         raise RuntimeError("Missing SENDGRID_API_KEY")
@@ -1625,7 +4171,7 @@ def send_email_via_sendgrid(subject: str, body: str, *, is_html: bool = False) -
 
     try:
         status, response_body = post_json(
-            "https://api.sendgrid.com/v3/mail/send",
+            f"{SENDGRID_BASE_URL}/mail/send",
             payload=payload,
             headers=headers,
         )
@@ -1642,6 +4188,7 @@ def send_email_via_sendgrid(subject: str, body: str, *, is_html: bool = False) -
 # Normalisation
 # ============================================================
 
+@traced(category="normalise")
 def replace_legal_abbreviation_style(text: str) -> str:
     def collapse_abbreviation_series(
         content: str,
@@ -1711,6 +4258,7 @@ def replace_legal_abbreviation_style(text: str) -> str:
     return cleaned
 
 
+@traced(category="normalise")
 def replace_informal_c_permit_terms(text: str) -> str:
     text = re.sub(
         r"\bThe an ordinary C[\-–—]permit[\-–—]Permit Route\b",
@@ -1729,6 +4277,7 @@ def replace_informal_c_permit_terms(text: str) -> str:
     return text
 
 
+@traced(category="normalise")
 def replace_sem_directives_terms(text: str) -> str:
     """
     Normalise references to SEM directives/instructions.
@@ -1791,6 +4340,7 @@ def replace_sem_directives_terms(text: str) -> str:
     return cleaned
 
 
+@traced(category="normalise")
 def replace_ai_source_phrases(text: str) -> str:
     replacements = {
         r"\bthe supplied guidance\b": "SEM guidance",
@@ -1812,6 +4362,7 @@ def replace_ai_source_phrases(text: str) -> str:
     return cleaned
 
 
+@traced(category="normalise")
 def replace_person_references(text: str) -> str:
     replacements = {
         r"\bthe person’s\b": "the applicant’s",
@@ -1829,6 +4380,7 @@ def replace_person_references(text: str) -> str:
     return cleaned
 
 
+@traced(category="normalise")
 def remove_forbidden_public_phrases(text: str) -> str:
     cleaned = text
     for phrase in FORBIDDEN_PUBLIC_PHRASES:
@@ -1844,6 +4396,7 @@ def count_words(text: str) -> int:
     return len(re.findall(r"\b[\w'-]+\b", text))
 
 
+@traced(category="normalise")
 def repair_sentence_start_capitalisation(text: str) -> str:
     sentence_start_patterns = [
         r"(?<=[.!?])(\s+)(an applicant\b)",
@@ -1886,6 +4439,7 @@ def is_bold_heading(block: str) -> bool:
     return len(inner.split()) <= 14 and not inner.endswith(".")
 
 
+@traced(category="normalise")
 def remove_near_top_summary_section(blog_content: str) -> str:
     blocks = split_blocks(blog_content)
     if not blocks:
@@ -1917,6 +4471,7 @@ def remove_near_top_summary_section(blog_content: str) -> str:
     return "\n\n".join(cleaned_blocks)
 
 
+@traced(category="normalise")
 def soften_repeated_practical_headings(
     blog_content: str,
     topic_entry: dict[str, Any],
@@ -1976,30 +4531,32 @@ def insert_before_cta_or_disclaimer(blocks: list[str], new_blocks: list[str]) ->
     return blocks + new_blocks
 
 
-def detect_duplicate_practical_sections(blog_content: str) -> list[str]:
-    blocks = split_blocks(blog_content)
-    practical_heading_patterns = [
-        r"practical",
-        r"before you apply",
-        r"reducing the risk",
-        r"planning",
-        r"strategy",
-        r"evidence",
-        r"next step",
-    ]
+PRACTICAL_HEADING_PATTERNS = [
+    r"practical",
+    r"before you apply",
+    r"reducing the risk",
+    r"planning",
+    r"strategy",
+    r"evidence",
+    r"next step",
+]
+MAX_PRACTICAL_SECTIONS = 3
+
+
+def is_practical_heading(block: str) -> bool:
+    if not is_bold_heading(block):
+        return False
+    heading_text = re.sub(r"^\*\*|\*\*$", "", block).strip().lower()
+    return any(re.search(pattern, heading_text, flags=re.IGNORECASE) for pattern in PRACTICAL_HEADING_PATTERNS)
 
-    practical_headings: list[str] = []
-    for block in blocks:
-        if not is_bold_heading(block):
-            continue
-        heading_text = re.sub(r"^\*\*|\*\*$", "", block).strip().lower()
-        if any(re.search(pattern, heading_text, flags=re.IGNORECASE) for pattern in practical_heading_patterns):
-            practical_headings.append(block)
 
-    if len(practical_headings) > 3:
+def detect_duplicate_practical_sections(blog_content: str) -> list[str]:
+    practical_headings = [block for block in split_blocks(blog_content) if is_practical_heading(block)]
+
+    if len(practical_headings) > MAX_PRACTICAL_SECTIONS:
         return [
             f"Too many practical/evidence/strategy sections ({len(practical_headings)}). "
-            "Maximum allowed is 3."
+            f"Maximum allowed is {MAX_PRACTICAL_SECTIONS}."
         ]
     return []
 
@@ -2072,6 +4629,7 @@ def find_empty_heading_errors(blocks: list[str]) -> list[str]:
     return errors
 
 
+@traced(category="normalise")
 def remove_empty_headings(blog_content: str) -> str:
     blocks = split_blocks(blog_content)
     if not blocks:
@@ -2102,6 +4660,36 @@ def remove_empty_headings(blog_content: str) -> str:
     return "\n\n".join(cleaned_blocks)
 
 
+MALFORMED_OUTPUT_PATTERNS = [
+    r"\bThe an\b",
+    r"\ban ordinary C[\-–—]permit[\-–—]Permit\b",
+    r"\bC[\-–—]permit[\-–—]Permit\b",
+    r"\bLEI\s*/\s*LEI\s*/\s*AIG\b",
+    r"\b(?:LEI\s*/\s*AIG|AIG\s*/\s*LEI)\s*/\s*(?:LEI|AIG)\b",
+    r"\b(?:LEI|AIG)\s*/\s*(?:LEI\s*/\s*AIG|AIG\s*/\s*LEI)\b",
+    r"\bAIG\s*/\s*LEI\s*/\s*AIG\b",
+    r"\bLEI\s*/\s*AIG\s*/\s*AIG\b",
+    r"\bAIG\s*/\s*LEI\s*/\s*LEI\b",
+    r"\bOASA\s*/\s*OASA\s*/\s*VZAE\b",
+    r"\b(?:OASA\s*/\s*VZAE|VZAE\s*/\s*OASA)\s*/\s*(?:OASA|VZAE)\b",
+    r"\b(?:OASA|VZAE)\s*/\s*(?:OASA\s*/\s*VZAE|VZAE\s*/\s*OASA)\b",
+    r"\bVZAE\s*/\s*OASA\s*/\s*VZAE\b",
+    r"\bOASA\s*/\s*VZAE\s*/\s*VZAE\b",
+    r"\bVZAE\s*/\s*OASA\s*/\s*OASA\b",
+    r"\bSEM Directives Directives\b",
+    r"\bContact Our Immigration Lawyers In Switzerland\b[\s\S]*\bPractical Tips Before You Apply\b",
+]
+
+
+def find_malformed_output_patterns(text: str) -> list[str]:
+    return [
+        f"Malformed or undesirable output pattern found: {pattern}"
+        for pattern in MALFORMED_OUTPUT_PATTERNS
+        if re.search(pattern, text, flags=re.IGNORECASE)
+    ]
+
+
+@traced(category="validate")
 def validate_public_draft(draft: dict[str, Any]) -> list[str]:
     errors: list[str] = []
 
@@ -2121,28 +4709,7 @@ def validate_public_draft(draft: dict[str, Any]) -> list[str]:
             f"blog_content exceeds MAX_BLOG_WORDS ({word_count} > {MAX_BLOG_WORDS})."
         )
 
-    malformed_patterns = [
-        r"\bThe an\b",
-        r"\ban ordinary C[\-–—]permit[\-–—]Permit\b",
-        r"\bC[\-–—]permit[\-–—]Permit\b",
-        r"\bLEI\s*/\s*LEI\s*/\s*AIG\b",
-        r"\b(?:LEI\s*/\s*AIG|AIG\s*/\s*LEI)\s*/\s*(?:LEI|AIG)\b",
-        r"\b(?:LEI|AIG)\s*/\s*(?:LEI\s*/\s*AIG|AIG\s*/\s*LEI)\b",
-        r"\bAIG\s*/\s*LEI\s*/\s*AIG\b",
-        r"\bLEI\s*/\s*AIG\s*/\s*AIG\b",
-        r"\bAIG\s*/\s*LEI\s*/\s*LEI\b",
-        r"\bOASA\s*/\s*OASA\s*/\s*VZAE\b",
-        r"\b(?:OASA\s*/\s*VZAE|VZAE\s*/\s*OASA)\s*/\s*(?:OASA|VZAE)\b",
-        r"\b(?:OASA|VZAE)\s*/\s*(?:OASA\s*/\s*VZAE|VZAE\s*/\s*OASA)\b",
-        r"\bVZAE\s*/\s*OASA\s*/\s*VZAE\b",
-        r"\bOASA\s*/\s*VZAE\s*/\s*VZAE\b",
-        r"\bVZAE\s*/\s*OASA\s*/\s*OASA\b",
-        r"\bSEM Directives Directives\b",
-        r"\bContact Our Immigration Lawyers In Switzerland\b[\s\S]*\bPractical Tips Before You Apply\b",
-    ]
-    for pattern in malformed_patterns:
-        if re.search(pattern, blog_content, flags=re.IGNORECASE):
-            errors.append(f"Malformed or undesirable output pattern found: {pattern}")
+    errors.extend(find_malformed_output_patterns(blog_content))
     capitalisation_artefacts = find_sentence_start_capitalisation_artefacts(blog_content)
     if capitalisation_artefacts:
         errors.append(
@@ -2224,31 +4791,118 @@ def validate_public_draft(draft: dict[str, Any]) -> list[str]:
     return errors
 
 
-def validate_legal_memo(memo: dict[str, Any]) -> list[str]:
+def legal_memo_issue_errors(issue: dict[str, Any], number: int) -> list[str]:
     errors: list[str] = []
+
+    confidence = issue.get("confidence")
+    if confidence == "low" and not args.allow_low_confidence_legal_memo:
+        errors.append(
+            f"Issue {number} has low confidence; support it with a specific provision from legal_sources "
+            "so it can be stated with at least medium confidence."
+        )
+
+    support = issue.get("support")
+    if not isinstance(support, list) or not support:
+        errors.append(f"Issue {number} has empty support; each issue must include at least one support item.")
+
+    if issue.get("authority_type") == "unclear":
+        errors.append(f"Issue {number} has authority_type='unclear', which is not allowed.")
+
+    return errors
+
+
+@traced(category="validate")
+def validate_legal_memo(memo: dict[str, Any]) -> list[str]:
     issues = memo.get("issues")
 
     if not isinstance(issues, list) or not issues:
-        errors.append("Legal memo must contain at least one issue.")
-        return errors
+        return ["Legal memo must contain at least one issue."]
 
+    errors: list[str] = []
     for index, issue in enumerate(issues, start=1):
-        confidence = issue.get("confidence")
-        if confidence == "low" and not args.allow_low_confidence_legal_memo:
-            errors.append(
-                f"Issue {index} has low confidence; rerun with --allow-low-confidence-legal-memo only if intentional."
-            )
+        errors.extend(legal_memo_issue_errors(issue, index))
+    return errors
 
-        support = issue.get("support")
-        if not isinstance(support, list) or not support:
-            errors.append(f"Issue {index} has empty support; each issue must include at least one support item.")
 
-        if issue.get("authority_type") == "unclear":
-            errors.append(f"Issue {index} has authority_type='unclear', which is not allowed.")
+def failing_memo_issues(memo: dict[str, Any]) -> dict[int, list[str]]:
+    """Validation errors per failing issue, keyed by the issue's 1-based index."""
+    issues = memo.get("issues")
+    if not isinstance(issues, list):
+        return {}
+    failing: dict[int, list[str]] = {}
+    for index, issue in enumerate(issues, start=1):
+        errors = legal_memo_issue_errors(issue, index)
+        if errors:
+            failing[index] = errors
+    return failing
 
-    return errors
 
+def merge_memo_repair(
+    memo: dict[str, Any],
+    repair: dict[str, Any],
+    failing: dict[int, list[str]],
+) -> dict[str, Any] | None:
+    """
+    Splice corrected issues back into the memo by index.
+
+    Entries for indexes that were not sent for repair are ignored.  Returns
+    None when any failing issue came back null or not at all: the repair
+    failed, and no legal issue is ever dropped from the memo.
+    """
+    replacements: dict[int, dict[str, Any]] = {}
+    for entry in repair.get("issues", []):
+        index = entry.get("index")
+        if index in failing and index not in replacements and entry.get("issue") is not None:
+            replacements[index] = entry["issue"]
+    if set(replacements) != set(failing):
+        return None
+
+    issues = [replacements.get(index, issue) for index, issue in enumerate(memo.get("issues", []), start=1)]
+    return {**memo, "issues": issues}
 
+
+@dataclass
+class LegalMemoStats:
+    memos_generated: int = 0
+    first_attempt_valid: int = 0
+    issue_repairs: int = 0
+    full_regenerations: int = 0
+    issues_repaired: int = 0
+    repairs_failed: int = 0
+    failed: int = 0
+
+
+class LegalMemoRecorder:
+    """How often legal memos needed another attempt, and whether it was an issue repair or a full regeneration."""
+
+    def __init__(self) -> None:
+        self.stats = LegalMemoStats()
+        self._lock = threading.Lock()
+
+    def record(self, *, attempts: list[str], valid: bool, issues_repaired: int, repairs_failed: int) -> None:
+        with self._lock:
+            self.stats.memos_generated += 1
+            if valid and attempts == ["full"]:
+                self.stats.first_attempt_valid += 1
+            self.stats.issue_repairs += attempts.count("repair")
+            self.stats.full_regenerations += attempts[1:].count("full")
+            self.stats.issues_repaired += issues_repaired
+            self.stats.repairs_failed += repairs_failed
+            if not valid:
+                self.stats.failed += 1
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            stats = asdict(self.stats)
+        retries = stats["issue_repairs"] + stats["full_regenerations"]
+        stats["retry_rate"] = round(retries / stats["memos_generated"], 3) if stats["memos_generated"] else 0.0
+        return stats
+
+
+LEGAL_MEMO_STATS = LegalMemoRecorder()
+
+
+@traced(category="validate")
 def validate_reader_flow(draft: dict[str, Any], reader_journey: dict[str, Any]) -> list[str]:
     errors: list[str] = []
 
@@ -2294,28 +4948,292 @@ def validate_reader_flow(draft: dict[str, Any], reader_journey: dict[str, Any])
                 "Question-led title is not answered directly in the opening section."
             )
 
-    headings = [
-        re.sub(r"^\*\*|\*\*$", "", block).strip().lower()
-        for block in blocks
-        if is_bold_heading(block)
-    ]
+    headings = [
+        re.sub(r"^\*\*|\*\*$", "", block).strip().lower()
+        for block in blocks
+        if is_bold_heading(block)
+    ]
+
+    repeated_heading_stems = [
+        "practical",
+        "evidence",
+        "timing",
+        "next step",
+        "what this means",
+    ]
+
+    for stem in repeated_heading_stems:
+        count = sum(1 for heading in headings if stem in heading)
+        if count > 2:
+            errors.append(
+                f"Too many headings appear to cover the same theme: '{stem}'."
+            )
+
+    return errors
+
+
+def public_draft_error_blocks(blocks: list[str], error: str) -> list[int] | None:
+    """
+    Indexes of the blocks a validate_public_draft error is about.
+
+    Title errors concern no block and return [].  Errors about the draft as a
+    whole (word count, missing content, patterns spanning blocks) return None.
+    """
+    cta_block = f"**{CTA_HEADING}**"
+    if is_title_error(error):
+        return []
+    if error.startswith("Malformed or undesirable output pattern found: "):
+        pattern = error.split(": ", 1)[1]
+        return [i for i, block in enumerate(blocks) if re.search(pattern, block, flags=re.IGNORECASE)] or None
+    if error.startswith("Sentence-start capitalisation artefacts"):
+        return [i for i, block in enumerate(blocks) if find_sentence_start_capitalisation_artefacts(block)] or None
+    if error.startswith("Empty heading detected"):
+        # The message prefix has exactly one ": "; the heading itself may contain more.
+        heading = error.split(": ", 1)[1].strip()
+        return [i for i, block in enumerate(blocks) if block.strip() == heading] or None
+    if error.startswith("CTA") and cta_block in blocks:
+        return list(range(blocks.index(cta_block), len(blocks)))
+    if error.startswith("Too many practical"):
+        return [i for i, block in enumerate(blocks) if is_practical_heading(block)] or None
+    if error.startswith("The final") and blocks:
+        return [len(blocks) - 1]
+    return None
+
+
+def reader_flow_error_blocks(blocks: list[str], error: str) -> list[int] | None:
+    """Indexes of the blocks a validate_reader_flow error is about, or None."""
+    if error.startswith(("The draft does not appear to answer", "Question-led title")):
+        return list(range(min(5, len(blocks))))
+    theme = re.match(r"Too many headings appear to cover the same theme: '(.+)'\.", error)
+    if theme:
+        return [
+            i for i, block in enumerate(blocks) if is_bold_heading(block) and theme.group(1) in block.lower()
+        ] or None
+    return None
+
+
+def locate_draft_errors(
+    draft: dict[str, Any],
+    errors: list[str],
+    locate: Callable[[list[str], str], list[int] | None],
+) -> list[dict[str, Any]] | None:
+    """
+    Pair each error with the blocks it concerns; None if any error cannot be tied to blocks.
+
+    Only a title error may concern no block; any other error located in no
+    block is treated as unlocated, so the draft gets a full repair.
+    """
+    blocks = split_blocks(draft.get("blog_content", ""))
+    located: list[dict[str, Any]] = []
+    for error in errors:
+        indexes = locate(blocks, error)
+        if indexes is None or (not indexes and not is_title_error(error)):
+            return None
+        located.append({"error": error, "blocks": indexes})
+    return located
+
+
+def read_partial_json_string(buffer: str, key: str) -> tuple[str, bool] | None:
+    """
+    Decode as much of the string value of `key` as has arrived in a partial JSON object.
+
+    Returns (decoded prefix, complete) or None while the key has not started.
+    An escape sequence split across deltas is left for the next call.
+    """
+    match = re.search(r'"' + re.escape(key) + r'"\s*:\s*"', buffer)
+    if match is None:
+        return None
+
+    index = match.end()
+    safe_end = index
+    complete = False
+    while index < len(buffer):
+        char = buffer[index]
+        if char == '"':
+            complete = True
+            break
+        if char == "\\":
+            width = 6 if buffer[index + 1 : index + 2] == "u" else 2
+            if index + width > len(buffer):
+                break
+            index += width
+        else:
+            index += 1
+        safe_end = index
+
+    return json.loads('"' + buffer[match.end() : safe_end] + '"'), complete
+
+
+class DraftStreamMonitor:
+    """
+    Checks a streamed DRAFT_SCHEMA output block by block while it arrives.
+
+    Each completed block of blog_content is passed through the block-local
+    normalisers from normalise_draft_output and the cheap per-block checks
+    from validate_public_draft.  It never cancels the stream: the completed
+    draft goes through normalise_draft_output and repair like any other,
+    and the warnings and whether a CTA heading arrived are reported under
+    draft_stream in the run artifacts.
+    """
+
+    def __init__(self) -> None:
+        self.blocks: list[str] = []
+        self.warnings: list[str] = []
+        self._buffer = ""
+        self._seen_cta = False
+
+    @staticmethod
+    def normalise_block(block: str) -> str:
+        block = replace_legal_abbreviation_style(block)
+        block = replace_sem_directives_terms(block)
+        block = remove_forbidden_public_phrases(block)
+        block = replace_ai_source_phrases(block)
+        block = replace_informal_c_permit_terms(block)
+        block = replace_person_references(block)
+        return repair_sentence_start_capitalisation(block)
+
+    def feed(self, delta: str) -> None:
+        self._buffer += delta
+        content = read_partial_json_string(self._buffer, "blog_content")
+        if content is None:
+            return
+
+        text, complete = content
+        completed = split_blocks(text)
+        if not complete:
+            # The last block may still be growing.
+            completed = completed[:-1]
+        for block in completed[len(self.blocks):]:
+            self.blocks.append(block)
+            self._check_block(block)
+
+    def _check_block(self, block: str) -> None:
+        normalised = self.normalise_block(block)
+        self.warnings.extend(
+            f"Block {len(self.blocks)}: {error}" for error in find_malformed_output_patterns(normalised)
+        )
+
+        heading = re.sub(r"^\*\*|\*\*$", "", normalised.strip()).strip()
+        if is_bold_heading(normalised) and heading.casefold() == CTA_HEADING.casefold():
+            self._seen_cta = True
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "blocks_checked": len(self.blocks),
+            "cta_heading_seen": self._seen_cta,
+            "warnings": self.warnings,
+        }
+
+
+def is_title_error(error: str) -> bool:
+    return error.startswith("blog_title") and "must not be empty" not in error
+
+
+def title_candidate_score(title: str) -> tuple[int, int]:
+    """Sort key for title candidates: validate_title_style errors, then characters beyond the preferred 75."""
+    normalized = re.sub(r"\s+", " ", title).strip()
+    return len(validate_title_style(normalized)), max(0, len(normalized) - 75)
+
+
+def regenerate_title(
+    openai_api_key: str,
+    *,
+    topic_entry: dict[str, Any],
+    draft: dict[str, Any],
+    title_errors: list[str],
+) -> dict[str, Any] | None:
+    """
+    Ask for several title candidates in one small foreground call and splice in the best passing one.
+
+    Returns None when no candidate passes validate_title_style, so the
+    caller can fall back to a draft repair.
+    """
+    candidates = call_responses_api(
+        openai_api_key,
+        instructions=TITLE_INSTRUCTIONS,
+        input_text=build_title_input(topic_entry, draft, title_errors),
+        schema=TITLE_CANDIDATES_SCHEMA,
+        model=OPENAI_MODEL,
+        stage="title",
+        cache=False,
+    )
+    titles = [re.sub(r"\s+", " ", title).strip() for title in candidates.get("titles", []) if title.strip()]
+    if not titles:
+        return None
+    best = min(titles, key=title_candidate_score)
+    if title_candidate_score(best)[0]:
+        return None
+    return {**draft, "blog_title": best}
+
+
+def apply_draft_patch(draft: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
+    """Apply block-level patch operations (indexes refer to the unpatched blocks); raise ValueError if invalid."""
+    blocks = split_blocks(draft.get("blog_content", ""))
+    replaced: dict[int, list[str]] = {}
+    inserted: dict[int, list[str]] = {}
+    deleted: set[int] = set()
+
+    for operation in patch.get("operations", []):
+        op = operation.get("op")
+        index = operation.get("index")
+        new_blocks = [block for block in operation.get("blocks", []) if block.strip()]
+        if not isinstance(index, int) or not -1 <= index < len(blocks) or (index == -1 and op != "insert_after"):
+            raise ValueError(f"Patch operation index out of range: {operation}")
+        if op == "replace":
+            replaced[index] = new_blocks
+        elif op == "insert_after":
+            inserted.setdefault(index, []).extend(new_blocks)
+        elif op == "delete":
+            deleted.add(index)
+        else:
+            raise ValueError(f"Unknown patch operation: {operation}")
 
-    repeated_heading_stems = [
-        "practical",
-        "evidence",
-        "timing",
-        "next step",
-        "what this means",
-    ]
+    patched = list(inserted.get(-1, []))
+    for index, block in enumerate(blocks):
+        if index in replaced:
+            patched.extend(replaced[index])
+        elif index not in deleted:
+            patched.append(block)
+        patched.extend(inserted.get(index, []))
 
-    for stem in repeated_heading_stems:
-        count = sum(1 for heading in headings if stem in heading)
-        if count > 2:
-            errors.append(
-                f"Too many headings appear to cover the same theme: '{stem}'."
-            )
+    return {
+        **draft,
+        "blog_title": patch.get("blog_title") or draft.get("blog_title", ""),
+        "blog_content": "\n\n".join(block.strip() for block in patched),
+    }
 
-    return errors
+
+def request_targeted_repair(
+    openai_api_key: str,
+    *,
+    stage: str,
+    topic_entry: dict[str, Any],
+    draft: dict[str, Any],
+    located_errors: list[dict[str, Any]],
+    guardrails: str,
+    context: dict[str, Any] | None = None,
+) -> dict[str, Any] | None:
+    """Request patch operations for the located errors; return the patched draft, or None if the patch is unusable."""
+    patch = call_responses_api(
+        openai_api_key,
+        instructions=TARGETED_REPAIR_INSTRUCTIONS,
+        input_text=build_targeted_repair_input(
+            topic_entry,
+            draft,
+            located_errors,
+            guardrails=guardrails,
+            context=context,
+        ),
+        schema=DRAFT_PATCH_SCHEMA,
+        model=OPENAI_MODEL,
+        background=True,
+        stage=stage,
+        cache=False,
+    )
+    try:
+        return apply_draft_patch(draft, patch)
+    except ValueError:
+        return None
 
 
 def flow_repair_draft_if_needed(
@@ -2326,6 +5244,7 @@ def flow_repair_draft_if_needed(
     memo: dict[str, Any],
     reader_journey: dict[str, Any],
     draft: dict[str, Any],
+    checkpoints: StageCheckpoints | None = None,
 ) -> dict[str, Any]:
     current = draft
     errors = validate_reader_flow(current, reader_journey)
@@ -2333,22 +5252,39 @@ def flow_repair_draft_if_needed(
     if not errors:
         return current
 
-    repaired = call_responses_api(
-        openai_api_key,
-        instructions=FLOW_REPAIR_INSTRUCTIONS,
-        input_text=build_flow_repair_input(
-            topic_entry=topic_entry,
-            classifier=classifier,
-            memo=memo,
-            reader_journey=reader_journey,
-            draft=current,
-            flow_errors=errors,
-        ),
-        schema=DRAFT_SCHEMA,
-        model=OPENAI_MODEL,
-        background=True,
-    )
+    def request_flow_repair() -> dict[str, Any]:
+        located = locate_draft_errors(current, errors, reader_flow_error_blocks)
+        if args.repair_mode == "targeted" and located is not None:
+            patched = request_targeted_repair(
+                openai_api_key,
+                stage="targeted_flow_repair",
+                topic_entry=topic_entry,
+                draft=current,
+                located_errors=located,
+                guardrails=FLOW_REPAIR_GUARDRAILS,
+                context={"reader_journey_plan": reader_journey},
+            )
+            if patched is not None:
+                return patched
+        return call_responses_api(
+            openai_api_key,
+            instructions=FLOW_REPAIR_INSTRUCTIONS,
+            input_text=build_flow_repair_input(
+                topic_entry=topic_entry,
+                classifier=classifier,
+                memo=memo,
+                reader_journey=reader_journey,
+                draft=current,
+                flow_errors=errors,
+            ),
+            schema=DRAFT_SCHEMA,
+            model=OPENAI_MODEL,
+            background=True,
+            stage="flow_repair",
+            cache=False,
+        )
 
+    repaired = checkpoints.run("flow_repair", request_flow_repair) if checkpoints else request_flow_repair()
     return normalise_draft_output(repaired, topic_entry, classifier)
 
 
@@ -2359,35 +5295,196 @@ def repair_draft_if_needed(
     classifier: dict[str, Any],
     memo: dict[str, Any],
     draft: dict[str, Any],
+    checkpoints: StageCheckpoints | None = None,
 ) -> dict[str, Any]:
-    current = draft
-    errors = validate_public_draft(current)
+    current, errors = repair_draft_locally(draft)
     if not errors:
         return current
 
-    for _ in range(MAX_REPAIR_ATTEMPTS):
-        repaired = call_responses_api(
-            openai_api_key,
-            instructions=REPAIR_INSTRUCTIONS,
-            input_text=build_repair_input(
+    # Repairs checkpointed by an earlier run of this topic are replayed first; a
+    # resumed run then gets a fresh MAX_REPAIR_ATTEMPTS from the latest one.
+    replayed = checkpoints.attempts("repair") if checkpoints else []
+    for repaired in replayed:
+        current, errors = repair_draft_locally(normalise_draft_output(repaired, topic_entry, classifier))
+        if not errors:
+            return current
+
+    for attempt in range(len(replayed) + 1, len(replayed) + MAX_REPAIR_ATTEMPTS + 1):
+        repaired: dict[str, Any] | None = None
+        if all(is_title_error(error) for error in errors):
+            repaired = regenerate_title(openai_api_key, topic_entry=topic_entry, draft=current, title_errors=errors)
+        located = locate_draft_errors(current, errors, public_draft_error_blocks)
+        if repaired is None and args.repair_mode == "targeted" and located is not None:
+            repaired = request_targeted_repair(
+                openai_api_key,
+                stage="targeted_repair",
                 topic_entry=topic_entry,
-                classifier=classifier,
-                memo=memo,
                 draft=current,
-                validation_errors=errors,
-            ),
-            schema=DRAFT_SCHEMA,
-            model=OPENAI_MODEL,
-            background=True,
-        )
-        current = normalise_draft_output(repaired, topic_entry, classifier)
-        errors = validate_public_draft(current)
+                located_errors=located,
+                guardrails=REPAIR_GUARDRAILS,
+            )
+        if repaired is None:
+            repaired = call_responses_api(
+                openai_api_key,
+                instructions=REPAIR_INSTRUCTIONS,
+                input_text=build_repair_input(
+                    topic_entry=topic_entry,
+                    classifier=classifier,
+                    memo=memo,
+                    draft=current,
+                    validation_errors=errors,
+                ),
+                schema=DRAFT_SCHEMA,
+                model=OPENAI_MODEL,
+                background=True,
+                stage="repair",
+                cache=False,
+            )
+        if checkpoints:
+            checkpoints.save(f"repair_{attempt}", repaired)
+        current, errors = repair_draft_locally(normalise_draft_output(repaired, topic_entry, classifier))
         if not errors:
             return current
 
     raise RuntimeError("Public draft validation failed after repair:\n- " + "\n- ".join(errors))
 
 
+@dataclass
+class DraftSpeculationStats:
+    runs: int = 0
+    candidates_requested: int = 0
+    candidates_completed: int = 0
+    candidates_cancelled: int = 0
+    repairs_avoided: int = 0
+
+
+class DraftSpeculationRecorder:
+    """How often speculative draft candidates produced a valid draft without a repair round-trip."""
+
+    def __init__(self) -> None:
+        self.stats = DraftSpeculationStats()
+        self._lock = threading.Lock()
+
+    def record(self, *, requested: int, completed: int, cancelled: int, repair_avoided: bool) -> None:
+        with self._lock:
+            self.stats.runs += 1
+            self.stats.candidates_requested += requested
+            self.stats.candidates_completed += completed
+            self.stats.candidates_cancelled += cancelled
+            self.stats.repairs_avoided += int(repair_avoided)
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **asdict(self.stats),
+                "repair_avoided_rate": (
+                    round(self.stats.repairs_avoided / self.stats.runs, 3) if self.stats.runs else None
+                ),
+            }
+
+
+DRAFT_SPECULATION = DraftSpeculationRecorder()
+
+
+def draft_candidate_variants(
+    topic_entry: dict[str, Any],
+    classifier: dict[str, Any],
+    count: int,
+) -> list[dict[str, Any]]:
+    """The selected structure variant first, then the others in order; at most one candidate per variant."""
+    selected = select_article_structure_variant(topic_entry, classifier)
+    others = [variant for variant in ARTICLE_STRUCTURE_VARIANTS if variant["name"] != selected["name"]]
+    return ([selected] + others)[: max(1, count)]
+
+
+async def async_speculative_draft(
+    openai_api_key: str,
+    *,
+    topic_entry: dict[str, Any],
+    classifier: dict[str, Any],
+    memo: dict[str, Any],
+    reader_journey: dict[str, Any],
+    website_context: str,
+    candidates: int,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Request one draft per structure variant concurrently; return (raw draft, report).
+
+    Each candidate is scored by draft_output_errors as it arrives, so errors
+    repair_draft_locally fixes do not count.  The first without errors wins
+    and the requests still running are cancelled.  If none passes, the
+    candidate with the fewest errors is returned and goes through repair.  A
+    repair counts as avoided only when the primary variant completed with
+    errors (or failed) and another candidate had none.
+    """
+    variants = draft_candidate_variants(topic_entry, classifier, candidates)
+    tasks = {
+        asyncio.create_task(
+            async_call_responses_api(
+                openai_api_key,
+                instructions=DRAFT_INSTRUCTIONS,
+                input_text=build_draft_input(
+                    topic_entry,
+                    classifier,
+                    memo,
+                    reader_journey,
+                    website_context,
+                    structure_variant=variant,
+                ),
+                schema=DRAFT_SCHEMA,
+                model=OPENAI_MODEL,
+                background=True,
+                stage="draft",
+                validate=lambda raw_draft: draft_output_errors(raw_draft, topic_entry, classifier, reader_journey),
+            )
+        ): variant
+        for variant in variants
+    }
+
+    outcomes: list[dict[str, Any]] = []
+    best: tuple[int, dict[str, Any], str] | None = None
+    failures: list[str] = []
+    pending = set(tasks)
+    while pending and (best is None or best[0] > 0):
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            variant_name = tasks[task]["name"]
+            try:
+                raw_draft = task.result()
+            except Exception as exc:
+                failures.append(f"{variant_name}: {exc}")
+                outcomes.append({"variant": variant_name, "status": "failed"})
+                continue
+            error_count = len(draft_output_errors(raw_draft, topic_entry, classifier, reader_journey))
+            outcomes.append({"variant": variant_name, "status": "completed", "validation_errors": error_count})
+            if best is None or error_count < best[0]:
+                best = (error_count, raw_draft, variant_name)
+
+    for task in pending:
+        task.cancel()
+        outcomes.append({"variant": tasks[task]["name"], "status": "cancelled"})
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    if best is None:
+        raise RuntimeError("Every draft candidate failed:\n- " + "\n- ".join(failures))
+
+    primary_outcome = next(outcome for outcome in outcomes if outcome["variant"] == variants[0]["name"])
+    primary_needed_repair = primary_outcome["status"] == "failed" or primary_outcome.get("validation_errors", 0) > 0
+    repair_avoided = best[0] == 0 and best[2] != variants[0]["name"] and primary_needed_repair
+    DRAFT_SPECULATION.record(
+        requested=len(variants),
+        completed=sum(1 for outcome in outcomes if outcome["status"] == "completed"),
+        cancelled=len(pending),
+        repair_avoided=repair_avoided,
+    )
+    return best[1], {
+        "selected_variant": best[2],
+        "repair_avoided": repair_avoided,
+        "candidates": outcomes,
+    }
+
+
+@traced(category="normalise")
 def ensure_italic_disclaimer_at_end(blog_content: str) -> str:
     blocks = split_blocks(blog_content)
     if not blocks:
@@ -2492,6 +5589,7 @@ PRACTICAL_FALLBACKS = {
 }
 
 
+@traced(category="normalise")
 def ensure_reader_usefulness_content(
     blog_content: str,
     topic_entry: dict[str, Any],
@@ -2582,6 +5680,7 @@ def ensure_reader_usefulness_content(
     return "\n\n".join(blocks)
 
 
+@traced(category="normalise")
 def enforce_max_blog_words(blog_content: str, max_words: int) -> str:
     if count_words(blog_content) <= max_words:
         return blog_content
@@ -2620,6 +5719,7 @@ def enforce_max_blog_words(blog_content: str, max_words: int) -> str:
     return "\n\n".join(blocks)
 
 
+@traced(category="normalise")
 def ensure_cta_requirements(blog_content: str) -> str:
     blocks = split_blocks(blog_content)
     if not blocks:
@@ -2683,6 +5783,7 @@ def ensure_cta_requirements(blog_content: str) -> str:
     return "\n\n".join(updated_blocks)
 
 
+@traced()
 def normalise_draft_output(
     draft: dict[str, Any],
     topic_entry: dict[str, Any],
@@ -2723,6 +5824,181 @@ def normalise_draft_output(
     return cleaned
 
 
+def draft_output_errors(
+    raw_draft: dict[str, Any],
+    topic_entry: dict[str, Any],
+    classifier: dict[str, Any],
+    reader_journey: dict[str, Any],
+) -> list[str]:
+    """
+    Errors that would send a raw draft to an API repair: reader-flow errors once normalised, plus the
+    public-draft errors repair_draft_locally cannot fix.  Only a draft without any is cached.
+    """
+    draft = normalise_draft_output(raw_draft, topic_entry, classifier)
+    _, public_errors = repair_draft_locally(draft, record_stats=False)
+    return validate_reader_flow(draft, reader_journey) + public_errors
+
+
+# ============================================================
+# Local repair
+# ============================================================
+
+def merge_excess_practical_sections(blog_content: str) -> str:
+    """Drop practical headings beyond MAX_PRACTICAL_SECTIONS, folding their text into the preceding section."""
+    blocks = split_blocks(blog_content)
+    kept: list[str] = []
+    practical_seen = 0
+    for block in blocks:
+        if is_practical_heading(block) and block.strip() != f"**{CTA_HEADING}**":
+            practical_seen += 1
+            if practical_seen > MAX_PRACTICAL_SECTIONS:
+                continue
+        kept.append(block)
+    return "\n\n".join(kept)
+
+
+def move_cta_section_to_end(blog_content: str) -> str:
+    """
+    Leave exactly one CTA section, placed after all other sections and before the disclaimer.
+
+    Several CTA sections are merged into one, their bodies in order with
+    repeated blocks dropped.  A draft without a CTA heading is returned
+    unchanged for the model repair to write one.  Sections that follow the
+    CTA are moved in front of it, and contact-sentence blocks are moved to
+    the end of the CTA body.  ensure_cta_requirements then supplies any
+    missing lawyer-value paragraph or contact sentence.
+    """
+    cta_block = f"**{CTA_HEADING}**"
+    blocks = split_blocks(blog_content)
+    if not any(block.strip() == cta_block for block in blocks):
+        return blog_content
+    body = [block for block in blocks if not is_disclaimer_block(block)]
+    disclaimers = [block for block in blocks if is_disclaimer_block(block)]
+
+    kept: list[str] = []
+    cta_body: list[str] = []
+    idx = 0
+    while idx < len(body):
+        if body[idx].strip() != cta_block:
+            kept.append(body[idx])
+            idx += 1
+            continue
+        section_end = next(
+            (end for end in range(idx + 1, len(body)) if is_bold_heading(body[end])),
+            len(body),
+        )
+        cta_body.extend(block for block in body[idx + 1 : section_end] if block not in cta_body)
+        idx = section_end
+    body = kept
+
+    contact_blocks = [block for block in cta_body if CTA_PHONE in block]
+    cta_body = [block for block in cta_body if CTA_PHONE not in block] + contact_blocks
+    return ensure_cta_requirements("\n\n".join(body + [cta_block] + cta_body + disclaimers))
+
+
+def repair_malformed_output_patterns(blog_content: str) -> str:
+    cleaned = replace_informal_c_permit_terms(replace_legal_abbreviation_style(blog_content))
+    cleaned = replace_legal_abbreviation_style(cleaned)
+    cleaned = re.sub(r"\bSEM Directives(?:\s+Directives)+\b", "SEM Directives", cleaned, flags=re.IGNORECASE)
+    cleaned = re.sub(r"\b(The) an\b", r"\1", cleaned, flags=re.IGNORECASE)
+    return cleaned
+
+
+# Validator error prefixes that a local rewrite of blog_content fixes without
+# an API call, in the order the rewrites are applied.  The CTA rewrite also
+# fixes the "Contact ... Practical Tips Before You Apply" malformed pattern.
+LOCAL_REPAIR_RULES: list[tuple[str, str, Callable[[str], str]]] = [
+    (
+        "cta_section",
+        r"^(?:Expected exactly one CTA heading|CTA |Malformed or undesirable output pattern found: "
+        r"\\bContact Our Immigration Lawyers)",
+        move_cta_section_to_end,
+    ),
+    ("malformed_patterns", r"^Malformed or undesirable output pattern found", repair_malformed_output_patterns),
+    ("capitalisation", r"^Sentence-start capitalisation artefacts", repair_sentence_start_capitalisation),
+    ("practical_sections", r"^Too many practical", merge_excess_practical_sections),
+    ("empty_headings", r"^Empty heading detected", remove_empty_headings),
+    ("word_limit", r"^blog_content exceeds MAX_BLOG_WORDS", lambda text: enforce_max_blog_words(text, MAX_BLOG_WORDS)),
+    ("disclaimer", r"^The final (?:block must be a disclaimer|disclaimer must be italicised)", ensure_italic_disclaimer_at_end),
+]
+LOCAL_REPAIR_MAX_PASSES = 3
+
+
+@dataclass
+class LocalRepairStats:
+    drafts_checked: int = 0
+    errors_seen: int = 0
+    errors_fixed: int = 0
+    api_repairs_avoided: int = 0
+    escalated: int = 0
+
+
+class LocalRepairRecorder:
+    """Validator errors fixed by LOCAL_REPAIR_RULES, and how many API repair calls that saved."""
+
+    def __init__(self) -> None:
+        self.stats = LocalRepairStats()
+        self.rules: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, *, errors_before: int, errors_after: int, rules: list[str]) -> None:
+        with self._lock:
+            self.stats.drafts_checked += 1
+            self.stats.errors_seen += errors_before
+            self.stats.errors_fixed += errors_before - errors_after
+            if errors_before and not errors_after:
+                self.stats.api_repairs_avoided += 1
+            if errors_after:
+                self.stats.escalated += 1
+            for rule in rules:
+                self.rules[rule] = self.rules.get(rule, 0) + 1
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            return {**asdict(self.stats), "rules_applied": dict(sorted(self.rules.items()))}
+
+
+LOCAL_REPAIR = LocalRepairRecorder()
+
+
+@traced()
+def repair_draft_locally(draft: dict[str, Any], *, record_stats: bool = True) -> tuple[dict[str, Any], list[str]]:
+    """
+    Fix the mechanically fixable validate_public_draft errors; return (draft, remaining errors).
+
+    Each pass applies the rules matching the current errors and keeps the
+    result only if it leaves fewer errors, so a rule can never make a draft
+    worse.  What remains is left for an API repair.  Scoring a draft without
+    keeping the result passes record_stats=False.
+    """
+    current = draft
+    errors = validate_public_draft(current)
+    errors_before = len(errors)
+    applied: list[str] = []
+
+    for _ in range(LOCAL_REPAIR_MAX_PASSES):
+        rules = [
+            (name, fix)
+            for name, pattern, fix in LOCAL_REPAIR_RULES
+            if any(re.search(pattern, error) for error in errors)
+        ]
+        if not rules:
+            break
+        content = current.get("blog_content", "")
+        for _, fix in rules:
+            content = fix(content)
+        candidate = {**current, "blog_content": re.sub(r"\n{3,}", "\n\n", content).strip()}
+        candidate_errors = validate_public_draft(candidate)
+        if len(candidate_errors) >= len(errors):
+            break
+        current, errors = candidate, candidate_errors
+        applied.extend(name for name, _ in rules)
+
+    if record_stats:
+        LOCAL_REPAIR.record(errors_before=errors_before, errors_after=len(errors), rules=applied)
+    return current, errors
+
+
 # ============================================================
 # HTML rendering
 # ============================================================
@@ -2783,6 +6059,7 @@ def render_list_block(block: str) -> str | None:
     return "\n".join(html)
 
 
+@traced(category="render")
 def blog_content_to_html(blog_title: str, blog_content: str) -> str:
     blocks = split_blocks(blog_content)
     html_parts: list[str] = [f"<h2>{escape_html(blog_title)}</h2>"]
@@ -2819,6 +6096,7 @@ def blog_content_to_html(blog_title: str, blog_content: str) -> str:
 # Email rendering
 # ============================================================
 
+@traced(category="render")
 def render_success_email(
     *,
     topic_entry: dict[str, Any],
@@ -2860,89 +6138,524 @@ def render_success_email(
 
 
 # ============================================================
-# Main workflow
+# Classifier prebatch
 # ============================================================
 
-def main() -> None:
-    topics = load_topics(TOPICS_PATH)
-    topic_index, topic_entry, remaining_count = pick_topic(topics, args.topic_index)
+OPENAI_BATCH_COMPLETION_WINDOW = "24h"
 
-    authority_map = load_authority_pack_map(AUTHORITY_MAP_PATH)
-    selected_pack_paths = resolve_authority_pack_paths(topic_entry, authority_map)
 
-    if args.dry_run:
-        print(
+def build_classifier_payload(topic_entry: dict[str, Any]) -> dict[str, Any]:
+    return build_responses_payload(
+        instructions=CLASSIFIER_INSTRUCTIONS,
+        input_text=build_classifier_input(topic_entry),
+        schema=CLASSIFIER_SCHEMA,
+        model=OPENAI_MODEL,
+        prompt_cache_key=stage_prompt_cache_key("classifier", CLASSIFIER_INSTRUCTIONS, CLASSIFIER_SCHEMA),
+    )
+
+
+def build_classifier_batch_jsonl(topics: list[dict[str, Any]], limit: int) -> tuple[bytes, int]:
+    """Return Batch API input lines for the next `limit` unused topics without a cached classifier, and their count."""
+    lines: list[str] = []
+    unused = [(index, topic_entry) for index, topic_entry in enumerate(topics) if topic_entry.get("status") == "unused"]
+    for index, topic_entry in unused[: max(0, limit)]:
+        payload = build_classifier_payload(topic_entry)
+        cache_key = responses_cache_key(payload)
+        if CLASSIFIER_CACHE.get(cache_key) is not None:
+            continue
+        lines.append(
             json.dumps(
-                {
-                    "selected_topic": topic_entry,
-                    "remaining_unused": remaining_count,
-                    "mapped_authority_packs": [
-                        {
-                            "path": str(path.relative_to(SCRIPT_DIR)),
-                            "exists": path.exists(),
-                            "suffix": path.suffix,
-                        }
-                        for path in selected_pack_paths
-                    ],
-                    "selected_article_structure_variant": select_article_structure_variant(topic_entry),
-                    "expected_retrieval_queries": [
-                        topic_entry.get("topic", ""),
-                        topic_entry.get("angle", ""),
-                        topic_entry.get("subtopic", ""),
-                        topic_entry.get("pillar", ""),
-                    ],
-                },
+                {"custom_id": f"{cache_key}:{index}", "method": "POST", "url": "/v1/responses", "body": payload},
                 ensure_ascii=False,
-                indent=2,
             )
         )
-        return
+    return ("\n".join(lines) + "\n").encode("utf-8") if lines else b"", len(lines)
+
+
+def encode_multipart_form(fields: dict[str, str], filename: str, content: bytes) -> tuple[bytes, str]:
+    boundary = f"----swiss-blog-{hashlib.sha256(content).hexdigest()[:24]}"
+    parts: list[bytes] = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode("utf-8")
+        )
+    parts.append(
+        (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+            "Content-Type: application/jsonl\r\n\r\n"
+        ).encode("utf-8")
+        + content
+        + b"\r\n"
+    )
+    parts.append(f"--{boundary}--\r\n".encode("utf-8"))
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+def ingest_classifier_batch_output(content: bytes) -> tuple[int, int]:
+    """Store successful lines of a Batch API output file in CLASSIFIER_CACHE; return (stored, failed)."""
+    stored = failed = 0
+    for line in content.decode("utf-8").splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        cache_key = str(result.get("custom_id", "")).split(":", 1)[0]
+        response = result.get("response") or {}
+        if result.get("error") or response.get("status_code") != 200:
+            failed += 1
+            continue
+        try:
+            output = parse_responses_output(response.get("body") or {})
+        except (RuntimeError, ValueError):
+            failed += 1
+            continue
+        CLASSIFIER_CACHE.put(cache_key, output, stage="classifier_batch")
+        stored += 1
+    return stored, failed
+
+
+def poll_classifier_batch(openai_api_key: str, batch_id: str) -> dict[str, Any]:
+    """Check a submitted batch once and ingest its output if it has finished."""
+    headers = {"Authorization": f"Bearer {openai_api_key}"}
+    _, batch = get_json(f"{OPENAI_BASE_URL}/batches/{batch_id}", headers)
+    status = batch.get("status")
+    summary: dict[str, Any] = {"batch_id": batch_id, "status": status, "request_counts": batch.get("request_counts")}
+
+    if status == "completed":
+        stored = failed = 0
+        for file_key in ("output_file_id", "error_file_id"):
+            file_id = batch.get(file_key)
+            if not file_id:
+                continue
+            content = request_bytes("GET", f"{OPENAI_BASE_URL}/files/{file_id}/content", headers).body
+            file_stored, file_failed = ingest_classifier_batch_output(content)
+            stored += file_stored
+            failed += file_failed
+        summary.update(stored=stored, failed=failed)
+    return summary
+
+
+def prebatch_classifier(openai_api_key: str, topics: list[dict[str, Any]], limit: int) -> dict[str, Any]:
+    """
+    Advance the classifier batch by one step.
+
+    If a batch is pending, poll it once and store its results when it has
+    finished.  Otherwise submit a new batch covering those of the next
+    `limit` unused topics that have no cached classifier output, then poll
+    it once.
+    """
+    try:
+        with CLASSIFIER_BATCH_STATE_PATH.open("r", encoding="utf-8") as f:
+            pending = json.load(f)
+    except (OSError, ValueError):
+        pending = None
+
+    if pending is None:
+        content, request_count = build_classifier_batch_jsonl(topics, limit)
+        if not request_count:
+            return {"status": "up_to_date", "submitted": 0}
+
+        body, content_type = encode_multipart_form({"purpose": "batch"}, "classifier_batch.jsonl", content)
+        upload = request_bytes(
+            "POST",
+            f"{OPENAI_BASE_URL}/files",
+            {"Authorization": f"Bearer {openai_api_key}", "Content-Type": content_type},
+            body,
+        )
+        input_file_id = json.loads(upload.body)["id"]
+        _, batch = post_json(
+            f"{OPENAI_BASE_URL}/batches",
+            {
+                "input_file_id": input_file_id,
+                "endpoint": "/v1/responses",
+                "completion_window": OPENAI_BATCH_COMPLETION_WINDOW,
+                "metadata": {"purpose": "swiss-blog-classifier-prebatch"},
+            },
+            {"Authorization": f"Bearer {openai_api_key}", "Content-Type": "application/json"},
+        )
+        pending = {
+            "batch_id": batch["id"],
+            "submitted": request_count,
+            "submitted_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        CLASSIFIER_BATCH_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with CLASSIFIER_BATCH_STATE_PATH.open("w", encoding="utf-8") as f:
+            json.dump(pending, f, indent=2)
+
+    summary = {**pending, **poll_classifier_batch(openai_api_key, pending["batch_id"])}
+    if summary["status"] in {"completed", "failed", "expired", "cancelled"}:
+        CLASSIFIER_BATCH_STATE_PATH.unlink(missing_ok=True)
+    return summary
+
+
+def classify_topic(openai_api_key: str, topic_entry: dict[str, Any]) -> dict[str, Any]:
+    """Return the prebatched classifier output for the topic if there is one, else call the API."""
+    cached = CLASSIFIER_CACHE.get(responses_cache_key(build_classifier_payload(topic_entry)))
+    if cached is not None:
+        STAGE_TELEMETRY.record("classifier", request_bytes=0, usage=None, wall_seconds=0.0, cache_hit=True)
+        return cached
+
+    return call_responses_api(
+        openai_api_key,
+        instructions=CLASSIFIER_INSTRUCTIONS,
+        input_text=build_classifier_input(topic_entry),
+        schema=CLASSIFIER_SCHEMA,
+        model=OPENAI_MODEL,
+        stage="classifier",
+    )
+
+
+# ============================================================
+# Topic pipeline
+# ============================================================
+
+class KnowledgeBase:
+    """
+    Knowledge sources shared by every topic generated in one process.
+
+    Each folder and each legal authority pack is read at most once, on first
+    use, so a batch of topics pays for file reading and PDF extraction once.
+    When a current corpus built by --build-knowledge-index exists, chunks come
+    from it instead and their text is only read when used.
+    """
+
+    def __init__(self, authority_map: dict[str, Any]) -> None:
+        self.authority_map = authority_map
+        self.corpus = KnowledgeCorpus.open_if_current(KNOWLEDGE_CORPUS_PATH)
+        self._legal_authority_chunks: dict[Path, list[KnowledgeChunk]] = {}
+        self._folder_chunks: dict[tuple[Path, str], list[KnowledgeChunk]] = {}
+        self._file_digests: dict[Path, str] = {}
+        self._lock = threading.Lock()
+
+    def content_digest(self, paths: list[Path]) -> str:
+        """SHA-256 over the names and contents of the given files; each file is hashed at most once."""
+        digest = hashlib.sha256()
+        for path in paths:
+            with self._lock:
+                if path not in self._file_digests:
+                    self._file_digests[path] = (
+                        hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else "missing"
+                    )
+                file_digest = self._file_digests[path]
+            digest.update(f"{path.relative_to(SCRIPT_DIR)}:{file_digest}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def legal_authority_chunks(self, authority_paths: list[Path]) -> list[KnowledgeChunk]:
+        chunks: list[KnowledgeChunk] = []
+        for authority_path in authority_paths:
+            with self._lock:
+                if authority_path not in self._legal_authority_chunks:
+                    source_name = str(authority_path.relative_to(SCRIPT_DIR))
+                    if self.corpus is not None and source_name in self.corpus.files:
+                        self._legal_authority_chunks[authority_path] = self.corpus.file_chunks(source_name)
+                    else:
+                        self._legal_authority_chunks[authority_path] = load_selected_legal_authority_chunks(
+                            [authority_path]
+                        )
+                chunks.extend(self._legal_authority_chunks[authority_path])
+        return chunks
+
+    def folder_chunks(self, folder: Path, source_kind: str) -> list[KnowledgeChunk]:
+        with self._lock:
+            key = (folder, source_kind)
+            if key not in self._folder_chunks:
+                if self.corpus is not None and (folder, source_kind) in KNOWLEDGE_CORPUS_FOLDERS:
+                    self._folder_chunks[key] = self.corpus.kind_chunks(source_kind)
+                else:
+                    self._folder_chunks[key] = load_chunks_from_folder(folder, source_kind)
+            return self._folder_chunks[key]
+
+    def internal_note_chunks(self) -> list[KnowledgeChunk]:
+        return self.folder_chunks(INTERNAL_NOTES_DIR, "internal_legal_note")
+
+    def website_editorial_chunks(self) -> list[KnowledgeChunk]:
+        return self.folder_chunks(WEBSITE_EDITORIAL_DIR, "website_editorial")
+
+
+@dataclass
+class TimelineSpan:
+    name: str
+    thread: str
+    start: float
+    end: float
+
+
+class RunTimeline:
+    """Wall-clock spans of the pipeline steps of one topic, relative to the start of its run."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self.spans: list[TimelineSpan] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        start = time.perf_counter() - self.origin
+        try:
+            with TRACE.span(name):
+                yield
+        finally:
+            end = time.perf_counter() - self.origin
+            with self._lock:
+                self.spans.append(TimelineSpan(name, threading.current_thread().name, start, end))
+
+    def overlap_seconds(self, first: str, second: str) -> float:
+        """Seconds during which a span named first and a span named second were both running."""
+        with self._lock:
+            a_spans = [span for span in self.spans if span.name == first]
+            b_spans = [span for span in self.spans if span.name == second]
+        return sum(max(0.0, min(a.end, b.end) - max(a.start, b.start)) for a in a_spans for b in b_spans)
+
+    def report(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "name": span.name,
+                    "thread": span.thread,
+                    "start_seconds": round(span.start, 3),
+                    "end_seconds": round(span.end, 3),
+                }
+                for span in sorted(self.spans, key=lambda span: span.start)
+            ]
+
+
+def load_topic_knowledge(
+    knowledge: KnowledgeBase,
+    selected_pack_paths: list[Path],
+    timeline: RunTimeline,
+) -> tuple[list[KnowledgeChunk], list[KnowledgeChunk], list[KnowledgeChunk]]:
+    """Legal authority, internal note and website editorial chunks for one topic, read from disk if not yet loaded."""
+    with timeline.span("knowledge_load"):
+        with timeline.span("load_legal_authorities"):
+            legal_chunks = knowledge.legal_authority_chunks(selected_pack_paths)
+        with timeline.span("load_internal_notes"):
+            internal_note_chunks = knowledge.internal_note_chunks()
+        with timeline.span("load_website_editorial"):
+            website_editorial_chunks = knowledge.website_editorial_chunks()
+    return legal_chunks, internal_note_chunks, website_editorial_chunks
+
+
+def topic_run_base(topic_entry: dict[str, Any]) -> str:
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    slug = re.sub(r"[^a-z0-9]+", "-", topic_entry.get("topic", "untitled").lower()).strip("-")[:80]
+    return f"{timestamp}_{slug}"
+
+
+class StageCheckpoints:
+    """
+    Stage outputs of one run, saved under .cache/checkpoints/<run_base>/ as each stage completes.
+
+    Raw API outputs are stored, so normalisation and validation are replayed
+    on resume rather than trusted from disk.  Stages with several attempts
+    (legal memo, repair) are saved as <stage>_1, <stage>_2, ...
+    """
+
+    def __init__(self, run_base: str, directory: Path | None = None) -> None:
+        self.run_base = run_base
+        self.directory = directory or CHECKPOINT_DIR / run_base
+        self.resumed: list[str] = []
+        self.seeded: list[str] = []
+
+    def _path(self, name: str) -> Path:
+        return self.directory / f"{name}.json"
+
+    @staticmethod
+    def load_path(path: Path) -> dict[str, Any] | None:
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def load(self, name: str) -> dict[str, Any] | None:
+        return self.load_path(self._path(name))
+
+    def save(self, name: str, payload: dict[str, Any]) -> None:
+        path = self._path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+        tmp_path.replace(path)
+
+    def run(self, name: str, compute: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        payload = self.load(name)
+        if payload is not None:
+            self.resumed.append(name)
+            return payload
+        with TRACE.span(f"stage:{name}", "stage"):
+            payload = compute()
+        self.save(name, payload)
+        return payload
+
+    def attempts(self, stage: str) -> list[dict[str, Any]]:
+        payloads: list[dict[str, Any]] = []
+        while (payload := self.load(f"{stage}_{len(payloads) + 1}")) is not None:
+            payloads.append(payload)
+            self.resumed.append(f"{stage}_{len(payloads)}")
+        return payloads
+
+    def seed_from(self, directory: Path) -> None:
+        """Copy stages checkpointed in another directory (a prefetch) that are not checkpointed here yet."""
+        for path in sorted(directory.glob("*.json")):
+            if self._path(path.stem).exists():
+                continue
+            payload = self.load_path(path)
+            if payload is not None:
+                self.save(path.stem, payload)
+                self.seeded.append(path.stem)
 
-    openai_api_key = require_env("OPENAI_API_KEY")
-    require_env("SENDGRID_API_KEY")
+    def discard(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
 
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    slug = re.sub(r"[^a-z0-9]+", "-", topic_entry.get("topic", "untitled").lower()).strip("-")[:80]
-    run_base = f"{timestamp}_{slug}"
 
-    classifier = call_responses_api(
-        openai_api_key,
-        instructions=CLASSIFIER_INSTRUCTIONS,
-        input_text=build_classifier_input(topic_entry),
-        schema=CLASSIFIER_SCHEMA,
-        model=OPENAI_MODEL,
-    )
+def start_topic_checkpoints(run_base: str, topic_index: int, topic_entry: dict[str, Any]) -> StageCheckpoints:
+    checkpoints = StageCheckpoints(run_base)
+    checkpoints.save("topic", {"topic_index": topic_index, "topic": topic_entry})
+    return checkpoints
+
+
+def resume_topic_checkpoints(run_base: str, topics: list[dict[str, Any]]) -> tuple[int, StageCheckpoints]:
+    checkpoints = StageCheckpoints(run_base)
+    manifest = checkpoints.load("topic")
+    if manifest is None:
+        raise RuntimeError(f"No checkpoints to resume under {checkpoints.directory}")
+
+    topic_index = manifest["topic_index"]
+    if topic_index >= len(topics) or topics[topic_index].get("topic") != manifest["topic"].get("topic"):
+        raise RuntimeError(f"topics.json index {topic_index} no longer holds the checkpointed topic.")
+    if topics[topic_index].get("status") != "unused":
+        raise RuntimeError(f"Checkpointed topic {topic_index} has already been marked used.")
+    return topic_index, checkpoints
+
+
+def run_stats_report() -> dict[str, Any]:
+    """Transport, polling, cache, retry and telemetry figures for the run so far, for the run artifacts."""
+    return {
+        "http_transport": http_transport_stats(),
+        "background_polling": POLL_SCHEDULER.report(),
+        "responses_cache": RESPONSES_CACHE.report(),
+        "classifier_cache": CLASSIFIER_CACHE.report(),
+        "http_retries": RETRY_POLICY.report(),
+        "stage_telemetry": STAGE_TELEMETRY.report(),
+        "streaming": STREAM_STATS.report(),
+        "draft_speculation": DRAFT_SPECULATION.report(),
+        "local_repair": LOCAL_REPAIR.report(),
+        "legal_memo": LEGAL_MEMO_STATS.report(),
+        "pdf_text_cache": PDF_TEXT_CACHE.report(),
+    }
+
+
+@dataclass
+class TopicAnalysis:
+    selected_pack_paths: list[Path]
+    classifier: dict[str, Any]
+    legal_sources_text: str
+    website_context_text: str
+    memo: dict[str, Any]
+    reader_journey: dict[str, Any]
+    knowledge_trace: dict[str, Any]
+
+
+# Prompt budgets, in characters of section text, for the sources sent upstream.
+LEGAL_AUTHORITY_CHARS_PER_PACK = 5000
+INTERNAL_NOTE_CHAR_BUDGET = 12000
+WEBSITE_CONTEXT_CHAR_BUDGET = 8000
+
 
-    retrieval_queries = list(classifier.get("key_issues", [])) + [
+def topic_retrieval_queries(topic_entry: dict[str, Any], classifier: dict[str, Any]) -> list[str]:
+    return list(classifier.get("key_issues", [])) + [
         topic_entry.get("topic", ""),
         topic_entry.get("angle", ""),
     ]
 
-    if not selected_pack_paths:
-        raise RuntimeError(
-            f"No legal authority packs mapped for pillar={topic_entry.get('pillar')} "
-            f"subtopic={topic_entry.get('subtopic')}"
-        )
-
-    selected_legal_chunks = load_selected_legal_authority_chunks(selected_pack_paths)
-    internal_note_chunks = load_chunks_from_folder(INTERNAL_NOTES_DIR, "internal_legal_note")
-    website_editorial_chunks = load_chunks_from_folder(WEBSITE_EDITORIAL_DIR, "website_editorial")
 
-    retrieved_internal_note_chunks = simple_retrieve(
-        internal_note_chunks,
-        retrieval_queries,
-        limit=4,
-        allowed_source_kinds={"internal_legal_note"},
-    )
+def retrieve_topic_sources(
+    topic_entry: dict[str, Any],
+    classifier: dict[str, Any],
+    knowledge_chunks: tuple[list[KnowledgeChunk], list[KnowledgeChunk], list[KnowledgeChunk]],
+) -> dict[str, str]:
+    """Rank the loaded knowledge sections against the classifier's key issues and format the prompt source texts."""
+    (ranked,) = rank_topic_sources([(topic_entry, classifier, knowledge_chunks)])
+    return pack_topic_sources(knowledge_chunks[0], *ranked)
+
+
+def rank_topic_sources(
+    topics: list[
+        tuple[
+            dict[str, Any],
+            dict[str, Any],
+            tuple[list[KnowledgeChunk], list[KnowledgeChunk], list[KnowledgeChunk]],
+        ]
+    ],
+) -> list[tuple[list[KnowledgeChunk], list[KnowledgeChunk], list[KnowledgeChunk]]]:
+    """
+    Ranked legal, internal note and website sections for each (topic entry, classifier, knowledge chunks).
 
-    legal_chunks = selected_legal_chunks + retrieved_internal_note_chunks
+    Each knowledge source is ranked for every topic in one retrieve_batch
+    call, so the TF-IDF backend scores a whole batch of topics with one
+    sparse matrix product per source.  Legal authority is ranked over the
+    union of the topics' packs and each topic keeps the sections of its own.
+    """
+    if not topics:
+        return []
+    query_sets = [topic_retrieval_queries(topic_entry, classifier) for topic_entry, classifier, _ in topics]
+    legal_union = list({id(chunk): chunk for _, _, (legal, _, _) in topics for chunk in legal}.values())
+    ranked_legal = retrieve_batch(legal_union, query_sets, limit=len(legal_union))
+
+    # Internal notes and website editorial are loaded once per KnowledgeBase,
+    # so topics normally share the same lists; group by list to be safe.
+    ranked_internal: list[list[KnowledgeChunk]] = [[] for _ in topics]
+    ranked_website: list[list[KnowledgeChunk]] = [[] for _ in topics]
+    for position, source_kind, ranked in (
+        (1, "internal_legal_note", ranked_internal),
+        (2, "website_editorial", ranked_website),
+    ):
+        groups: dict[int, list[int]] = {}
+        for index, (_, _, knowledge_chunks) in enumerate(topics):
+            groups.setdefault(id(knowledge_chunks[position]), []).append(index)
+        for indexes in groups.values():
+            chunks = topics[indexes[0]][2][position]
+            results = retrieve_batch(
+                chunks,
+                [query_sets[index] for index in indexes],
+                limit=len(chunks),
+                allowed_source_kinds={source_kind},
+            )
+            for index, result in zip(indexes, results):
+                ranked[index] = result
+
+    rankings: list[tuple[list[KnowledgeChunk], list[KnowledgeChunk], list[KnowledgeChunk]]] = []
+    for index, (_, _, (selected_legal_chunks, _, _)) in enumerate(topics):
+        selected_ids = {id(chunk) for chunk in selected_legal_chunks}
+        ranked_legal_chunks = [chunk for chunk in ranked_legal[index] if id(chunk) in selected_ids]
+        rankings.append((ranked_legal_chunks, ranked_internal[index], ranked_website[index]))
+    return rankings
+
+
+def pack_topic_sources(
+    selected_legal_chunks: list[KnowledgeChunk],
+    ranked_legal_chunks: list[KnowledgeChunk],
+    ranked_internal_note_chunks: list[KnowledgeChunk],
+    ranked_website_chunks: list[KnowledgeChunk],
+) -> dict[str, str]:
+    """
+    Pack ranked sections into the prompt budgets and format the legal and website source texts.
 
-    website_context_chunks = simple_retrieve(
-        website_editorial_chunks,
-        retrieval_queries,
-        limit=3,
-        allowed_source_kinds={"website_editorial"},
+    Every mapped authority pack contributes its best-matching section (its
+    opening sections if none match), and the remaining legal budget goes to
+    the best-matching sections across the packs.
+    """
+    ranked_ids = {id(chunk) for chunk in ranked_legal_chunks}
+    selected_pack_count = len({chunk.source_name for chunk in selected_legal_chunks})
+    packed_legal_chunks = pack_sections(
+        ranked_legal_chunks + [chunk for chunk in selected_legal_chunks if id(chunk) not in ranked_ids],
+        LEGAL_AUTHORITY_CHARS_PER_PACK * selected_pack_count,
+        cover_sources=True,
     )
+    retrieved_internal_note_chunks = pack_sections(ranked_internal_note_chunks, INTERNAL_NOTE_CHAR_BUDGET)
+    legal_chunks = packed_legal_chunks + retrieved_internal_note_chunks
+    website_context_chunks = pack_sections(ranked_website_chunks, WEBSITE_CONTEXT_CHAR_BUDGET)
 
     if not legal_chunks:
         if not args.allow_editorial_fallback:
@@ -2956,42 +6669,180 @@ def main() -> None:
     else:
         legal_sources_text = format_sources_for_prompt(legal_chunks)
 
-    website_context_text = format_sources_for_prompt(website_context_chunks)
+    return {
+        "legal_sources_text": legal_sources_text,
+        "website_context_text": format_sources_for_prompt(website_context_chunks),
+    }
+
+
+@traced()
+def analyse_topic(
+    openai_api_key: str,
+    topic_entry: dict[str, Any],
+    knowledge: KnowledgeBase,
+    *,
+    checkpoints: StageCheckpoints,
+) -> TopicAnalysis:
+    """
+    Run the stages upstream of drafting for one topic: classifier, retrieval, legal memo and reader journey.
+
+    Each stage is checkpointed as it completes and reloaded when already
+    checkpointed, so a topic prefetched by --prefetch or a resumed run skips
+    them.  Knowledge is only loaded when retrieval has not been checkpointed.
+    """
+    timeline = RunTimeline()
+    selected_pack_paths = resolve_authority_pack_paths(topic_entry, knowledge.authority_map)
+
+    if not selected_pack_paths:
+        raise RuntimeError(
+            f"No legal authority packs mapped for pillar={topic_entry.get('pillar')} "
+            f"subtopic={topic_entry.get('subtopic')}"
+        )
+
+    # Knowledge loading (file reads and PDF extraction) does not depend on the
+    # classifier output, so it runs while the classifier request is in flight.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="knowledge") as loader:
+        knowledge_future = (
+            loader.submit(load_topic_knowledge, knowledge, selected_pack_paths, timeline)
+            if checkpoints.load("retrieval") is None
+            else None
+        )
+        with timeline.span("classifier"):
+            classifier = checkpoints.run("classifier", lambda: classify_topic(openai_api_key, topic_entry))
+        retrieval = checkpoints.run(
+            "retrieval",
+            lambda: retrieve_topic_sources(topic_entry, classifier, knowledge_future.result()),
+        )
+    knowledge_trace = {
+        "spans": timeline.report(),
+        "classifier_overlap_seconds": round(timeline.overlap_seconds("classifier", "knowledge_load"), 3),
+        "knowledge_corpus": knowledge.corpus is not None,
+    }
+    legal_sources_text = retrieval["legal_sources_text"]
+    website_context_text = retrieval["website_context_text"]
 
     memo: dict[str, Any] | None = None
     memo_validation_errors: list[str] = []
-    for _ in range(MAX_REPAIR_ATTEMPTS + 1):
-        memo = call_responses_api(
-            openai_api_key,
-            instructions=LEGAL_MEMO_INSTRUCTIONS,
-            input_text=build_legal_input(topic_entry, classifier, legal_sources_text, website_context_text),
-            schema=LEGAL_MEMO_SCHEMA,
-            model=OPENAI_MODEL,
-            background=True,
-        )
+    replayed_memos = checkpoints.attempts("legal_memo")
+    for memo in replayed_memos:
         memo_validation_errors = validate_legal_memo(memo)
         if not memo_validation_errors:
             break
+    else:
+        # A memo whose failures are tied to particular issues is repaired
+        # issue by issue; only a memo without usable issues is regenerated.
+        attempts: list[str] = []
+        issues_repaired = repairs_failed = 0
+        for attempt in range(len(replayed_memos) + 1, len(replayed_memos) + MAX_REPAIR_ATTEMPTS + 2):
+            failing = failing_memo_issues(memo) if memo is not None else {}
+            repaired: dict[str, Any] | None = None
+            if failing:
+                attempts.append("repair")
+                repair = call_responses_api(
+                    openai_api_key,
+                    instructions=LEGAL_MEMO_REPAIR_INSTRUCTIONS,
+                    input_text=build_legal_memo_repair_input(
+                        topic_entry, classifier, memo, failing, legal_sources_text
+                    ),
+                    schema=LEGAL_MEMO_REPAIR_SCHEMA,
+                    model=OPENAI_MODEL,
+                    background=True,
+                    stage="legal_memo_repair",
+                    cache=False,
+                )
+                repaired = merge_memo_repair(memo, repair, failing)
+                if repaired is None:
+                    # An issue the repair could not fix is not dropped; the memo is regenerated instead.
+                    repairs_failed += 1
+            if repaired is not None:
+                memo = repaired
+                issues_repaired += len(failing)
+            else:
+                attempts.append("full")
+                memo = call_responses_api(
+                    openai_api_key,
+                    instructions=LEGAL_MEMO_INSTRUCTIONS,
+                    input_text=build_legal_input(topic_entry, classifier, legal_sources_text, website_context_text),
+                    schema=LEGAL_MEMO_SCHEMA,
+                    model=OPENAI_MODEL,
+                    background=True,
+                    stage="legal_memo",
+                    validate=validate_legal_memo,
+                )
+            checkpoints.save(f"legal_memo_{attempt}", memo)
+            memo_validation_errors = validate_legal_memo(memo)
+            if not memo_validation_errors:
+                break
+        LEGAL_MEMO_STATS.record(
+            attempts=attempts,
+            valid=not memo_validation_errors,
+            issues_repaired=issues_repaired,
+            repairs_failed=repairs_failed,
+        )
 
     if memo is None:
         raise RuntimeError("Legal memo generation failed: no memo returned.")
     if memo_validation_errors:
-        raise RuntimeError("Legal memo validation failed:\n- " + "\n- ".join(memo_validation_errors))
-
-    reader_journey = call_responses_api(
-        openai_api_key,
-        instructions=READER_JOURNEY_INSTRUCTIONS,
-        input_text=build_reader_journey_input(
-            topic_entry=topic_entry,
-            classifier=classifier,
-            memo=memo,
-            website_context=website_context_text,
+        message = "Legal memo validation failed:\n- " + "\n- ".join(memo_validation_errors)
+        if any("low confidence" in error for error in memo_validation_errors):
+            message += "\nRerun with --allow-low-confidence-legal-memo to accept low-confidence issues."
+        raise RuntimeError(message)
+
+    reader_journey = checkpoints.run(
+        "reader_journey",
+        lambda: call_responses_api(
+            openai_api_key,
+            instructions=READER_JOURNEY_INSTRUCTIONS,
+            input_text=build_reader_journey_input(
+                topic_entry=topic_entry,
+                classifier=classifier,
+                memo=memo,
+                website_context=website_context_text,
+            ),
+            schema=READER_JOURNEY_SCHEMA,
+            model=OPENAI_MODEL,
+            background=True,
+            stage="reader_journey",
         ),
-        schema=READER_JOURNEY_SCHEMA,
-        model=OPENAI_MODEL,
-        background=True,
     )
 
+    return TopicAnalysis(
+        selected_pack_paths=selected_pack_paths,
+        classifier=classifier,
+        legal_sources_text=legal_sources_text,
+        website_context_text=website_context_text,
+        memo=memo,
+        reader_journey=reader_journey,
+        knowledge_trace=knowledge_trace,
+    )
+
+
+@traced()
+def generate_topic_draft(
+    openai_api_key: str,
+    topic_entry: dict[str, Any],
+    knowledge: KnowledgeBase,
+    *,
+    checkpoints: StageCheckpoints,
+    include_run_stats: bool = True,
+) -> dict[str, Any]:
+    """
+    Run classifier -> memo -> reader journey -> draft -> repairs -> SEO for one topic; return the final payload.
+
+    Every API stage is checkpointed as it completes, and stages already in
+    checkpoints are reloaded instead of requested again.  The run stats are
+    process-wide, so a batch leaves them out of each topic's artifacts
+    (include_run_stats=False) and reports them once in its summary.
+    """
+    run_base = checkpoints.run_base
+    analysis = analyse_topic(openai_api_key, topic_entry, knowledge, checkpoints=checkpoints)
+    selected_pack_paths = analysis.selected_pack_paths
+    classifier = analysis.classifier
+    memo = analysis.memo
+    reader_journey = analysis.reader_journey
+    website_context_text = analysis.website_context_text
+    knowledge_trace = analysis.knowledge_trace
+
     write_run_artifact(
         f"{run_base}_analysis.json",
         {
@@ -3000,27 +6851,64 @@ def main() -> None:
             "selected_legal_authority_packs": [
                 str(path.relative_to(SCRIPT_DIR)) for path in selected_pack_paths
             ],
-            "selected_article_structure_variant": select_article_structure_variant(topic_entry, classifier),
+            "draft_structure_variants": [
+                variant["name"] for variant in draft_candidate_variants(topic_entry, classifier, args.draft_candidates)
+            ],
             "memo": memo,
             "reader_journey": reader_journey,
+            "knowledge_trace": knowledge_trace,
+            **(run_stats_report() if include_run_stats else {}),
         },
     )
 
-    draft = call_responses_api(
-        openai_api_key,
-        instructions=DRAFT_INSTRUCTIONS,
-        input_text=build_draft_input(
-            topic_entry,
-            classifier,
-            memo,
-            reader_journey,
-            website_context_text,
-        ),
-        schema=DRAFT_SCHEMA,
-        model=OPENAI_MODEL,
-        background=True,
-    )
-    draft = normalise_draft_output(draft, topic_entry, classifier)
+    draft_monitor = DraftStreamMonitor() if args.stream_draft and args.draft_candidates <= 1 else None
+    draft_speculation: dict[str, Any] | None = None
+
+    def request_draft() -> dict[str, Any]:
+        nonlocal draft_speculation
+        if args.draft_candidates > 1:
+            raw_draft, draft_speculation = asyncio.run(
+                async_speculative_draft(
+                    openai_api_key,
+                    topic_entry=topic_entry,
+                    classifier=classifier,
+                    memo=memo,
+                    reader_journey=reader_journey,
+                    website_context=website_context_text,
+                    candidates=args.draft_candidates,
+                )
+            )
+            checkpoints.save("draft_candidates", draft_speculation)
+            return raw_draft
+        return call_responses_api(
+            openai_api_key,
+            instructions=DRAFT_INSTRUCTIONS,
+            input_text=build_draft_input(
+                topic_entry,
+                classifier,
+                memo,
+                reader_journey,
+                website_context_text,
+            ),
+            schema=DRAFT_SCHEMA,
+            model=OPENAI_MODEL,
+            background=True,
+            stage="draft",
+            validate=lambda raw_draft: draft_output_errors(raw_draft, topic_entry, classifier, reader_journey),
+            stream=draft_monitor is not None,
+            on_text_delta=draft_monitor.feed if draft_monitor else None,
+        )
+
+    draft = normalise_draft_output(checkpoints.run("draft", request_draft), topic_entry, classifier)
+    if draft_speculation is None:
+        draft_speculation = checkpoints.load("draft_candidates")
+    structure_variant = select_article_structure_variant(topic_entry, classifier)
+    if draft_speculation:
+        structure_variant = next(
+            variant
+            for variant in ARTICLE_STRUCTURE_VARIANTS
+            if variant["name"] == draft_speculation["selected_variant"]
+        )
     draft = flow_repair_draft_if_needed(
         openai_api_key=openai_api_key,
         topic_entry=topic_entry,
@@ -3028,6 +6916,7 @@ def main() -> None:
         memo=memo,
         reader_journey=reader_journey,
         draft=draft,
+        checkpoints=checkpoints,
     )
     draft = repair_draft_if_needed(
         openai_api_key=openai_api_key,
@@ -3035,14 +6924,19 @@ def main() -> None:
         classifier=classifier,
         memo=memo,
         draft=draft,
+        checkpoints=checkpoints,
     )
 
-    seo = call_responses_api(
-        openai_api_key,
-        instructions=SEO_INSTRUCTIONS,
-        input_text=build_seo_input(topic_entry, draft),
-        schema=SEO_SCHEMA,
-        model=OPENAI_MODEL,
+    seo = checkpoints.run(
+        "seo",
+        lambda: call_responses_api(
+            openai_api_key,
+            instructions=SEO_INSTRUCTIONS,
+            input_text=build_seo_input(topic_entry, draft),
+            schema=SEO_SCHEMA,
+            model=OPENAI_MODEL,
+            stage="seo",
+        ),
     )
 
     final_payload = {
@@ -3051,20 +6945,40 @@ def main() -> None:
         "selected_legal_authority_packs": [
             str(path.relative_to(SCRIPT_DIR)) for path in selected_pack_paths
         ],
-        "selected_article_structure_variant": select_article_structure_variant(topic_entry, classifier),
+        "selected_article_structure_variant": structure_variant,
         "memo": memo,
         "reader_journey": reader_journey,
         "draft": draft,
         "seo": seo,
+        "knowledge_trace": knowledge_trace,
+        **(run_stats_report() if include_run_stats else {}),
+        "draft_stream": draft_monitor.report() if draft_monitor else None,
+        "draft_candidates": draft_speculation,
+        "resumed_stages": checkpoints.resumed,
+        "prefetched_stages": checkpoints.seeded,
     }
 
     write_run_artifact(f"{run_base}_final.json", final_payload)
+    return final_payload
+
+
+def send_draft_email(
+    final_payload: dict[str, Any],
+    checkpoints: StageCheckpoints,
+    *,
+    remaining_after_send: int,
+) -> None:
+    """Email the draft unless an earlier run of these checkpoints already sent it."""
+    if checkpoints.load("email") is not None:
+        checkpoints.resumed.append("email")
+        return
 
+    draft = final_payload["draft"]
     email_body = render_success_email(
-        topic_entry=topic_entry,
+        topic_entry=final_payload["topic"],
         draft=draft,
-        seo=seo,
-        remaining_after_send=remaining_count - 1,
+        seo=final_payload["seo"],
+        remaining_after_send=remaining_after_send,
     )
 
     sent = send_email_via_sendgrid(
@@ -3075,15 +6989,382 @@ def main() -> None:
 
     if not sent:
         raise RuntimeError("Draft generated but SendGrid delivery failed.")
+    checkpoints.save("email", {"sent_at_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")})
 
+
+def mark_topic_used(topics: list[dict[str, Any]], topic_index: int, blog_title: str) -> None:
     topics[topic_index]["status"] = "used"
-    topics[topic_index]["used_title"] = draft["blog_title"]
+    topics[topic_index]["used_title"] = blog_title
     topics[topic_index]["used_at_utc"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
+
+def save_topics(topics: list[dict[str, Any]]) -> None:
     with TOPICS_PATH.open("w", encoding="utf-8") as f:
         json.dump(topics, f, indent=2, ensure_ascii=False)
 
-    print(f"Draft email sent successfully and topic marked used: {draft['blog_title']}")
+
+def select_batch_topic_indexes(topics: list[dict[str, Any]]) -> list[int]:
+    if args.topics:
+        try:
+            indexes = [int(item) for item in args.topics.split(",") if item.strip()]
+        except ValueError as exc:
+            raise RuntimeError(f"--topics must be a comma-separated list of indexes: {args.topics}") from exc
+        for index in indexes:
+            if index < 0 or index >= len(topics):
+                raise RuntimeError(f"topic index {index} out of range")
+            if topics[index].get("status") != "unused":
+                raise RuntimeError(f"topic index {index} is not unused")
+        return list(dict.fromkeys(indexes))
+
+    unused_indexes = [i for i, topic in enumerate(topics) if topic.get("status") == "unused"]
+    if not unused_indexes:
+        raise RuntimeError("No unused topics remain.")
+    return unused_indexes[: args.batch]
+
+
+def prepare_batch_retrieval(
+    openai_api_key: str,
+    topic_entries: list[dict[str, Any]],
+    checkpoints: list[StageCheckpoints],
+    knowledge: KnowledgeBase,
+) -> int:
+    """
+    Checkpoint the classifier and retrieval stages of a batch of topics before their pipelines start.
+
+    Missing classifier outputs are requested concurrently (prebatched or
+    prefetched ones are reused), then every topic's retrieval is ranked
+    together through rank_topic_sources.  A topic whose classifier or
+    retrieval fails here is left to its own pipeline run, which reports the
+    failure.  Returns the number of topics whose retrieval was checkpointed.
+    """
+    pending = [
+        (topic_entry, topic_checkpoints)
+        for topic_entry, topic_checkpoints in zip(topic_entries, checkpoints)
+        if topic_checkpoints.load("retrieval") is None
+        and resolve_authority_pack_paths(topic_entry, knowledge.authority_map)
+    ]
+
+    def classify(topic_entry: dict[str, Any], topic_checkpoints: StageCheckpoints) -> dict[str, Any] | None:
+        try:
+            return topic_checkpoints.run("classifier", lambda: classify_topic(openai_api_key, topic_entry))
+        except Exception:
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, args.batch_concurrency), thread_name_prefix="classifier") as pool:
+        classifiers = list(pool.map(lambda item: classify(*item), pending))
+
+    ready = [
+        (topic_entry, classifier, topic_checkpoints)
+        for (topic_entry, topic_checkpoints), classifier in zip(pending, classifiers)
+        if classifier is not None
+    ]
+    timeline = RunTimeline()
+    knowledge_chunks = [
+        load_topic_knowledge(knowledge, resolve_authority_pack_paths(topic_entry, knowledge.authority_map), timeline)
+        for topic_entry, _, _ in ready
+    ]
+    rankings = rank_topic_sources(
+        [(topic_entry, classifier, chunks) for (topic_entry, classifier, _), chunks in zip(ready, knowledge_chunks)]
+    )
+
+    prepared = 0
+    for (_, _, topic_checkpoints), chunks, ranked in zip(ready, knowledge_chunks, rankings):
+        try:
+            retrieval = pack_topic_sources(chunks[0], *ranked)
+        except RuntimeError:
+            continue
+        topic_checkpoints.save("retrieval", retrieval)
+        prepared += 1
+    return prepared
+
+
+def run_topic_batch(topics: list[dict[str, Any]], topic_indexes: list[int]) -> None:
+    """
+    Generate, email and mark used several topics in one process.
+
+    Knowledge is loaded once and shared, and the classifier and retrieval
+    stages of every topic run up front so retrieval is ranked for the whole
+    batch at once; then up to --batch-concurrency topics run through the
+    rest of the pipeline at once.  A failed topic does not stop the
+    others; topics.json is written once at the end for every topic whose
+    email was sent, and the run fails afterwards if any topic failed.
+    """
+    openai_api_key = require_env("OPENAI_API_KEY")
+    require_env("SENDGRID_API_KEY")
+
+    knowledge = KnowledgeBase(load_authority_pack_map(AUTHORITY_MAP_PATH))
+    remaining_count = sum(1 for topic in topics if topic.get("status") == "unused")
+    batch_base = f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}_batch-{len(topic_indexes)}"
+    sent: list[dict[str, Any]] = []
+    failures: list[dict[str, Any]] = []
+
+    checkpoints = {
+        topic_index: start_topic_checkpoints(
+            f"{topic_run_base(topics[topic_index])}_{topic_index}", topic_index, topics[topic_index]
+        )
+        for topic_index in topic_indexes
+    }
+    for topic_index in topic_indexes:
+        apply_topic_prefetch(checkpoints[topic_index], topics[topic_index], knowledge)
+    prepare_batch_retrieval(
+        openai_api_key,
+        [topics[topic_index] for topic_index in topic_indexes],
+        [checkpoints[topic_index] for topic_index in topic_indexes],
+        knowledge,
+    )
+
+    with ThreadPoolExecutor(max_workers=max(1, args.batch_concurrency)) as pool:
+        futures = {
+            pool.submit(
+                generate_topic_draft,
+                openai_api_key,
+                topics[topic_index],
+                knowledge,
+                checkpoints=checkpoints[topic_index],
+                include_run_stats=False,
+            ): topic_index
+            for topic_index in topic_indexes
+        }
+        for future in as_completed(futures):
+            topic_index = futures[future]
+            try:
+                final_payload = future.result()
+                send_draft_email(
+                    final_payload,
+                    checkpoints[topic_index],
+                    remaining_after_send=remaining_count - len(sent) - 1,
+                )
+            except Exception as exc:
+                failures.append(
+                    {
+                        "topic_index": topic_index,
+                        "resume_run_base": checkpoints[topic_index].run_base,
+                        "error": str(exc),
+                    }
+                )
+                continue
+            blog_title = final_payload["draft"]["blog_title"]
+            mark_topic_used(topics, topic_index, blog_title)
+            sent.append({"topic_index": topic_index, "blog_title": blog_title})
+
+    if sent:
+        save_topics(topics)
+        for item in sent:
+            checkpoints[item["topic_index"]].discard()
+    STAGE_TELEMETRY.append_ledger(
+        TELEMETRY_LEDGER_PATH,
+        run_base=batch_base,
+        model=OPENAI_MODEL,
+        topic=f"batch of {len(topic_indexes)} topics",
+        status="failed" if failures else "ok",
+    )
+    write_run_artifact(
+        f"{batch_base}_summary.json",
+        {"topic_indexes": topic_indexes, "sent": sent, "failures": failures, **run_stats_report()},
+    )
+    write_run_trace(batch_base)
+
+    print(json.dumps({"sent": sent, "failures": failures}, ensure_ascii=False, indent=2))
+    if failures:
+        raise RuntimeError(f"{len(failures)} of {len(topic_indexes)} batch topics failed.")
+
+
+def topic_prefetch_key(topic_entry: dict[str, Any], knowledge: KnowledgeBase) -> str:
+    """
+    Key of a topic's prefetched upstream stages.
+
+    It changes whenever the topic entry, the contents of its mapped authority
+    packs, the internal notes or website editorial files, the model, the
+    upstream stage prompts or the section and prompt budgets change, so
+    stale prefetches are never used.
+    """
+    basis = {
+        "topic": topic_entry,
+        "model": OPENAI_MODEL,
+        "prompts": [
+            CLASSIFIER_INSTRUCTIONS,
+            CLASSIFIER_SCHEMA,
+            LEGAL_MEMO_INSTRUCTIONS,
+            LEGAL_MEMO_SCHEMA,
+            READER_JOURNEY_INSTRUCTIONS,
+            READER_JOURNEY_SCHEMA,
+        ],
+        "authority_packs": knowledge.content_digest(
+            resolve_authority_pack_paths(topic_entry, knowledge.authority_map)
+        ),
+        "internal_notes": knowledge.content_digest(knowledge_folder_files(INTERNAL_NOTES_DIR)),
+        "website_editorial": knowledge.content_digest(knowledge_folder_files(WEBSITE_EDITORIAL_DIR)),
+        "retrieval": [
+            args.retrieval_backend,
+            KNOWLEDGE_SECTION_MAX_CHARS,
+            LEGAL_AUTHORITY_CHARS_PER_PACK,
+            INTERNAL_NOTE_CHAR_BUDGET,
+            WEBSITE_CONTEXT_CHAR_BUDGET,
+        ],
+    }
+    return hashlib.sha256(json.dumps(basis, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def apply_topic_prefetch(checkpoints: StageCheckpoints, topic_entry: dict[str, Any], knowledge: KnowledgeBase) -> None:
+    prefetch_dir = PREFETCH_DIR / topic_prefetch_key(topic_entry, knowledge)
+    if prefetch_dir.is_dir():
+        checkpoints.seed_from(prefetch_dir)
+
+
+def prefetch_topics(openai_api_key: str, topics: list[dict[str, Any]], count: int) -> dict[str, Any]:
+    """
+    Run the upstream stages for the next `count` unused topics into .cache/prefetch/<key>/.
+
+    Prefetches whose key no longer matches any unused topic (the topic was
+    used or edited, or its knowledge changed) are removed first.
+    """
+    knowledge = KnowledgeBase(load_authority_pack_map(AUTHORITY_MAP_PATH))
+    unused_indexes = [i for i, topic in enumerate(topics) if topic.get("status") == "unused"]
+    keys = {i: topic_prefetch_key(topics[i], knowledge) for i in unused_indexes}
+
+    stale_removed = 0
+    if PREFETCH_DIR.is_dir():
+        current_keys = set(keys.values())
+        for directory in PREFETCH_DIR.iterdir():
+            if directory.name not in current_keys:
+                shutil.rmtree(directory, ignore_errors=True)
+                stale_removed += 1
+
+    def prefetch_one(topic_index: int) -> bool:
+        checkpoints = StageCheckpoints(f"prefetch_{topic_index}", PREFETCH_DIR / keys[topic_index])
+        if checkpoints.load("reader_journey") is not None:
+            return False
+        analyse_topic(openai_api_key, topics[topic_index], knowledge, checkpoints=checkpoints)
+        return True
+
+    prefetched: list[int] = []
+    already_prefetched: list[int] = []
+    failures: list[dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=max(1, args.batch_concurrency)) as pool:
+        futures = {pool.submit(prefetch_one, i): i for i in unused_indexes[: max(0, count)]}
+        for future in as_completed(futures):
+            topic_index = futures[future]
+            try:
+                (prefetched if future.result() else already_prefetched).append(topic_index)
+            except Exception as exc:
+                failures.append({"topic_index": topic_index, "error": str(exc)})
+
+    trace_path = write_run_trace(f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}_prefetch-{count}")
+    return {
+        "prefetched": sorted(prefetched),
+        "already_prefetched": sorted(already_prefetched),
+        "failures": failures,
+        "stale_removed": stale_removed,
+        "stage_telemetry": STAGE_TELEMETRY.report(),
+        "trace": str(trace_path) if trace_path else None,
+    }
+
+
+# ============================================================
+# Main workflow
+# ============================================================
+
+def main() -> None:
+    if args.retrieval_backend == "tfidf" and not HAS_SCIPY:
+        raise RuntimeError("--retrieval-backend tfidf needs numpy and scipy: pip install numpy scipy")
+
+    topics = load_topics(TOPICS_PATH)
+
+    if args.prebatch_classifier is not None:
+        print(
+            json.dumps(prebatch_classifier(require_env("OPENAI_API_KEY"), topics, args.prebatch_classifier), indent=2)
+        )
+        return
+
+    if args.build_knowledge_index:
+        print(json.dumps(build_knowledge_corpus(), indent=2))
+        return
+
+    if args.prefetch is not None:
+        print(json.dumps(prefetch_topics(require_env("OPENAI_API_KEY"), topics, args.prefetch), indent=2))
+        return
+
+    if (args.batch or args.topics) and not args.dry_run:
+        run_topic_batch(topics, select_batch_topic_indexes(topics))
+        return
+
+    checkpoints: StageCheckpoints | None = None
+    if args.resume:
+        topic_index, checkpoints = resume_topic_checkpoints(args.resume, topics)
+        topic_index, topic_entry, remaining_count = pick_topic(topics, topic_index)
+    else:
+        topic_index, topic_entry, remaining_count = pick_topic(topics, args.topic_index)
+
+    authority_map = load_authority_pack_map(AUTHORITY_MAP_PATH)
+    selected_pack_paths = resolve_authority_pack_paths(topic_entry, authority_map)
+
+    if args.dry_run:
+        print(
+            json.dumps(
+                {
+                    "selected_topic": topic_entry,
+                    "remaining_unused": remaining_count,
+                    "mapped_authority_packs": [
+                        {
+                            "path": str(path.relative_to(SCRIPT_DIR)),
+                            "exists": path.exists(),
+                            "suffix": path.suffix,
+                        }
+                        for path in selected_pack_paths
+                    ],
+                    "selected_article_structure_variant": select_article_structure_variant(topic_entry),
+                    "expected_retrieval_queries": [
+                        topic_entry.get("topic", ""),
+                        topic_entry.get("angle", ""),
+                        topic_entry.get("subtopic", ""),
+                        topic_entry.get("pillar", ""),
+                    ],
+                },
+                ensure_ascii=False,
+                indent=2,
+            )
+        )
+        return
+
+    openai_api_key = require_env("OPENAI_API_KEY")
+    require_env("SENDGRID_API_KEY")
+
+    knowledge = KnowledgeBase(authority_map)
+    if checkpoints is None:
+        checkpoints = start_topic_checkpoints(topic_run_base(topic_entry), topic_index, topic_entry)
+    apply_topic_prefetch(checkpoints, topic_entry, knowledge)
+
+    status = "failed"
+    try:
+        final_payload = generate_topic_draft(
+            openai_api_key,
+            topic_entry,
+            knowledge,
+            checkpoints=checkpoints,
+        )
+        send_draft_email(final_payload, checkpoints, remaining_after_send=remaining_count - 1)
+        status = "ok"
+    except Exception:
+        print(f"Run failed; completed stages are checkpointed. Resume with --resume {checkpoints.run_base}")
+        raise
+    finally:
+        # Failed and interrupted runs are recorded too; they are the regressions the ledger tracks.
+        STAGE_TELEMETRY.append_ledger(
+            TELEMETRY_LEDGER_PATH,
+            run_base=checkpoints.run_base,
+            model=OPENAI_MODEL,
+            topic=topic_entry.get("topic", ""),
+            status=status,
+        )
+        trace_path = write_run_trace(checkpoints.run_base)
+        if trace_path:
+            print(f"Run trace written to {trace_path}")
+
+    mark_topic_used(topics, topic_index, final_payload["draft"]["blog_title"])
+    save_topics(topics)
+    checkpoints.discard()
+
+    print(f"Draft email sent successfully and topic marked used: {final_payload['draft']['blog_title']}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+"""Time loading every knowledge file with a cold and a warm PDF text cache.
+
+    python scripts/benchmark_knowledge_load.py --runs 3
+
+Each measurement is a fresh generator process that reads every file under
+knowledge/ the way a generation run does.  Cold runs start from an empty
+cache directory; warm runs share one cache directory populated beforehand,
+so unchanged PDFs are served from .cache/knowledge instead of being parsed.
+Caches go to a temporary directory, so the benchmark leaves the repository
+unchanged.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+LOAD_KNOWLEDGE = """
+import json, sys, time
+started = time.perf_counter()
+sys.argv = ["generate_and_publish.py"]
+import generate_and_publish as g
+imported = time.perf_counter()
+chunks = [
+    *g.load_chunks_from_folder(g.LEGAL_AUTHORITIES_DIR, "legal_authority"),
+    *g.load_chunks_from_folder(g.INTERNAL_NOTES_DIR, "internal_legal_note"),
+    *g.load_chunks_from_folder(g.WEBSITE_EDITORIAL_DIR, "website_editorial"),
+]
+loaded = time.perf_counter()
+print(json.dumps({
+    "import_seconds": imported - started,
+    "load_seconds": loaded - imported,
+    "chunks": len(chunks),
+    "characters": sum(len(chunk.text) for chunk in chunks),
+    "pdf_text_cache": g.PDF_TEXT_CACHE.report(),
+}))
+"""
+
+
+def load_knowledge(cache_dir: Path) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", LOAD_KNOWLEDGE],
+        cwd=REPO_ROOT,
+        env={**os.environ, "BLOG_CACHE_DIR": str(cache_dir)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarise(samples: list[dict]) -> dict:
+    load_seconds = [sample["load_seconds"] for sample in samples]
+    return {
+        "mean_load_seconds": round(statistics.mean(load_seconds), 3),
+        "min_load_seconds": round(min(load_seconds), 3),
+        "max_load_seconds": round(max(load_seconds), 3),
+        "pdf_text_cache": samples[-1]["pdf_text_cache"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark knowledge loading with a cold and a warm PDF text cache.")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="knowledge-benchmark-") as tmp:
+        tmp_path = Path(tmp)
+        cold = [load_knowledge(tmp_path / f"cold-{run}") for run in range(1, args.runs + 1)]
+        load_knowledge(tmp_path / "warm")
+        warm = [load_knowledge(tmp_path / "warm") for _ in range(args.runs)]
+
+    cold_mean = statistics.mean(sample["load_seconds"] for sample in cold)
+    warm_mean = statistics.mean(sample["load_seconds"] for sample in warm)
+    summary = {
+        "runs": args.runs,
+        "chunks": cold[-1]["chunks"],
+        "characters": cold[-1]["characters"],
+        "cold": summarise(cold),
+        "warm": summarise(warm),
+        "saved_seconds": round(cold_mean - warm_mean, 3),
+        "speedup": round(cold_mean / warm_mean, 1) if warm_mean else None,
+    }
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Run generate_and_publish.py end to end against the local mock API and report timings.
+
+    python scripts/benchmark_pipeline.py --runs 3 --latency 0.5 --rate-limit-rate 0.1
+
+Each run is a separate generator process pointed at an in-process
+mock_api_server.  Run artifacts and caches go to a temporary directory and
+topics.json is restored after every run, so the benchmark leaves the
+repository unchanged.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from mock_api_server import add_config_arguments, config_from_args, start_mock_server
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+GENERATOR_PATH = REPO_ROOT / "generate_and_publish.py"
+TOPICS_PATH = REPO_ROOT / "topics.json"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the generation pipeline against the local mock API.")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--topic-index", type=int, default=None)
+    parser.add_argument(
+        "--keep-cache",
+        action="store_true",
+        help="Share one cache directory across runs instead of starting each run cold.",
+    )
+    parser.add_argument("generator_args", nargs=argparse.REMAINDER, help="Extra arguments after --.")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    extra_args = [arg for arg in args.generator_args if arg != "--"]
+    if args.topic_index is not None:
+        extra_args += ["--topic-index", str(args.topic_index)]
+
+    server = start_mock_server(config_from_args(args))
+    original_topics = TOPICS_PATH.read_bytes()
+    durations: list[float] = []
+    failures = 0
+
+    with tempfile.TemporaryDirectory(prefix="blog-benchmark-") as tmp:
+        tmp_path = Path(tmp)
+        env = {
+            **os.environ,
+            "OPENAI_BASE_URL": f"{server.base_url}/v1",
+            "SENDGRID_BASE_URL": f"{server.base_url}/v3",
+            "OPENAI_API_KEY": "mock",
+            "SENDGRID_API_KEY": "mock",
+            "BLOG_OUTPUT_DIR": str(tmp_path / "runs"),
+        }
+        try:
+            for run in range(1, args.runs + 1):
+                cache_dir = tmp_path / ("cache" if args.keep_cache else f"cache-{run}")
+                env["BLOG_CACHE_DIR"] = str(cache_dir)
+                started = time.perf_counter()
+                result = subprocess.run(
+                    [sys.executable, str(GENERATOR_PATH), *extra_args],
+                    cwd=REPO_ROOT,
+                    env=env,
+                    capture_output=True,
+                    text=True,
+                )
+                elapsed = time.perf_counter() - started
+                TOPICS_PATH.write_bytes(original_topics)
+
+                status = "ok" if result.returncode == 0 else f"exit {result.returncode}"
+                print(f"run {run}: {elapsed:.2f}s ({status})")
+                if result.returncode != 0:
+                    failures += 1
+                    print(result.stderr.strip()[-2000:])
+                    continue
+                durations.append(elapsed)
+        finally:
+            TOPICS_PATH.write_bytes(original_topics)
+            server.shutdown()
+            server.server_close()
+
+    with server.state.lock:
+        counters = dict(server.state.counters)
+
+    summary = {
+        "runs": args.runs,
+        "failures": failures,
+        "mean_seconds": round(statistics.mean(durations), 3) if durations else None,
+        "min_seconds": round(min(durations), 3) if durations else None,
+        "max_seconds": round(max(durations), 3) if durations else None,
+        "mock_latency_seconds": args.latency,
+        "mock_counters": counters,
+    }
+    print(json.dumps(summary, indent=2))
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Compare the retrieval backends with the substring counting they replaced, as the corpus grows.
+
+    python scripts/benchmark_retrieval.py --queries 20 --scales 1 2 4 8
+
+The knowledge sections are loaded once (warm the PDF text cache first for a
+quick start) and replicated to simulate larger corpora.  For each scale the
+benchmark times the previous scoring (lowercase every chunk and count every
+query term as a substring), the BM25 index answering the queries one at a
+time, and the TF-IDF matrix answering them all in one retrieve_batch call.
+Index build times are reported separately.  The TF-IDF backend is skipped
+when numpy or scipy is not installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+sys.argv, cli_argv = sys.argv[:1], sys.argv[1:]
+
+import generate_and_publish as g  # noqa: E402
+
+
+def substring_retrieve(chunks: list[g.KnowledgeChunk], queries: list[str], *, limit: int = 6) -> list[g.KnowledgeChunk]:
+    """simple_retrieve as it was before the BM25 index."""
+    query_terms = g.tokenize_queries(queries)
+    scored: list[tuple[int, g.KnowledgeChunk]] = []
+    for chunk in chunks:
+        haystack = chunk.text.lower()
+        score = sum(haystack.count(term) for term in query_terms)
+        if score == 0:
+            continue
+        if chunk.source_kind == "legal_authority":
+            score += 15
+        elif chunk.source_kind == "internal_legal_note":
+            score += 7
+        scored.append((score, chunk))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [chunk for _, chunk in scored[:limit]]
+
+
+def time_build(build, chunks: list[g.KnowledgeChunk]) -> float:
+    started = time.perf_counter()
+    build(chunks)
+    return time.perf_counter() - started
+
+
+def time_queries(retrieve, chunks: list[g.KnowledgeChunk], query_sets: list[list[str]]) -> float:
+    started = time.perf_counter()
+    for queries in query_sets:
+        retrieve(chunks, queries, limit=6)
+    return (time.perf_counter() - started) / len(query_sets)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark BM25 and TF-IDF retrieval against substring counting.")
+    parser.add_argument("--queries", type=int, default=20, help="Topics whose topic and angle are used as queries.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args(cli_argv)
+
+    base_chunks = [
+        chunk
+        for folder, source_kind in g.KNOWLEDGE_CORPUS_FOLDERS
+        for chunk in g.load_chunks_from_folder(folder, source_kind)
+    ]
+    topics = g.load_topics(g.TOPICS_PATH)[: args.queries]
+    query_sets = [[topic.get("topic", ""), topic.get("angle", "")] for topic in topics]
+
+    results = []
+    for scale in args.scales:
+        chunks = [
+            g.KnowledgeChunk(f"{chunk.source_name}#{copy}", chunk.source_kind, chunk.text, chunk.section, chunk.section_index)
+            for copy in range(scale)
+            for chunk in base_chunks
+        ]
+        substring_seconds = time_queries(substring_retrieve, chunks, query_sets)
+        bm25_build_seconds = time_build(g.bm25_index_for, chunks)
+        bm25_seconds = time_queries(
+            lambda chunks, queries, limit: g.retrieve_batch(chunks, [queries], limit=limit, backend="bm25"),
+            chunks,
+            query_sets,
+        )
+        result = {
+            "chunks": len(chunks),
+            "characters": sum(chunk.size() for chunk in chunks),
+            "substring_ms_per_query": round(substring_seconds * 1000, 2),
+            "bm25_build_ms": round(bm25_build_seconds * 1000, 1),
+            "bm25_ms_per_query": round(bm25_seconds * 1000, 2),
+            "speedup_per_query": round(substring_seconds / bm25_seconds, 1) if bm25_seconds else None,
+        }
+
+        if g.HAS_SCIPY:
+            tfidf_build_seconds = time_build(g.tfidf_index_for, chunks)
+            started = time.perf_counter()
+            g.retrieve_batch(chunks, query_sets, limit=6, backend="tfidf")
+            tfidf_seconds = (time.perf_counter() - started) / len(query_sets)
+            result.update(
+                {
+                    "tfidf_build_ms": round(tfidf_build_seconds * 1000, 1),
+                    "tfidf_batch_ms_per_query": round(tfidf_seconds * 1000, 3),
+                    "tfidf_speedup_over_bm25": round(bm25_seconds / tfidf_seconds, 1) if tfidf_seconds else None,
+                }
+            )
+        results.append(result)
+
+    print(
+        json.dumps(
+            {
+                "queries": len(query_sets),
+                "median_speedup": statistics.median(r["speedup_per_query"] for r in results),
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,663 @@
+"""Local stand-in for the OpenAI Responses API and SendGrid mail endpoint.
+
+Serves schema-valid fixtures so that generate_and_publish.py can run end to
+end without network access:
+
+    python scripts/mock_api_server.py --port 8765 --latency 3
+
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 \
+    SENDGRID_BASE_URL=http://127.0.0.1:8765/v3 \
+    OPENAI_API_KEY=mock SENDGRID_API_KEY=mock \
+    python generate_and_publish.py
+
+Background responses move through queued and in_progress before completing
+after the configured latency, or are cancelled by POST
+/v1/responses/{id}/cancel.  Rate limits (429 with Retry-After), server
+errors (5xx) and dropped connections can be injected at configurable rates.
+Requests with "stream": true are answered as server-sent
+output_text deltas instead.  File uploads and the Batch API (/v1/files,
+/v1/batches) are supported for batches of Responses API requests.  Counters are available from GET /_mock/stats.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+CTA_HEADING = "Contact Our Immigration Lawyers In Switzerland"
+STREAM_DELTA_CHARS = 48
+CTA_STANDARD_CONTACT_SENTENCE = (
+    "To arrange an initial consultation meeting, contact Richmond Chambers Switzerland by telephone on "
+    "+41 21 588 07 70 or complete our enquiry form."
+)
+
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+CLASSIFIER_FIXTURE = {
+    "primary_audience": "global_individuals",
+    "article_type": "risk_analysis",
+    "search_intent": "informational_problem_solving",
+    "legal_complexity": "high",
+    "key_issues": [
+        "permit application timing",
+        "evidence of residence history",
+        "cantonal discretion",
+    ],
+    "distinctions_required": ["EU/EFTA and non-EU applicants"],
+    "source_needs": ["LEI / AIG", "OASA / VZAE"],
+    "style_profile": "risk_focused",
+    "recommended_structure_variant": "problem_solution",
+    "reader_flow_priority": "risk_first",
+}
+
+MEMO_ISSUE_FIXTURE = {
+    "issue": "Timing of the permit application",
+    "rule": "The competent cantonal authority assesses the application against the conditions in force.",
+    "legal_basis": "Article 34 LEI / AIG",
+    "authority_type": "statute",
+    "entitlement_or_discretion": "discretionary",
+    "reader_category": "Non-EU/EFTA applicants",
+    "exceptions": [],
+    "procedure_points": ["Applications are filed with the cantonal migration office."],
+    "cantonal_practice_points": [],
+    "reader_distinctions": ["EU/EFTA nationals follow a different framework."],
+    "evidence_needed": ["Residence history", "Permit records"],
+    "common_mistakes": ["Filing before the residence period is complete."],
+    "client_decision_points": ["Whether to apply now or wait."],
+    "practical_implications": ["Early planning reduces refusal risk."],
+    "source_reference_to_use_in_article": "Article 34 LEI / AIG",
+    "safe_public_formulation": "The authority may grant the permit where the conditions are met.",
+    "cautious_public_formulation": "Outcomes depend on the facts and the canton.",
+    "translation_or_source_caution": "",
+    "support": [
+        {
+            "source_type": "legal_authority",
+            "source_name": "mock legal authority pack",
+            "excerpt": "Article 34 LEI / AIG governs the settlement permit.",
+        }
+    ],
+    "confidence": "high",
+}
+
+LEGAL_MEMO_FIXTURE = {
+    "article_positioning": "Practical article on the timing of Swiss permit applications.",
+    "issues": [MEMO_ISSUE_FIXTURE],
+    "open_questions": [],
+}
+
+READER_JOURNEY_FIXTURE = {
+    "reader_core_question": "Does timing affect a Swiss permit application?",
+    "reader_context": "Applicants planning a Swiss permit application.",
+    "one_sentence_answer": "Timing depends on the permit route and the evidence available.",
+    "primary_misconception_or_risk": "Assuming an application can be filed at any time.",
+    "recommended_opening_angle": "Start from the timing risk.",
+    "recommended_section_sequence": [
+        {
+            "section_purpose": purpose,
+            "suggested_heading": heading,
+            "reader_question_answered": question,
+            "legal_points_to_cover": [],
+            "practical_points_to_cover": [],
+            "avoid_repetition_of": [],
+        }
+        for purpose, heading, question in [
+            ("answer", "Why Timing Shapes the Application", "Does timing matter?"),
+            ("framework", "How the Legal Framework Applies", "What does the law say?"),
+            ("risk", "Where Applicants Often Go Wrong", "What are the risks?"),
+            ("evidence", "Evidence That Supports the Route", "What proof helps?"),
+            ("next", "Deciding Whether to Apply Now", "What should I do?"),
+        ]
+    ],
+    "best_reader_helpful_elements": ["A short scenario", "A decision check"],
+    "points_to_state_once_only": ["Timing depends on the route."],
+    "section_order_rationale": "Answer first, then framework, risk, evidence and decision.",
+}
+
+DRAFT_BLOCKS = [
+    "**Whether a Swiss permit application succeeds often depends on timing, the permit route and the "
+    "evidence available when the file reaches the cantonal migration office.**",
+    "This article explains why timing matters for a Swiss permit application, who is most affected and "
+    "how applicants can check their position before filing. It is written for applicants and families "
+    "planning their next step in Switzerland.",
+    "**Why Timing Shapes the Application**",
+    "The answer depends on the route. An applicant who files before the relevant residence period is "
+    "complete, or before the evidence is ready, may face delay or refusal even where the underlying "
+    "route is available. Timing is therefore a planning question, not a formality.",
+    "**How the Legal Framework Applies**",
+    "Article 34 LEI / AIG sets the conditions for a settlement permit, while OASA / VZAE governs the "
+    "detailed procedure. The competent cantonal authority assesses whether those conditions are met, "
+    "and some elements involve discretion rather than an automatic entitlement.",
+    "**Where Applicants Often Go Wrong**",
+    "For example, an applicant may count years spent in Switzerland under a different permit category "
+    "without checking whether they qualify. Another common mistake is relying on a single document to "
+    "prove residence when the authority looks at the overall history.",
+    "**Deciding Whether to Apply Now**",
+    "Applicants should start by reconstructing their residence history, identifying any gaps and "
+    "checking whether the evidence supports the route. These documents are examples only; the evidence "
+    "required in any individual case depends on the facts, route, canton and procedural posture. Our "
+    "Swiss immigration lawyers can then advise whether to apply now, wait or take a different step.",
+    f"**{CTA_HEADING}**",
+    "At Richmond Chambers Switzerland, our specialist Swiss immigration lawyers would be pleased to review "
+    "your residence history, assess the timing of your application and advise on a strategy tailored to "
+    "your route and canton.",
+    CTA_STANDARD_CONTACT_SENTENCE,
+    "*This article summarises Swiss immigration law and guidance as at the date of writing. Individual "
+    "facts, evidence, cantonal handling and procedural posture can materially affect the outcome. It is "
+    "not legal advice.*",
+]
+
+DRAFT_FIXTURE = {
+    "blog_title": "When Does Timing Affect a Swiss Permit Application?",
+    "blog_content": "\n\n".join(DRAFT_BLOCKS),
+}
+
+SEO_FIXTURE = {
+    "seo_meta_title": "Swiss Permit Application Timing",
+    "seo_meta_description": "How timing, evidence and route choice affect a Swiss permit application.",
+    "suggested_slug": "swiss-permit-application-timing",
+    "primary_keyword": "swiss permit application",
+    "suggested_seo_keywords": [
+        "swiss permit timing",
+        "swiss residence permit evidence",
+        "swiss settlement permit",
+        "cantonal migration office",
+        "swiss permit refusal risk",
+        "swiss immigration lawyers",
+    ],
+}
+
+FIXTURES: dict[str, dict[str, Any]] = {
+    "blog_classifier": CLASSIFIER_FIXTURE,
+    "legal_memo": LEGAL_MEMO_FIXTURE,
+    "legal_memo_repair": {"issues": [{"index": 1, "issue": MEMO_ISSUE_FIXTURE}]},
+    "reader_journey_plan": READER_JOURNEY_FIXTURE,
+    "blog_draft": DRAFT_FIXTURE,
+    "blog_draft_patch": {"blog_title": None, "operations": []},
+    "blog_title_candidates": {
+        "titles": [
+            "Swiss Permit Applications: Overview",
+            "When Does Timing Affect a Swiss Permit Application?",
+            "How Timing Can Change the Outcome of a Swiss Permit Application",
+            "Should You Wait Before Applying for a Swiss Permit?",
+            "Swiss Permit Timing Rules",
+        ]
+    },
+    "blog_seo": SEO_FIXTURE,
+}
+
+
+def instance_from_schema(schema: dict[str, Any], name: str = "value") -> Any:
+    """Build a minimal instance of a strict JSON schema for schemas without a hand-written fixture."""
+    schema_type = schema.get("type")
+    if "enum" in schema:
+        return schema["enum"][0]
+    if schema_type == "object":
+        return {
+            key: instance_from_schema(value, key)
+            for key, value in schema.get("properties", {}).items()
+        }
+    if schema_type == "array":
+        count = max(1, int(schema.get("minItems", 1)))
+        return [instance_from_schema(schema.get("items", {}), name) for _ in range(count)]
+    if schema_type == "integer":
+        return int(schema.get("minimum", 0))
+    if schema_type == "number":
+        return float(schema.get("minimum", 0))
+    if schema_type == "boolean":
+        return False
+    return f"Mock {name.replace('_', ' ')}"
+
+
+def multipart_file_content(raw: bytes, content_type: str) -> bytes:
+    """Return the body of the "file" part of a multipart/form-data upload."""
+    boundary = content_type.partition("boundary=")[2].strip('"').encode("utf-8")
+    for part in raw.split(b"--" + boundary):
+        headers, _, body = part.partition(b"\r\n\r\n")
+        if b'name="file"' in headers:
+            return body[:-2] if body.endswith(b"\r\n") else body
+    return b""
+
+
+def fixture_for(text_format: dict[str, Any]) -> dict[str, Any]:
+    name = text_format.get("name", "")
+    if name in FIXTURES:
+        return FIXTURES[name]
+    return instance_from_schema(text_format.get("schema", {}))
+
+
+# ============================================================
+# Server
+# ============================================================
+
+@dataclass
+class MockConfig:
+    latency: float = 2.0
+    latency_jitter: float = 0.0
+    request_latency: float = 0.0
+    rate_limit_rate: float = 0.0
+    server_error_rate: float = 0.0
+    disconnect_rate: float = 0.0
+    retry_after: float = 1.0
+    seed: int | None = None
+
+
+@dataclass
+class MockState:
+    config: MockConfig
+    responses: dict[str, dict[str, Any]] = field(default_factory=dict)
+    files: dict[str, bytes] = field(default_factory=dict)
+    batches: dict[str, dict[str, Any]] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+    emails: list[dict[str, Any]] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    ids: Any = field(default_factory=itertools.count)
+    rng: random.Random = field(default_factory=random.Random)
+
+    def count(self, name: str) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "MockApiServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+    @property
+    def state(self) -> MockState:
+        return self.server.state
+
+    def send_json(self, status: int, payload: Any, headers: dict[str, str] | None = None) -> None:
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_json(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        return json.loads(raw) if raw else {}
+
+    def inject_fault(self) -> bool:
+        """Apply configured latency and faults; return True when the request has been answered."""
+        config = self.state.config
+        if config.request_latency:
+            time.sleep(config.request_latency)
+
+        roll = self.state.rng.random()
+        if roll < config.disconnect_rate:
+            self.state.count("injected_disconnects")
+            self.close_connection = True
+            return True
+        roll -= config.disconnect_rate
+        if roll < config.rate_limit_rate:
+            self.state.count("injected_429")
+            self.send_json(
+                429,
+                {"error": {"message": "Rate limit reached (mock)."}},
+                {"Retry-After": f"{config.retry_after:g}"},
+            )
+            return True
+        roll -= config.rate_limit_rate
+        if roll < config.server_error_rate:
+            self.state.count("injected_5xx")
+            self.send_json(503, {"error": {"message": "Service unavailable (mock)."}})
+            return True
+        return False
+
+    def do_GET(self) -> None:
+        if self.path == "/_mock/stats":
+            with self.state.lock:
+                payload = {"counters": dict(self.state.counters), "emails": len(self.state.emails)}
+            self.send_json(200, payload)
+            return
+
+        if self.path.startswith("/v1/batches/"):
+            self.state.count("batch_polls")
+            if self.inject_fault():
+                return
+            self.send_batch_status(self.path.rsplit("/", 1)[-1])
+            return
+
+        if self.path.startswith("/v1/files/") and self.path.endswith("/content"):
+            file_id = self.path.split("/")[3]
+            with self.state.lock:
+                content = self.state.files.get(file_id)
+            if content is None:
+                self.send_json(404, {"error": {"message": f"No file {file_id}"}})
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/jsonl")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+            return
+
+        if self.path.startswith("/v1/responses/"):
+            self.state.count("responses_polls")
+            if self.inject_fault():
+                return
+            response_id = self.path.rsplit("/", 1)[-1]
+            self.send_response_status(response_id)
+            return
+
+        self.send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+    def do_POST(self) -> None:
+        if self.path == "/v1/responses":
+            self.state.count("responses_created")
+            payload = self.read_json()
+            if self.inject_fault():
+                return
+            self.create_response(payload)
+            return
+
+        if self.path.startswith("/v1/responses/") and self.path.endswith("/cancel"):
+            self.state.count("responses_cancelled")
+            self.read_json()
+            response_id = self.path.split("/")[3]
+            with self.state.lock:
+                record = self.state.responses.get(response_id)
+                if record is not None:
+                    record["cancelled"] = True
+            self.send_response_status(response_id)
+            return
+
+        if self.path == "/v1/files":
+            self.state.count("files_uploaded")
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length)
+            file_id = f"file_mock_{next(self.state.ids)}"
+            with self.state.lock:
+                self.state.files[file_id] = multipart_file_content(raw, self.headers.get("Content-Type", ""))
+            self.send_json(200, {"id": file_id, "object": "file", "purpose": "batch"})
+            return
+
+        if self.path == "/v1/batches":
+            self.state.count("batches_created")
+            payload = self.read_json()
+            if self.inject_fault():
+                return
+            self.create_batch(payload)
+            return
+
+        if self.path == "/v3/mail/send":
+            self.state.count("emails")
+            payload = self.read_json()
+            if self.inject_fault():
+                return
+            with self.state.lock:
+                self.state.emails.append(payload)
+            self.send_json(202, None)
+            return
+
+        self.send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+    def create_response(self, payload: dict[str, Any]) -> None:
+        config = self.state.config
+        text_format = payload.get("text", {}).get("format", {})
+        output = fixture_for(text_format)
+        output_text = json.dumps(output, ensure_ascii=False)
+        latency = max(0.0, config.latency + self.state.rng.uniform(-config.latency_jitter, config.latency_jitter))
+        now = time.time()
+        record = {
+            "id": f"resp_mock_{next(self.state.ids)}",
+            "object": "response",
+            "created_at": now,
+            "started_at": now + min(0.5, latency / 4),
+            "completes_at": now + latency,
+            "model": payload.get("model", ""),
+            "output_text": output_text,
+            "usage": {
+                "input_tokens": estimate_tokens(payload.get("instructions", "") + payload.get("input", "")),
+                "input_tokens_details": {"cached_tokens": 0},
+                "output_tokens": estimate_tokens(output_text),
+                "output_tokens_details": {"reasoning_tokens": 0},
+            },
+        }
+        with self.state.lock:
+            self.state.responses[record["id"]] = record
+
+        if payload.get("stream"):
+            self.stream_response(record, latency)
+            return
+
+        if payload.get("background"):
+            self.send_response_status(record["id"])
+            return
+
+        time.sleep(latency)
+        self.send_response_status(record["id"])
+
+    def create_batch(self, payload: dict[str, Any]) -> None:
+        """Answer every request in the input file now; the batch reports completion after the latency."""
+        with self.state.lock:
+            content = self.state.files.get(payload.get("input_file_id", ""))
+        if content is None:
+            self.send_json(400, {"error": {"message": "Unknown input_file_id"}})
+            return
+
+        output_lines: list[str] = []
+        for line in content.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            body = request.get("body", {})
+            output_text = json.dumps(fixture_for(body.get("text", {}).get("format", {})), ensure_ascii=False)
+            output_lines.append(
+                json.dumps(
+                    {
+                        "id": f"batch_req_mock_{next(self.state.ids)}",
+                        "custom_id": request.get("custom_id"),
+                        "response": {
+                            "status_code": 200,
+                            "body": {
+                                "id": f"resp_mock_{next(self.state.ids)}",
+                                "object": "response",
+                                "status": "completed",
+                                "output_text": output_text,
+                            },
+                        },
+                        "error": None,
+                    },
+                    ensure_ascii=False,
+                )
+            )
+
+        now = time.time()
+        output_file_id = f"file_mock_{next(self.state.ids)}"
+        batch = {
+            "id": f"batch_mock_{next(self.state.ids)}",
+            "object": "batch",
+            "endpoint": payload.get("endpoint"),
+            "input_file_id": payload.get("input_file_id"),
+            "created_at": int(now),
+            "request_total": len(output_lines),
+            "completes_at": now + self.state.config.latency,
+            "output_file_id": output_file_id,
+        }
+        with self.state.lock:
+            self.state.files[output_file_id] = ("\n".join(output_lines) + "\n").encode("utf-8")
+            self.state.batches[batch["id"]] = batch
+        self.send_batch_status(batch["id"])
+
+    def send_batch_status(self, batch_id: str) -> None:
+        with self.state.lock:
+            batch = self.state.batches.get(batch_id)
+        if batch is None:
+            self.send_json(404, {"error": {"message": f"No batch {batch_id}"}})
+            return
+
+        done = time.time() >= batch["completes_at"]
+        total = batch["request_total"]
+        body = {key: batch[key] for key in ("id", "object", "endpoint", "input_file_id", "created_at")}
+        body.update(
+            status="completed" if done else "in_progress",
+            output_file_id=batch["output_file_id"] if done else None,
+            error_file_id=None,
+            request_counts={"total": total, "completed": total if done else 0, "failed": 0},
+        )
+        self.send_json(200, body)
+
+    def write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def write_event(self, event_type: str, data: dict[str, Any]) -> None:
+        payload = json.dumps({"type": event_type, **data}, ensure_ascii=False)
+        self.write_chunk(f"event: {event_type}\ndata: {payload}\n\n".encode("utf-8"))
+
+    def stream_response(self, record: dict[str, Any], latency: float) -> None:
+        """Send the fixture as server-sent output_text deltas spread over the configured latency."""
+        self.state.count("responses_streamed")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        output_text = record["output_text"]
+        pieces = [
+            output_text[start : start + STREAM_DELTA_CHARS]
+            for start in range(0, len(output_text), STREAM_DELTA_CHARS)
+        ]
+        summary = {"id": record["id"], "object": "response", "created_at": int(record["created_at"])}
+        try:
+            self.write_event("response.created", {"response": {**summary, "status": "in_progress"}})
+            for piece in pieces:
+                time.sleep(latency / len(pieces))
+                self.write_event("response.output_text.delta", {"delta": piece})
+            completed = {
+                **summary,
+                "status": "completed",
+                "completed_at": int(time.time()),
+                "output_text": output_text,
+                "usage": record["usage"],
+            }
+            self.write_event("response.completed", {"response": completed})
+            self.write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            # The client cancelled the stream.
+            self.state.count("streams_cancelled")
+            self.close_connection = True
+
+    def send_response_status(self, response_id: str) -> None:
+        with self.state.lock:
+            record = self.state.responses.get(response_id)
+        if record is None:
+            self.send_json(404, {"error": {"message": f"No response {response_id}"}})
+            return
+
+        now = time.time()
+        body: dict[str, Any] = {
+            "id": record["id"],
+            "object": "response",
+            "created_at": int(record["created_at"]),
+            "model": record["model"],
+        }
+        if record.get("cancelled"):
+            body["status"] = "cancelled"
+        elif now < record["started_at"]:
+            body["status"] = "queued"
+        elif now < record["completes_at"]:
+            body["status"] = "in_progress"
+        else:
+            body.update(
+                status="completed",
+                completed_at=int(record["completes_at"]),
+                output_text=record["output_text"],
+                output=[
+                    {
+                        "type": "message",
+                        "content": [{"type": "output_text", "text": record["output_text"]}],
+                    }
+                ],
+                usage=record["usage"],
+            )
+        self.send_json(200, body)
+
+
+class MockApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: MockConfig) -> None:
+        super().__init__(address, MockApiHandler)
+        self.state = MockState(config=config, rng=random.Random(config.seed))
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_mock_server(config: MockConfig, host: str = "127.0.0.1", port: int = 0) -> MockApiServer:
+    """Start the mock server on a background thread and return it; call shutdown() when done."""
+    server = MockApiServer((host, port), config)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency", type=float, default=2.0, help="Seconds a response takes to complete.")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Uniform +/- jitter on --latency.")
+    parser.add_argument("--request-latency", type=float, default=0.0, help="Extra delay on every request.")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered 429.")
+    parser.add_argument("--server-error-rate", type=float, default=0.0, help="Fraction of requests answered 503.")
+    parser.add_argument("--disconnect-rate", type=float, default=0.0, help="Fraction of requests dropped.")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s.")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for fault injection.")
+
+
+def config_from_args(args: argparse.Namespace) -> MockConfig:
+    return MockConfig(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        request_latency=args.request_latency,
+        rate_limit_rate=args.rate_limit_rate,
+        server_error_rate=args.server_error_rate,
+        disconnect_rate=args.disconnect_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve mock OpenAI Responses and SendGrid endpoints.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = MockApiServer((args.host, args.port), config_from_args(args))
+    print(f"Mock API listening on {server.base_url}")
+    print(f"  OPENAI_BASE_URL={server.base_url}/v1")
+    print(f"  SENDGRID_BASE_URL={server.base_url}/v3")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import sys
+
+import pytest
+
+# generate_and_publish parses the command line at import time.
+sys.argv = sys.argv[:1]
+
+import generate_and_publish as g  # noqa: E402
+
+CTA = f"**{g.CTA_HEADING}**"
+BODY = "Swiss permit renewals depend on the canton and on timing. " * 3
+LAWYER_VALUE = (
+    f"Our specialist Swiss immigration lawyers at {g.CTA_NAME} can assess your application strategy, "
+    "evidence and timing before you file with the cantonal office."
+)
+
+
+def draft(*blocks: str) -> dict[str, str]:
+    return {"blog_title": "When Does Timing Affect a Swiss Permit Renewal?", "blog_content": "\n\n".join(blocks)}
+
+
+def test_apply_draft_patch_indexes_refer_to_the_unpatched_blocks() -> None:
+    patch = {
+        "operations": [
+            {"op": "delete", "index": 0},
+            {"op": "insert_after", "index": 0, "blocks": ["new after a"]},
+            {"op": "replace", "index": 2, "blocks": ["c1", "c2"]},
+            {"op": "insert_after", "index": -1, "blocks": ["lead"]},
+        ]
+    }
+
+    patched = g.apply_draft_patch(draft("a", "b", "c"), patch)
+
+    assert patched["blog_content"].split("\n\n") == ["lead", "new after a", "b", "c1", "c2"]
+    assert patched["blog_title"] == "When Does Timing Affect a Swiss Permit Renewal?"
+
+
+def test_apply_draft_patch_replaces_the_title_when_given() -> None:
+    patched = g.apply_draft_patch(draft("a"), {"blog_title": "New Title", "operations": []})
+
+    assert patched["blog_title"] == "New Title"
+    assert patched["blog_content"] == "a"
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        {"op": "replace", "index": 3, "blocks": ["x"]},
+        {"op": "delete", "index": -1},
+        {"op": "replace", "index": "1", "blocks": ["x"]},
+        {"op": "move", "index": 0},
+    ],
+)
+def test_apply_draft_patch_rejects_invalid_operations(operation: dict) -> None:
+    with pytest.raises(ValueError):
+        g.apply_draft_patch(draft("a", "b", "c"), {"operations": [operation]})
+
+
+def test_repair_draft_locally_moves_the_cta_last_and_fixes_the_disclaimer() -> None:
+    original = draft(BODY, "**Background**", BODY, CTA, LAWYER_VALUE, g.CTA_STANDARD_CONTACT_SENTENCE, "**Timing**", BODY)
+    assert g.validate_public_draft(original)
+
+    repaired, errors = g.repair_draft_locally(original, record_stats=False)
+
+    assert errors == []
+    blocks = g.split_blocks(repaired["blog_content"])
+    assert blocks.index(CTA) == len(blocks) - 4
+    assert g.is_disclaimer_block(blocks[-1])
+
+
+def test_repair_draft_locally_leaves_a_missing_cta_for_the_model() -> None:
+    original = draft(BODY, "**Background**", BODY, "*This article is not legal advice.*")
+
+    repaired, errors = g.repair_draft_locally(original, record_stats=False)
+
+    assert CTA not in repaired["blog_content"]
+    assert any("CTA" in error for error in errors)
+
+
+def test_repair_draft_locally_never_adds_errors() -> None:
+    original = draft(BODY, "**Background**")
+    errors_before = g.validate_public_draft(original)
+
+    _, errors = g.repair_draft_locally(original, record_stats=False)
+
+    assert len(errors) <= len(errors_before)
+
+
+def test_repair_draft_locally_records_stats_only_when_asked() -> None:
+    original = draft(BODY, CTA, LAWYER_VALUE, g.CTA_STANDARD_CONTACT_SENTENCE, "Not a disclaimer.")
+    checked = g.LOCAL_REPAIR.stats.drafts_checked
+
+    g.repair_draft_locally(original, record_stats=False)
+    assert g.LOCAL_REPAIR.stats.drafts_checked == checked
+
+    g.repair_draft_locally(original)
+    assert g.LOCAL_REPAIR.stats.drafts_checked == checked + 1
@@ -0,0 +1,52 @@
+import sys
+
+# generate_and_publish parses the command line at import time.
+sys.argv = sys.argv[:1]
+
+import generate_and_publish as g  # noqa: E402
+
+
+def test_split_bounded_keeps_parts_within_the_limit() -> None:
+    text = "First paragraph here.\n\nSecond paragraph.\n\n" + "word " * 60
+
+    parts = g.split_bounded(text, 50)
+
+    assert all(len(part) <= 50 for part in parts)
+    assert parts[0].startswith("First paragraph here.\n\nSecond paragraph.")
+    assert " ".join(" ".join(parts).split()) == " ".join(text.split())
+
+
+def test_split_bounded_breaks_between_paragraphs() -> None:
+    assert g.split_bounded("one two\n\nthree four\n\nfive six", 20) == ["one two\n\nthree four", "five six"]
+
+
+def test_split_bounded_cuts_at_whitespace() -> None:
+    parts = g.split_bounded("alpha beta gamma delta epsilon", 12)
+
+    assert parts == ["alpha beta", "gamma delta", "epsilon"]
+
+
+def test_markdown_sections_follow_the_heading_path() -> None:
+    text = "Preamble\n\n# Permits\nintro\n## Renewal\nrenewal text\n# Empty\n\n# Fees\nfee text"
+
+    assert g.markdown_sections(text) == [
+        ("", "Preamble"),
+        ("Permits", "# Permits\nintro"),
+        ("Permits > Renewal", "## Renewal\nrenewal text"),
+        ("Fees", "# Fees\nfee text"),
+    ]
+
+
+def test_markdown_sections_ignore_headings_in_code_fences() -> None:
+    text = "# Example\n```\n# not a heading\n```"
+
+    assert g.markdown_sections(text) == [("Example", text)]
+
+
+def test_pdf_page_sections_group_pages_up_to_the_limit() -> None:
+    text = "[page 1] aaaa\n[page 2] bbbb\n[page 3] " + "c" * 30
+
+    assert g.pdf_page_sections(text, 30) == [
+        ("pages 1-2", "[page 1] aaaa\n[page 2] bbbb"),
+        ("page 3", "[page 3] " + "c" * 30),
+    ]
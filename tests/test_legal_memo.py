@@ -0,0 +1,49 @@
+import sys
+
+# generate_and_publish parses the command line at import time.
+sys.argv = sys.argv[:1]
+
+import generate_and_publish as g  # noqa: E402
+
+
+def issue(name: str, confidence: str = "high") -> dict:
+    return {"issue": name, "confidence": confidence, "support": ["Art. 33 AIG"], "authority_type": "statute"}
+
+
+def test_merge_memo_repair_splices_issues_back_by_index() -> None:
+    memo = {"article_positioning": "p", "issues": [issue("a"), issue("b", "low"), issue("c")]}
+    failing = g.failing_memo_issues(memo)
+    assert list(failing) == [2]
+
+    repair = {"issues": [{"index": 2, "issue": issue("b fixed")}, {"index": 3, "issue": issue("ignored")}]}
+
+    merged = g.merge_memo_repair(memo, repair, failing)
+
+    assert merged == {**memo, "issues": [issue("a"), issue("b fixed"), issue("c")]}
+    assert memo["issues"][1] == issue("b", "low")
+
+
+def test_merge_memo_repair_fails_when_an_issue_comes_back_null() -> None:
+    memo = {"issues": [issue("a", "low"), issue("b", "low")]}
+    failing = g.failing_memo_issues(memo)
+
+    repair = {"issues": [{"index": 1, "issue": issue("a fixed")}, {"index": 2, "issue": None}]}
+
+    assert g.merge_memo_repair(memo, repair, failing) is None
+
+
+def test_merge_memo_repair_fails_when_an_issue_is_missing() -> None:
+    memo = {"issues": [issue("a", "low"), issue("b", "low")]}
+    failing = g.failing_memo_issues(memo)
+
+    assert g.merge_memo_repair(memo, {"issues": [{"index": 1, "issue": issue("a fixed")}]}, failing) is None
+
+
+def test_merge_memo_repair_keeps_the_first_entry_for_an_index() -> None:
+    memo = {"issues": [issue("a", "low")]}
+    repair = {"issues": [{"index": 1, "issue": issue("first")}, {"index": 1, "issue": issue("second")}]}
+
+    merged = g.merge_memo_repair(memo, repair, g.failing_memo_issues(memo))
+
+    assert merged is not None
+    assert merged["issues"] == [issue("first")]
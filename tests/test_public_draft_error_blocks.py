@@ -0,0 +1,40 @@
+import sys
+
+# generate_and_publish parses the command line at import time.
+sys.argv = sys.argv[:1]
+
+import generate_and_publish as g  # noqa: E402
+
+
+def test_empty_heading_containing_colon_is_located() -> None:
+    heading = "**Residence Permits: What Changes**"
+    blocks = ["Intro paragraph.", heading, "**Next Steps**", "Body paragraph."]
+
+    errors = [error for error in g.find_empty_heading_errors(blocks) if heading in error]
+    assert errors
+    for error in errors:
+        assert g.public_draft_error_blocks(blocks, error) == [1]
+
+
+def test_empty_heading_containing_colon_at_end_is_located() -> None:
+    heading = "**Residence Permits: What Changes**"
+    blocks = ["Intro paragraph.", "Body paragraph.", heading]
+
+    (error,) = g.find_empty_heading_errors(blocks)
+    assert g.public_draft_error_blocks(blocks, error) == [2]
+
+
+def test_error_located_in_no_block_falls_back_to_full_repair() -> None:
+    draft = {"blog_content": "Intro paragraph.\n\n**Background**\n\nBody paragraph."}
+    errors = ["Too many practical/evidence/strategy sections (4). Merge them."]
+
+    assert g.locate_draft_errors(draft, errors, g.public_draft_error_blocks) is None
+
+
+def test_title_error_is_located_in_no_block() -> None:
+    draft = {"blog_content": "Intro paragraph.\n\n**Background**\n\nBody paragraph."}
+    errors = ["blog_title is too long."]
+
+    assert g.locate_draft_errors(draft, errors, g.public_draft_error_blocks) == [
+        {"error": errors[0], "blocks": []}
+    ]
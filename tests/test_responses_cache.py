@@ -0,0 +1,93 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# generate_and_publish parses the command line at import time.
+sys.argv = sys.argv[:1]
+
+import generate_and_publish as g  # noqa: E402
+
+KEY = "ab" + "0" * 62
+
+
+def cache(directory: Path, mode: str = "write", ttl_seconds: float = 3600, max_bytes: int = 1 << 20) -> g.ResponsesCache:
+    return g.ResponsesCache(directory, mode=mode, max_bytes=max_bytes, ttl_seconds=ttl_seconds)
+
+
+@pytest.mark.parametrize(
+    ("mode", "reads", "writes"),
+    [("off", False, False), ("read", True, False), ("write", True, True), ("refresh", False, True)],
+)
+def test_modes_enable_reads_and_writes(tmp_path: Path, mode: str, reads: bool, writes: bool) -> None:
+    responses = cache(tmp_path, mode)
+
+    assert (responses.reads_enabled, responses.writes_enabled) == (reads, writes)
+
+
+def test_put_then_get_round_trips(tmp_path: Path) -> None:
+    responses = cache(tmp_path)
+
+    responses.put(KEY, {"answer": 42}, stage="classifier")
+
+    assert responses.get(KEY) == {"answer": 42}
+    assert responses.report()["hits"] == 1
+
+
+def test_entries_expire_after_the_ttl(tmp_path: Path) -> None:
+    responses = cache(tmp_path, ttl_seconds=60)
+    responses.put(KEY, {"answer": 42}, stage="classifier")
+    path = tmp_path / KEY[:2] / f"{KEY}.json"
+    entry = json.loads(path.read_text(encoding="utf-8"))
+    path.write_text(json.dumps({**entry, "stored_at": time.time() - 120}), encoding="utf-8")
+
+    assert responses.get(KEY) is None
+    assert not path.exists()
+    assert responses.report()["expired"] == 1
+
+
+def test_entries_without_a_ttl_never_expire(tmp_path: Path) -> None:
+    responses = cache(tmp_path, ttl_seconds=float("inf"))
+    responses.put(KEY, {"answer": 42}, stage="classifier")
+    path = tmp_path / KEY[:2] / f"{KEY}.json"
+    entry = json.loads(path.read_text(encoding="utf-8"))
+    path.write_text(json.dumps({**entry, "stored_at": 0}), encoding="utf-8")
+
+    assert responses.get(KEY) == {"answer": 42}
+
+
+def test_discard_drops_a_rejected_entry(tmp_path: Path) -> None:
+    responses = cache(tmp_path)
+    responses.put(KEY, {"answer": 42}, stage="classifier")
+
+    responses.discard(KEY)
+
+    assert responses.get(KEY) is None
+    assert responses.report()["rejected"] == 1
+
+
+def test_failed_write_is_counted_not_raised(tmp_path: Path) -> None:
+    blocker = tmp_path / "blocker"
+    blocker.write_text("not a directory", encoding="utf-8")
+    responses = cache(blocker / "responses")
+
+    responses.put(KEY, {"answer": 42}, stage="classifier")
+
+    assert responses.report()["write_errors"] == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    responses = cache(tmp_path, max_bytes=250)
+    keys = [f"{index:02d}" + "0" * 62 for index in range(3)]
+    for age, key in enumerate(keys):
+        responses.put(key, {"text": "x" * 60}, stage="draft")
+        path = tmp_path / key[:2] / f"{key}.json"
+        os.utime(path, (time.time() - 100 + age, time.time() - 100 + age))
+
+    responses.put("99" + "0" * 62, {"text": "x" * 60}, stage="draft")
+
+    assert responses.get(keys[0]) is None
+    assert responses.report()["evictions"] >= 1
@@ -0,0 +1,113 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# generate_and_publish parses the command line at import time.
+sys.argv = sys.argv[:1]
+
+import generate_and_publish as g  # noqa: E402
+
+
+def chunk(source_kind: str, text: str, name: str = "source.md") -> g.KnowledgeChunk:
+    return g.KnowledgeChunk(name, source_kind, text)
+
+
+def test_bm25_ranks_by_term_frequency_and_rarity() -> None:
+    chunks = [
+        chunk("website_editorial", "renewal renewal permit", "a.md"),
+        chunk("website_editorial", "permit application fees", "b.md"),
+        chunk("website_editorial", "family reunification rules", "c.md"),
+    ]
+
+    ranked = g.retrieve_batch(chunks, [["renewal permit"]], limit=3, backend="bm25")[0]
+
+    assert [item.source_name for item in ranked] == ["a.md", "b.md"]
+
+
+def test_source_kind_boosts_outrank_a_better_text_match() -> None:
+    editorial = chunk("website_editorial", "renewal renewal renewal deadline", "editorial.md")
+    authority = chunk("legal_authority", "renewal", "authority.md")
+    note = chunk("internal_legal_note", "renewal", "note.md")
+
+    ranked = g.retrieve_batch([editorial, authority, note], [["renewal deadline"]], limit=3, backend="bm25")[0]
+
+    assert ranked == [authority, note, editorial]
+
+
+def test_allowed_source_kinds_filter_before_boosts() -> None:
+    editorial = chunk("website_editorial", "renewal deadline", "editorial.md")
+    authority = chunk("legal_authority", "renewal deadline", "authority.md")
+
+    ranked = g.retrieve_batch(
+        [editorial, authority],
+        [["renewal"]],
+        allowed_source_kinds={"website_editorial"},
+        backend="bm25",
+    )[0]
+
+    assert ranked == [editorial]
+
+
+def test_retrieve_batch_returns_one_ranking_per_query_set() -> None:
+    chunks = [chunk("website_editorial", "renewal", "a.md"), chunk("website_editorial", "citizenship", "b.md")]
+
+    ranked = g.retrieve_batch(chunks, [["renewal"], ["citizenship"], []], backend="bm25")
+
+    assert [[item.source_name for item in items] for items in ranked] == [["a.md"], ["b.md"], []]
+
+
+@pytest.fixture
+def knowledge_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[tuple[Path, str]]:
+    folders = [
+        (tmp_path / "legal_authorities", "legal_authority"),
+        (tmp_path / "internal_legal_notes", "internal_legal_note"),
+        (tmp_path / "website_editorial", "website_editorial"),
+    ]
+    texts = {
+        "legal_authorities/aig.md": "# Art. 33\nResidence permit renewal requires continued purpose.\n"
+        "# Art. 34\nSettlement permit after ten years of residence.",
+        "internal_legal_notes/renewals.md": "# Renewals\nCantonal offices check renewal timing and evidence.",
+        "website_editorial/blog.md": "# Moving to Switzerland\nPermit types, fees and family reunification.",
+    }
+    for name, text in texts.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    monkeypatch.setattr(g, "SCRIPT_DIR", tmp_path)
+    monkeypatch.setattr(g, "KNOWLEDGE_CORPUS_FOLDERS", folders)
+    return folders
+
+
+@pytest.mark.parametrize(
+    "backend",
+    ["bm25", pytest.param("tfidf", marks=pytest.mark.skipif(not g.HAS_SCIPY, reason="needs numpy and scipy"))],
+)
+def test_corpus_and_in_memory_retrieval_agree(
+    knowledge_tree: list[tuple[Path, str]], tmp_path: Path, backend: str
+) -> None:
+    corpus_path = tmp_path / "corpus.bin"
+    g.build_knowledge_corpus(corpus_path)
+    corpus = g.KnowledgeCorpus.open_if_current(corpus_path)
+    assert corpus is not None
+
+    in_memory = [
+        chunk for folder, source_kind in knowledge_tree for chunk in g.load_chunks_from_folder(folder, source_kind)
+    ]
+    queries = [["permit renewal timing"], ["settlement residence"], ["family fees"]]
+
+    def described(ranked: list[list[g.KnowledgeChunk]]) -> list[list[tuple[str, str, str]]]:
+        return [[(item.source_name, item.section, item.text) for item in items] for items in ranked]
+
+    assert described(g.retrieve_batch(corpus.chunks, queries, backend=backend)) == described(
+        g.retrieve_batch(in_memory, queries, backend=backend)
+    )
+
+
+def test_corpus_is_stale_when_a_knowledge_file_changes(knowledge_tree: list[tuple[Path, str]], tmp_path: Path) -> None:
+    corpus_path = tmp_path / "corpus.bin"
+    g.build_knowledge_corpus(corpus_path)
+
+    (tmp_path / "website_editorial" / "blog.md").write_text("# Changed\nNew editorial text.", encoding="utf-8")
+
+    assert g.KnowledgeCorpus.open_if_current(corpus_path) is None
@@ -0,0 +1,107 @@
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+# generate_and_publish parses the command line at import time.
+sys.argv = sys.argv[:1]
+
+import generate_and_publish as g  # noqa: E402
+
+URL = "https://api.example.test/v1/responses"
+
+
+def policy(**overrides: float) -> g.RetryPolicy:
+    settings = {
+        "max_attempts": 3,
+        "base_delay": 0.0,
+        "max_delay": 0.0,
+        "max_hint_delay": 0.05,
+        "budget_seconds": 10.0,
+        "failure_threshold": 2,
+        "cooldown_seconds": 0.05,
+        **overrides,
+    }
+    return g.RetryPolicy(**settings)
+
+
+def test_parse_retry_hint_prefers_milliseconds() -> None:
+    assert g.parse_retry_hint({"retry-after-ms": "250", "retry-after": "9"}) == 0.25
+
+
+def test_parse_retry_hint_reads_seconds_and_http_dates() -> None:
+    assert g.parse_retry_hint({"retry-after": "3"}) == 3.0
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < g.parse_retry_hint({"retry-after": format_datetime(retry_at, usegmt=True)}) <= 30
+
+
+def test_parse_retry_hint_ignores_missing_or_malformed_headers() -> None:
+    assert g.parse_retry_hint({}) is None
+    assert g.parse_retry_hint({"retry-after": "soon"}) is None
+
+
+def test_parse_rate_limit_reset_takes_the_longest_wait() -> None:
+    headers = {"x-ratelimit-reset-requests": "20ms", "x-ratelimit-reset-tokens": "1m30s"}
+
+    assert g.parse_rate_limit_reset(headers) == 90.0
+
+
+def test_circuit_opens_after_consecutive_failures() -> None:
+    retry = policy()
+    retry.record_failure(URL, "503")
+    retry.record_failure(URL, "503")
+
+    with pytest.raises(g.CircuitOpenError):
+        retry.before_request(URL)
+    assert retry.report()["open_circuits"] == ["api.example.test"]
+
+
+def test_half_open_circuit_admits_a_single_trial_call() -> None:
+    retry = policy()
+    retry.record_failure(URL, "503")
+    retry.record_failure(URL, "503")
+    time.sleep(0.06)
+
+    retry.before_request(URL)
+    with pytest.raises(g.CircuitOpenError):
+        retry.before_request(URL)
+
+    retry.record_success(URL)
+    retry.before_request(URL)
+    assert retry.report()["open_circuits"] == []
+
+
+def test_failed_trial_call_reopens_the_circuit() -> None:
+    retry = policy()
+    retry.record_failure(URL, "503")
+    retry.record_failure(URL, "503")
+    time.sleep(0.06)
+
+    retry.before_request(URL)
+    retry.record_failure(URL, "503")
+
+    with pytest.raises(g.CircuitOpenError):
+        retry.before_request(URL)
+    assert retry.report()["circuit_opened"] == 2
+
+
+def test_backoff_caps_server_hints() -> None:
+    retry = policy()
+
+    started = time.monotonic()
+    assert retry.backoff(URL, 1, {"retry-after": "120"})
+
+    assert time.monotonic() - started < 1
+    report = retry.report()
+    assert report["server_hints_honoured"] == 1
+    assert report["server_hints_clamped"] == 1
+    assert report["retry_sleep_seconds"] == 0.05
+
+
+def test_backoff_stops_when_the_budget_is_spent() -> None:
+    retry = policy(max_hint_delay=60.0, budget_seconds=1.0)
+
+    assert not retry.backoff(URL, 1, {"retry-after": "5"})
+    assert retry.report()["budget_exhausted"] == 1